@@ -0,0 +1,1151 @@
+import datetime
+import heapq
+import itertools
+import json
+import multiprocessing
+import os
+import random
+import time
+
+import numpy as np
+import pandas as pd
+
+from avaliacao import AvaliadorLote, AvaliadorParalelo, CacheFitness
+from carregador import CarregadorDados
+from checkpoint import Checkpoint
+from escalonador import Escalonador
+from problema import ProblemaCompilado
+
+# Cache em disco dos dados de entrada já validados e convertidos (ver CarregadorDados)
+DIRETORIO_CACHE = ".cache/dados"
+
+
+class Utils:
+    """
+    Classe utilitária para conversão de datas.
+    """
+
+    @staticmethod
+    def date_to_int(date_str: str, ref_date: datetime.date) -> int:
+        """
+        Converte uma string de data (YYYY-MM-DD) para um inteiro que representa
+        a distância (em dias) em relação a uma data de referência.
+
+        :param date_str: Data no formato 'YYYY-MM-DD'.
+        :param ref_date: Data de referência para o cálculo.
+        :return: Número de dias entre a data especificada e a data de referência.
+        """
+        ano, mes, dia = map(int, date_str.split("-"))
+        d = datetime.date(ano, mes, dia)
+        delta = d - ref_date
+        return delta.days
+
+    @staticmethod
+    def int_to_date(days: int, ref_date: datetime.date) -> str:
+        """
+        Converte um inteiro (dias) em string de data (YYYY-MM-DD),
+        adicionando 'days' dias à data de referência.
+
+        :param days: Número de dias a adicionar.
+        :param ref_date: Data de referência.
+        :return: Data no formato 'YYYY-MM-DD' resultante.
+        """
+        target_date = ref_date + datetime.timedelta(days=days)
+        return target_date.strftime("%d/%m/%Y")
+
+
+class DataManager:
+    """
+    Classe responsável por ler dados de arquivos JSON e organizar
+    as informações de colaboradores e projetos.
+    """
+
+    @staticmethod
+    def read_json_from_file(file_path: str) -> dict:
+        """
+        Lê um arquivo JSON e retorna seu conteúdo como dicionário ou lista.
+
+        :param file_path: Caminho do arquivo JSON.
+        :return: Dados carregados do arquivo JSON.
+        """
+        with open(file_path, "r") as f:
+            data = json.load(f)
+        return data
+
+    def gerar_dados(
+            self,
+            ref_date: datetime.date,
+            caminho_colaboradores: str = "dados/colaboradores.json",
+            caminho_projetos: str = "dados/projetos.json",
+            diretorio_cache: str = DIRETORIO_CACHE
+    ):
+        """
+        Lê as informações de colaboradores e projetos de arquivos JSON, JSON Lines ou CSV,
+        validando o esquema e convertendo as ausências em dias (ver CarregadorDados).
+
+        :param ref_date: Data de referência (dia 0) usada para converter as ausências em dias.
+        :param caminho_colaboradores: Caminho do arquivo de colaboradores.
+        :param caminho_projetos: Caminho do arquivo de projetos.
+        :param diretorio_cache: Diretório do cache em disco dos dados já convertidos,
+            indexado pelo hash dos arquivos (None desativa o cache).
+        :return: Tupla (colaboradores, projetos).
+        """
+        return CarregadorDados.carregar(
+            caminho_colaboradores, caminho_projetos, ref_date, diretorio_cache
+        )
+
+    def montar_tarefas_globais(self, colaboradores: list, projetos: list):
+        """
+        Monta uma lista global de tarefas, organizando as etapas de cada projeto.
+
+        :param colaboradores: Lista de colaboradores.
+        :param projetos: Lista de projetos, cada um contendo etapas.
+        :return: Tupla (tarefas_globais, colaboradores).
+        """
+        tarefas_globais = []
+        for proj in projetos:
+            etapas_ordenadas = sorted(proj["etapas"], key=lambda e: e["id"])
+            for etapa in etapas_ordenadas:
+                tarefas_globais.append({
+                    "projeto": proj["nome"],
+                    "task_id": etapa["id"],
+                    "nome": etapa["nome"],
+                    "duracao_dias": etapa["duracao_dias"],
+                    "habilidades_necessarias": set(etapa["habilidades_necessarias"]),
+                    "cargo_necessario": etapa["cargo_necessario"],
+                })
+        return tarefas_globais, colaboradores
+
+    @staticmethod
+    def montar_cronograma(
+            individuo: list,
+            tarefas_globais: list,
+            colaboradores: list,
+            ref_date: datetime.date
+    ) -> pd.DataFrame:
+        """
+        Monta o cronograma de uma solução com o mesmo escalonador usado na avaliação,
+        pulando ausências e fins de semana.
+
+        :param individuo: Solução (lista de IDs de colaboradores, um por tarefa).
+        :param tarefas_globais: Lista de tarefas globais (estrutura de cada projeto).
+        :param colaboradores: Lista de colaboradores com habilidades, cargos e ausências.
+        :param ref_date: Data de referência (dia 0) do cronograma.
+        :return: DataFrame com uma linha por tarefa.
+        """
+        escalonador = Escalonador(ProblemaCompilado(tarefas_globais, colaboradores), ref_date)
+        inicio, fim = escalonador.escalonar(individuo)
+        nomes_colaboradores = {c["id"]: c["nome"] for c in colaboradores}
+        ref = pd.Timestamp(ref_date)
+
+        return pd.DataFrame({
+            "Projeto": [tsk["projeto"] for tsk in tarefas_globais],
+            "Nome Tarefa": [tsk["nome"] for tsk in tarefas_globais],
+            "Início (dias)": inicio,
+            "Data Início": (ref + pd.to_timedelta(inicio, unit="D")).strftime("%d/%m/%Y"),
+            "Fim (dias)": fim - 1,  # -1 para refletir o último dia de trabalho
+            "Data Fim": (ref + pd.to_timedelta(fim - 1, unit="D")).strftime("%d/%m/%Y"),
+            "Colaborador": [nomes_colaboradores[cid] for cid in individuo],
+            "Duração (dias)": escalonador.duracoes,
+        })
+
+
+class GeneticAlgorithm:
+    """
+    Classe responsável por implementar o Algoritmo Genético para alocação de colaboradores.
+    """
+
+    @staticmethod
+    def criar_individuo(num_tarefas: int, lista_colab_ids: list, elegiveis: list = None) -> list:
+        """
+        Cria um indivíduo (solução) selecionando aleatoriamente um colaborador para cada tarefa.
+
+        :param num_tarefas: Quantidade de tarefas do problema.
+        :param lista_colab_ids: IDs de todos os colaboradores disponíveis.
+        :param elegiveis: Índice de colaboradores elegíveis por tarefa (ver ProblemaCompilado.elegiveis);
+            se informado, cada tarefa recebe um colaborador elegível.
+        :return: Lista de IDs de colaboradores correspondente ao indivíduo gerado.
+        """
+        if elegiveis is not None:
+            return [random.choice(candidatos) for candidatos in elegiveis]
+        return [random.choice(lista_colab_ids) for _ in range(num_tarefas)]
+
+    @staticmethod
+    def populacao_inicial(
+            tam_pop: int,
+            num_tarefas: int,
+            lista_colab_ids: list,
+            elegiveis: list = None
+    ) -> list:
+        """
+        Gera a população inicial para o Algoritmo Genético, criando vários indivíduos.
+
+        :param tam_pop: Tamanho da população.
+        :param num_tarefas: Quantidade total de tarefas.
+        :param lista_colab_ids: IDs de todos os colaboradores disponíveis.
+        :param elegiveis: Índice de colaboradores elegíveis por tarefa (opcional).
+        :return: Lista de indivíduos (população inicial).
+        """
+        return [
+            GeneticAlgorithm.criar_individuo(num_tarefas, lista_colab_ids, elegiveis)
+            for _ in range(tam_pop)
+        ]
+
+    @staticmethod
+    def reparar(individuo: list, elegiveis: list) -> list:
+        """
+        Operador de reparo: troca o colaborador de cada tarefa alocada a alguém não elegível
+        por um colaborador elegível sorteado. Útil para soluções vindas de fora do GA
+        (por exemplo, de uma execução anterior), já que os operadores do GA preservam a
+        elegibilidade quando ela está ativa.
+
+        :param individuo: Indivíduo (lista de IDs de colaboradores); alterado no lugar.
+        :param elegiveis: Índice de colaboradores elegíveis por tarefa (ver ProblemaCompilado.elegiveis).
+        :return: Indivíduo reparado.
+        """
+        for i, candidatos in enumerate(elegiveis):
+            if individuo[i] not in candidatos:
+                individuo[i] = random.choice(candidatos)
+        return individuo
+
+    @staticmethod
+    def pontuar(
+            individuo: list,
+            problema: ProblemaCompilado,
+            peso_makespan: int = 200,
+            escalonador: Escalonador = None
+    ) -> tuple:
+        """
+        Calcula apenas a fitness e os totais de penalidade de um indivíduo, sem montar
+        a lista detalhada de ocorrências (caminho usado durante a evolução).
+
+        :param individuo: Indivíduo (solução) representado por uma lista de IDs de colaboradores.
+        :param problema: Problema compilado (ver ProblemaCompilado).
+        :param peso_makespan: Fator de multiplicação para o makespan no cálculo da fitness.
+        :param escalonador: Escalonador já construído para o problema; se None, usa um
+            Escalonador sem data de referência (sem pular fins de semana).
+        :return: Tupla (fitness, penalidades), onde penalidades é um dicionário com os totais.
+        """
+        escalonador = escalonador or Escalonador(problema)
+        inicio, fim = escalonador.escalonar(individuo)
+        indices = problema.indices(individuo)
+        tarefas = np.arange(problema.num_tarefas)
+        intervalos = list(zip(inicio.tolist(), fim.tolist()))
+
+        penalidades = {
+            "habilidades_incorretas": 10_000 * int(
+                (~problema.compat_habilidades[tarefas, indices]).sum()
+            ),
+            "cargo_incorreto": 10_000 * int((~problema.compat_cargo[tarefas, indices]).sum()),
+            "ausencias": 0,
+            "sobreposicoes_colaborador": 0,
+            "sobreposicoes_projeto": 0
+        }
+        alocacoes = {}
+        intervalos_projetos = {}
+
+        for i, (cid, p) in enumerate(zip(individuo, problema.projeto_tarefa.tolist())):
+            inicio_tarefa, fim_tarefa = intervalos[i]
+            if escalonador.calendario.ausencias_entre(cid, inicio_tarefa, fim_tarefa) > 0:
+                penalidades["ausencias"] += 500
+
+            alocacoes.setdefault(cid, []).append(intervalos[i])
+            intervalos_projetos.setdefault(p, []).append(intervalos[i])
+
+        # Penalizar sobreposições por colaborador e dentro do mesmo projeto
+        for intervals in alocacoes.values():
+            penalidades["sobreposicoes_colaborador"] += (
+                2000 * GeneticAlgorithm.contar_sobreposicoes(intervals)
+            )
+        for intervals in intervalos_projetos.values():
+            penalidades["sobreposicoes_projeto"] += (
+                5000 * GeneticAlgorithm.contar_sobreposicoes(intervals)
+            )
+
+        makespan = max((fim for _, fim in intervalos), default=0)
+        penalidades["makespan"] = makespan * peso_makespan
+        fitness = sum(penalidades.values())  # soma de todas as penalidades (incluindo makespan)
+
+        return fitness, penalidades
+
+    @staticmethod
+    def explicar_penalidades(
+            individuo: list,
+            tarefas_globais: list,
+            colaboradores: list,
+            ref_date: datetime.date,
+            escalonador: Escalonador = None
+    ) -> dict:
+        """
+        Lista cada ocorrência das penalidades de um indivíduo, para exibição ao usuário.
+        Deve ser chamado sob demanda (por exemplo, apenas para a melhor solução).
+
+        :param individuo: Indivíduo (solução) representado por uma lista de IDs de colaboradores.
+        :param tarefas_globais: Lista de tarefas globais (estrutura de cada projeto).
+        :param colaboradores: Lista de colaboradores com habilidades, cargos e ausências.
+        :param ref_date: Data de referência usada para formatar os dias de ausência.
+        :param escalonador: Escalonador usado na avaliação; se None, usa um com a data de referência.
+        :return: Dicionário com a lista de ocorrências de cada tipo de penalidade.
+        """
+        colaboradores_por_id = {c["id"]: c for c in colaboradores}
+        escalonador = escalonador or Escalonador(
+            ProblemaCompilado(tarefas_globais, colaboradores), ref_date
+        )
+        intervalos = list(zip(*(arr.tolist() for arr in escalonador.escalonar(individuo))))
+
+        ocorrencias_penalidades = {
+            "habilidades_incorretas": [],
+            "cargo_incorreto": [],
+            "ausencias": [],
+            "sobreposicoes_colaborador": [],
+            "sobreposicoes_projeto": [],
+        }
+        alocacoes = {}
+        intervalos_projetos = {}
+
+        for i, tarefa in enumerate(tarefas_globais):
+            colab = colaboradores_por_id[individuo[i]]
+            inicio_tarefa, fim_tarefa = intervalos[i]
+
+            if not tarefa["habilidades_necessarias"].issubset(colab["habilidades"]):
+                ocorrencias_penalidades["habilidades_incorretas"].append({
+                    "projeto": tarefa["projeto"],
+                    "tarefa": tarefa["nome"],
+                    "colaborador": colab["nome"],
+                    "habilidades_necessarias": ", ".join(tarefa["habilidades_necessarias"]),
+                    "habilidades_colaborador": ", ".join(colab["habilidades"])
+                })
+
+            if tarefa["cargo_necessario"] != colab["cargo"]:
+                ocorrencias_penalidades["cargo_incorreto"].append({
+                    "projeto": tarefa["projeto"],
+                    "tarefa": tarefa["nome"],
+                    "colaborador": colab["nome"],
+                    "cargo_necessario": tarefa["cargo_necessario"],
+                    "cargo_colaborador": colab["cargo"]
+                })
+
+            dia = min((
+                d for d in colab["ausencias"]
+                if inicio_tarefa <= d < fim_tarefa and escalonador.calendario.eh_dia_de_semana(d)
+            ), default=None)
+            if dia is not None:
+                ocorrencias_penalidades["ausencias"].append({
+                    "projeto": tarefa["projeto"],
+                    "tarefa": tarefa["nome"],
+                    "colaborador": colab["nome"],
+                    "dia_ausencia": Utils.int_to_date(dia, ref_date)
+                })
+
+            alocacoes.setdefault(colab["id"], []).append(intervalos[i])
+            intervalos_projetos.setdefault(tarefa["projeto"], []).append(intervalos[i])
+
+        for cid, intervals in alocacoes.items():
+            for (s1, e1), (s2, e2) in GeneticAlgorithm.pares_sobrepostos(intervals):
+                ocorrencias_penalidades["sobreposicoes_colaborador"].append({
+                    "colaborador": colaboradores_por_id[cid]["nome"],
+                    "intervalo1": (s1, e1),
+                    "intervalo2": (s2, e2)
+                })
+
+        for pid, intervals in intervalos_projetos.items():
+            for (s1, e1), (s2, e2) in GeneticAlgorithm.pares_sobrepostos(intervals):
+                ocorrencias_penalidades["sobreposicoes_projeto"].append({
+                    "projeto": pid,
+                    "intervalo1": (s1, e1),
+                    "intervalo2": (s2, e2)
+                })
+
+        return ocorrencias_penalidades
+
+    @staticmethod
+    def contar_sobreposicoes(intervalos: list) -> int:
+        """
+        Conta os pares de intervalos [inicio, fim) que se sobrepõem em O(n log n),
+        varrendo os intervalos pelo início e mantendo um heap com o fim dos intervalos ativos.
+
+        :param intervalos: Lista de tuplas (inicio, fim).
+        :return: Quantidade de pares sobrepostos.
+        """
+        total = 0
+        fins_ativos = []
+        inicio_atual = None
+        ativos_mesmo_inicio = 0
+
+        for inicio, fim in sorted(intervalos, key=lambda x: x[0]):
+            while fins_ativos and fins_ativos[0] <= inicio:
+                heapq.heappop(fins_ativos)
+
+            if inicio != inicio_atual:
+                inicio_atual = inicio
+                ativos_mesmo_inicio = 0
+
+            if inicio < fim:
+                total += len(fins_ativos)
+                heapq.heappush(fins_ativos, fim)
+                ativos_mesmo_inicio += 1
+            else:
+                # Intervalo vazio só se sobrepõe a quem começou estritamente antes dele
+                total += len(fins_ativos) - ativos_mesmo_inicio
+
+        return total
+
+    @staticmethod
+    def pares_sobrepostos(intervalos: list) -> list:
+        """
+        Lista os pares de intervalos [inicio, fim) que se sobrepõem, com a mesma varredura de
+        GeneticAlgorithm.contar_sobreposicoes (custo proporcional ao número de pares).
+
+        :param intervalos: Lista de tuplas (inicio, fim).
+        :return: Lista de pares ((s1, e1), (s2, e2)) sobrepostos, ordenados pelo início.
+        """
+        intervals_sorted = sorted(intervalos, key=lambda x: x[0])
+        pares = []
+        fins_ativos = []
+        ativos = {}
+
+        for i2, (s2, e2) in enumerate(intervals_sorted):
+            while fins_ativos and fins_ativos[0][0] <= s2:
+                _, i1 = heapq.heappop(fins_ativos)
+                del ativos[i1]
+
+            for i1, (s1, e1) in ativos.items():
+                if s1 < e2:
+                    pares.append((i1, i2))
+
+            if s2 < e2:
+                ativos[i2] = (s2, e2)
+                heapq.heappush(fins_ativos, (e2, i2))
+
+        pares.sort()
+        return [(intervals_sorted[i1], intervals_sorted[i2]) for i1, i2 in pares]
+
+    @staticmethod
+    def avaliar(
+            individuo: list,
+            tarefas_globais: list,
+            colaboradores: list,
+            ref_date: datetime.date,
+            peso_makespan: int = 200
+    ) -> tuple:
+        """
+        Avalia a aptidão (fitness) de um indivíduo, aplicando penalidades por incompatibilidades,
+        ausências e sobreposições de tarefas, além de penalizar o makespan.
+
+        Combina GeneticAlgorithm.pontuar e GeneticAlgorithm.explicar_penalidades; durante a
+        evolução prefira pontuar, que não monta as ocorrências detalhadas.
+
+        :param individuo: Indivíduo (solução) representado por uma lista de IDs de colaboradores.
+        :param tarefas_globais: Lista de tarefas globais (estrutura de cada projeto).
+        :param colaboradores: Lista de colaboradores com habilidades, cargos e ausências.
+        :param ref_date: Data de referência (dia 0) do cronograma.
+        :param peso_makespan: Fator de multiplicação para o makespan no cálculo da fitness.
+        :return: Tupla (fitness, penalidades, ocorrencias_penalidades).
+        """
+        problema = ProblemaCompilado(tarefas_globais, colaboradores)
+        escalonador = Escalonador(problema, ref_date)
+        fitness, penalidades = GeneticAlgorithm.pontuar(individuo, problema, peso_makespan, escalonador)
+        ocorrencias_penalidades = GeneticAlgorithm.explicar_penalidades(
+            individuo, tarefas_globais, colaboradores, ref_date, escalonador
+        )
+        return fitness, penalidades, ocorrencias_penalidades
+
+    @staticmethod
+    def avaliar_populacao(populacao: list, avaliador: AvaliadorLote) -> tuple:
+        """
+        Avalia toda a população em lote, usando o avaliador vetorizado.
+
+        :param populacao: Lista de indivíduos (ou matriz (tam_pop, num_tarefas) de IDs).
+        :param avaliador: Avaliador vetorizado (AvaliadorLote ou AvaliadorParalelo).
+        :return: Tupla (fitnesses, penalidades), ambas listas com um item por indivíduo.
+        """
+        fitness, penalidades = avaliador.avaliar(np.asarray(populacao))
+        fitnesses = fitness.tolist()
+        penalidades_individuos = [
+            {chave: int(valores[i]) for chave, valores in penalidades.items()}
+            for i in range(len(fitnesses))
+        ]
+        return fitnesses, penalidades_individuos
+
+    @staticmethod
+    def torneio(populacao: list, fitnesses: list, k: int = 3) -> int:
+        """
+        Seleciona o melhor indivíduo dentre k indivíduos escolhidos aleatoriamente (torneio).
+
+        :param populacao: Lista de indivíduos.
+        :param fitnesses: Lista de valores de fitness correspondentes a cada indivíduo.
+        :param k: Tamanho do torneio.
+        :return: Índice do melhor indivíduo escolhido.
+        """
+        indices = random.sample(range(len(populacao)), k)
+        best_idx = indices[0]
+        best_fit = fitnesses[best_idx]
+        for idx in indices[1:]:
+            if fitnesses[idx] < best_fit:
+                best_fit = fitnesses[idx]
+                best_idx = idx
+        return best_idx
+
+    @staticmethod
+    def crossover(ind1: list, ind2: list) -> tuple:
+        """
+        Realiza o crossover entre dois indivíduos, trocando uma parte de seus genes.
+
+        :param ind1: Indivíduo 1 (lista de IDs de colaboradores).
+        :param ind2: Indivíduo 2 (lista de IDs de colaboradores).
+        :return: Uma tupla com dois novos indivíduos resultantes do crossover.
+        """
+        size = len(ind1)
+        if size < 2:
+            return ind1[:], ind2[:]
+        cx = random.randint(1, size - 1)
+        f1 = ind1[:cx] + ind2[cx:]
+        f2 = ind2[:cx] + ind1[cx:]
+        return f1, f2
+
+    @staticmethod
+    def mutacao(
+            individuo: list,
+            lista_colab_ids: list,
+            taxa_mut: float = 0.1,
+            elegiveis: list = None
+    ) -> list:
+        """
+        Aplica mutação a um indivíduo, trocando ocasionalmente o colaborador de uma tarefa.
+
+        :param individuo: Indivíduo (lista de IDs de colaboradores).
+        :param lista_colab_ids: IDs de todos os colaboradores disponíveis.
+        :param taxa_mut: Probabilidade de mutar uma determinada tarefa.
+        :param elegiveis: Índice de colaboradores elegíveis por tarefa (opcional); se informado,
+            o novo colaborador é sorteado apenas entre os elegíveis da tarefa.
+        :return: Indivíduo mutado.
+        """
+        for i in range(len(individuo)):
+            if random.random() < taxa_mut:
+                candidatos = lista_colab_ids if elegiveis is None else elegiveis[i]
+                individuo[i] = random.choice(candidatos)
+        return individuo
+
+    def algoritmo_genetico(
+            self,
+            tam_pop: int,
+            n_gen: int,
+            pc: float,
+            pm: float,
+            tarefas_globais: list,
+            colaboradores: list,
+            vetorizado: bool = True,
+            processos: int = 1,
+            tamanho_bloco: int = None,
+            tamanho_cache: int = 10_000,
+            ref_date: datetime.date = None,
+            elitismo: int = 0,
+            paciencia: int = None,
+            tempo_limite: float = None,
+            restringir_elegiveis: bool = True,
+            caminho_checkpoint: str = None,
+            intervalo_checkpoint: int = 10,
+            retomar: bool = False,
+            ao_progredir=None,
+            cancelamento=None
+    ) -> tuple:
+        """
+        Executa o loop principal do Algoritmo Genético, gerando e evoluindo a população
+        ao longo de até n_gen gerações.
+
+        :param tam_pop: Tamanho da população.
+        :param n_gen: Número de gerações.
+        :param pc: Probabilidade de crossover.
+        :param pm: Probabilidade de mutação.
+        :param tarefas_globais: Lista de todas as tarefas (estrutura do problema).
+        :param colaboradores: Lista de colaboradores com suas habilidades, cargos e ausências.
+        :param vetorizado: Se True, avalia a população inteira em lote com o AvaliadorLote.
+        :param processos: Quantidade de processos para avaliar a população; acima de 1,
+            a avaliação vetorizada é distribuída em blocos por um AvaliadorParalelo.
+        :param tamanho_bloco: Indivíduos por bloco enviado a cada processo (None divide igualmente).
+        :param tamanho_cache: Capacidade do cache LRU de fitness por cromossomo (0 desativa).
+        :param ref_date: Data de referência (dia 0) do cronograma; se informada, os fins de
+            semana não são dias úteis na avaliação.
+        :param elitismo: Quantidade dos melhores indivíduos copiados para a geração seguinte,
+            sem nova avaliação.
+        :param paciencia: Se informada, encerra a execução quando a melhor fitness não melhora
+            por esse número de gerações.
+        :param tempo_limite: Se informado, encerra a execução após esse tempo (em segundos).
+        :param restringir_elegiveis: Se True, a população inicial e a mutação sorteiam apenas
+            colaboradores elegíveis para cada tarefa (habilidades e cargo, ver
+            ProblemaCompilado.elegiveis).
+        :param caminho_checkpoint: Se informado, o estado da execução é gravado nesse arquivo
+            a cada intervalo_checkpoint gerações e ao final (ver Checkpoint).
+        :param intervalo_checkpoint: Gerações entre duas gravações do checkpoint.
+        :param retomar: Se True e o checkpoint existir, continua a execução a partir dele
+            (até a geração n_gen); o checkpoint deve ser do mesmo problema.
+        :param ao_progredir: Função chamada a cada geração com um dicionário de progresso
+            (ver GeneticAlgorithm._informar_progresso), por exemplo para atualizar a interface.
+        :param cancelamento: Objeto com o método is_set() (como um threading.Event); quando
+            sinalizado, a execução é encerrada ao final da geração atual.
+        :return: Tupla contendo (melhor_solucao, melhor_fitness, historico_fitness, melhor_penalty).
+            As ocorrências detalhadas da melhor solução podem ser obtidas sob demanda com
+            GeneticAlgorithm.explicar_penalidades. Contadores da execução (avaliações, acertos
+            e falhas do cache) ficam em self.estatisticas, e o motivo do encerramento
+            ("geracoes", "estagnacao", "tempo" ou "cancelado") em self.motivo_parada.
+        """
+        problema = ProblemaCompilado(tarefas_globais, colaboradores)
+        cache = CacheFitness(tamanho_cache) if tamanho_cache > 0 else None
+        elegiveis = problema.elegiveis() if restringir_elegiveis else None
+
+        checkpoint = None
+        retomada = None
+        if caminho_checkpoint:
+            checkpoint = (caminho_checkpoint, max(1, intervalo_checkpoint), problema.assinatura())
+            if retomar and os.path.exists(caminho_checkpoint):
+                retomada = Checkpoint.carregar(caminho_checkpoint)
+                if retomada["assinatura"] != checkpoint[2]:
+                    raise ValueError(
+                        f"O checkpoint '{caminho_checkpoint}' foi gerado para outro problema "
+                        "(tarefas ou colaboradores diferentes)."
+                    )
+                random.setstate(retomada["estado_aleatorio"])
+
+        if processos > 1:
+            with AvaliadorParalelo(
+                    problema, processos, tamanho_bloco, ref_date=ref_date
+            ) as avaliador:
+                return self._executar_geracoes(
+                    tam_pop, n_gen, pc, pm, problema, avaliador, cache,
+                    elitismo=elitismo, paciencia=paciencia, tempo_limite=tempo_limite,
+                    elegiveis=elegiveis, retomada=retomada, checkpoint=checkpoint,
+                    ao_progredir=ao_progredir, cancelamento=cancelamento
+                )
+
+        if vetorizado:
+            avaliador = AvaliadorLote(problema, ref_date=ref_date)
+        else:
+            avaliador = Escalonador(problema, ref_date)
+        return self._executar_geracoes(
+            tam_pop, n_gen, pc, pm, problema, avaliador, cache,
+            elitismo=elitismo, paciencia=paciencia, tempo_limite=tempo_limite,
+            elegiveis=elegiveis, retomada=retomada, checkpoint=checkpoint,
+            ao_progredir=ao_progredir, cancelamento=cancelamento
+        )
+
+    def algoritmo_genetico_ilhas(
+            self,
+            n_ilhas: int,
+            tam_pop: int,
+            n_gen: int,
+            pc: float,
+            pm: float,
+            tarefas_globais: list,
+            colaboradores: list,
+            intervalo_migracao: int = 10,
+            n_migrantes: int = 2,
+            processos: int = None,
+            tamanho_cache: int = 10_000,
+            ref_date: datetime.date = None,
+            elitismo: int = 0,
+            paciencia: int = None,
+            tempo_limite: float = None,
+            restringir_elegiveis: bool = True,
+            ao_progredir=None,
+            cancelamento=None
+    ) -> tuple:
+        """
+        Executa o Algoritmo Genético no modelo de ilhas: n_ilhas subpopulações evoluem de forma
+        independente (em processos separados) com os mesmos operadores de torneio, crossover e
+        mutação, e a cada intervalo_migracao gerações os melhores indivíduos de cada ilha migram
+        para a ilha seguinte (topologia em anel), substituindo os piores.
+
+        Cada ilha tem o seu próprio gerador aleatório, derivado do gerador global, de modo que
+        o resultado é reprodutível para uma mesma semente, independentemente do número de processos.
+
+        :param n_ilhas: Quantidade de ilhas (subpopulações).
+        :param tam_pop: Tamanho da população de cada ilha.
+        :param n_gen: Número de gerações.
+        :param pc: Probabilidade de crossover.
+        :param pm: Probabilidade de mutação.
+        :param tarefas_globais: Lista de todas as tarefas (estrutura do problema).
+        :param colaboradores: Lista de colaboradores com suas habilidades, cargos e ausências.
+        :param intervalo_migracao: Gerações entre duas migrações.
+        :param n_migrantes: Quantidade de indivíduos que cada ilha envia à seguinte.
+        :param processos: Quantidade de processos (None usa um por ilha, limitado aos núcleos);
+            com 1, as ilhas evoluem em sequência no processo atual.
+        :param tamanho_cache: Capacidade do cache LRU de fitness de cada processo (0 desativa).
+        :param ref_date: Data de referência (dia 0) do cronograma.
+        :param elitismo: Melhores indivíduos de cada ilha mantidos de uma geração para a outra.
+        :param paciencia: Se informada, encerra quando a melhor fitness (entre todas as ilhas)
+            não melhora por esse número de gerações. Verificada a cada migração.
+        :param tempo_limite: Se informado, encerra após esse tempo (em segundos).
+            Verificado a cada migração.
+        :param restringir_elegiveis: Se True, sorteia apenas colaboradores elegíveis (ver
+            algoritmo_genetico).
+        :param ao_progredir: Função chamada a cada migração com o progresso da execução
+            (ver algoritmo_genetico).
+        :param cancelamento: Sinal de cancelamento (ver algoritmo_genetico), verificado a
+            cada migração.
+        :return: Tupla contendo (melhor_solucao, melhor_fitness, historico_fitness, melhor_penalty),
+            como em algoritmo_genetico. O histórico de cada ilha fica em self.historico_ilhas.
+        """
+        processos = processos or min(n_ilhas, os.cpu_count() or 1)
+        dados = (
+            ProblemaCompilado(tarefas_globais, colaboradores), ref_date, tamanho_cache,
+            restringir_elegiveis
+        )
+        ilhas = [
+            {
+                "tam_pop": tam_pop,
+                "pc": pc,
+                "pm": pm,
+                "elitismo": elitismo,
+                "populacao": None,
+                "estado_aleatorio": random.Random(random.getrandbits(64)).getstate(),
+            }
+            for _ in range(n_ilhas)
+        ]
+
+        if processos > 1:
+            contexto = multiprocessing.get_context("spawn")
+            with contexto.Pool(processos, initializer=_inicializar_ilha, initargs=dados) as pool:
+                return self._evoluir_ilhas(
+                    ilhas, n_gen, intervalo_migracao, n_migrantes, pool.map, paciencia,
+                    tempo_limite, ao_progredir, cancelamento
+                )
+
+        _inicializar_ilha(*dados)
+        return self._evoluir_ilhas(
+            ilhas, n_gen, intervalo_migracao, n_migrantes,
+            lambda funcao, itens: [funcao(item) for item in itens], paciencia, tempo_limite,
+            ao_progredir, cancelamento
+        )
+
+    def _evoluir_ilhas(
+            self,
+            ilhas: list,
+            n_gen: int,
+            intervalo_migracao: int,
+            n_migrantes: int,
+            mapear,
+            paciencia: int = None,
+            tempo_limite: float = None,
+            ao_progredir=None,
+            cancelamento=None
+    ) -> tuple:
+        """
+        Loop de épocas do modelo de ilhas (ver algoritmo_genetico_ilhas): evolui todas as ilhas
+        por intervalo_migracao gerações com 'mapear' (map do pool ou sequencial) e faz a migração.
+        """
+        inicio = time.perf_counter()
+        self.estatisticas = {"avaliacoes": 0, "reaproveitados_pais": 0}
+        self.motivo_parada = "geracoes"
+        historicos = [[] for _ in ilhas]
+        best_sol, best_fit, best_penalty = None, float("inf"), {}
+        ultima_melhora = 0
+
+        restantes = n_gen
+        primeira = True
+        while primeira or restantes > 0:
+            geracoes = min(intervalo_migracao, restantes)
+            for ilha in ilhas:
+                ilha["geracoes"] = geracoes
+            ilhas = mapear(_evoluir_ilha, ilhas)
+
+            for historico, ilha in zip(historicos, ilhas):
+                # Fora da primeira época, o primeiro ponto repete a população da época anterior
+                historico.extend(ilha["historico"] if primeira else ilha["historico"][1:])
+                for chave, valor in ilha["estatisticas"].items():
+                    self.estatisticas[chave] = self.estatisticas.get(chave, 0) + valor
+                sol, fit, penalty = ilha["melhor"]
+                if fit < best_fit:
+                    best_sol, best_fit, best_penalty = sol, fit, penalty
+                    ultima_melhora = n_gen - restantes + geracoes
+
+            restantes -= geracoes
+            primeira = False
+            if ao_progredir is not None:
+                self._informar_progresso(
+                    ao_progredir, len(historicos[0]), best_fit,
+                    [f for ilha in ilhas for f in ilha["populacao"][1]], inicio
+                )
+            if restantes > 0 and cancelamento is not None and cancelamento.is_set():
+                self.motivo_parada = "cancelado"
+                break
+            if restantes > 0 and paciencia and n_gen - restantes - ultima_melhora >= paciencia:
+                self.motivo_parada = "estagnacao"
+                break
+            if restantes > 0 and tempo_limite is not None and time.perf_counter() - inicio >= tempo_limite:
+                self.motivo_parada = "tempo"
+                break
+            if restantes > 0 and len(ilhas) > 1:
+                self.migrar([ilha["populacao"] for ilha in ilhas], n_migrantes)
+
+        # Melhor fitness já encontrada em cada ilha, geração a geração
+        self.historico_ilhas = [list(itertools.accumulate(h, min)) for h in historicos]
+        historico_fitness = [min(valores) for valores in zip(*self.historico_ilhas)]
+
+        return best_sol, best_fit, historico_fitness, best_penalty
+
+    @staticmethod
+    def migrar(populacoes: list, n_migrantes: int):
+        """
+        Migração em anel: os n_migrantes melhores indivíduos de cada ilha substituem (com a
+        fitness e as penalidades já calculadas) os n_migrantes piores da ilha seguinte.
+
+        :param populacoes: Lista, por ilha, de tuplas (individuos, fitnesses, penalidades);
+            as listas são alteradas no lugar.
+        :param n_migrantes: Quantidade de indivíduos enviados por ilha.
+        """
+        migrantes = []
+        for pop, fits, penalties in populacoes:
+            melhores = sorted(range(len(fits)), key=fits.__getitem__)[:n_migrantes]
+            migrantes.append([(pop[i][:], fits[i], penalties[i]) for i in melhores])
+
+        for k, (pop, fits, penalties) in enumerate(populacoes):
+            piores = sorted(range(len(fits)), key=fits.__getitem__, reverse=True)[:n_migrantes]
+            for i, (ind, f, penalty) in zip(piores, migrantes[k - 1]):
+                pop[i], fits[i], penalties[i] = ind, f, penalty
+
+    def _executar_geracoes(
+            self,
+            tam_pop: int,
+            n_gen: int,
+            pc: float,
+            pm: float,
+            problema: ProblemaCompilado,
+            avaliador,
+            cache: CacheFitness = None,
+            populacao: tuple = None,
+            elitismo: int = 0,
+            paciencia: int = None,
+            tempo_limite: float = None,
+            elegiveis: list = None,
+            retomada: dict = None,
+            checkpoint: tuple = None,
+            ao_progredir=None,
+            cancelamento=None
+    ) -> tuple:
+        """
+        Loop de gerações do Algoritmo Genético (ver algoritmo_genetico).
+
+        :param problema: Problema compilado (ver ProblemaCompilado).
+        :param avaliador: Avaliador em lote da população, ou um Escalonador para avaliar
+            indivíduo a indivíduo com GeneticAlgorithm.pontuar.
+        :param cache: Cache de fitness por cromossomo (None desativa o cache).
+        :param populacao: Tupla (individuos, fitnesses, penalidades) de uma população já
+            avaliada para continuar a evolução; se None, gera e avalia a população inicial.
+            A população da última geração fica em self.populacao_final, no mesmo formato.
+        :param elitismo: Melhores indivíduos copiados para a geração seguinte sem nova avaliação.
+        :param paciencia: Gerações sem melhora da melhor fitness que encerram a execução.
+        :param tempo_limite: Tempo máximo de execução, em segundos.
+        :param elegiveis: Índice de colaboradores elegíveis por tarefa, usado na criação
+            e na mutação (None sorteia entre todos os colaboradores).
+        :param retomada: Estado lido de um checkpoint (ver Checkpoint.carregar); a execução
+            continua a partir da geração salva, com a população, o histórico e a melhor solução.
+        :param checkpoint: Tupla (caminho, intervalo, assinatura do problema); se informada, o
+            estado é gravado a cada 'intervalo' gerações e ao final da execução.
+        :param ao_progredir: Função chamada a cada geração com o progresso da execução.
+        :param cancelamento: Sinal de cancelamento, verificado a cada geração.
+        """
+        inicio = time.perf_counter()
+        self.motivo_parada = "geracoes"
+        num_t = problema.num_tarefas
+        colab_ids = problema.colaborador_ids.tolist()
+        self.estatisticas = {"avaliacoes": 0, "reaproveitados_pais": 0}
+
+        geracao_inicial = 0
+        best_sol = None
+        best_fit = float("inf")
+        best_penalty = {}
+
+        historico_fitness = []
+
+        if retomada is not None:
+            populacao = retomada["populacao"]
+            geracao_inicial = retomada["geracao"]
+            best_sol, best_fit, best_penalty = retomada["melhor"]
+            historico_fitness = list(retomada["historico_fitness"])
+
+        if populacao is None:
+            # População inicial
+            pop = self.populacao_inicial(tam_pop, num_t, colab_ids, elegiveis)
+
+            # Avalia a população inicial
+            fits, penalties = self._avaliar_geracao(
+                pop, [None] * len(pop), problema, avaliador, cache
+            )
+        else:
+            pop, fits, penalties = (list(item) for item in populacao)
+
+        # Loop principal de gerações
+        for geracao in range(geracao_inicial, n_gen):
+            new_pop = []
+            herdados = []
+
+            # Grava o estado antes de evoluir a geração (a primeira já está salva ou é recriável)
+            if checkpoint is not None and geracao > geracao_inicial and geracao % checkpoint[1] == 0:
+                self._salvar_checkpoint(
+                    checkpoint, geracao, (pop, fits, penalties), historico_fitness,
+                    (best_sol, best_fit, best_penalty)
+                )
+
+            # Atualiza melhor indivíduo
+            for i, f in enumerate(fits):
+                if f < best_fit:
+                    best_fit = f
+                    best_sol = pop[i][:]
+                    best_penalty = penalties[i]
+
+            historico_fitness.append(best_fit)
+            if ao_progredir is not None:
+                self._informar_progresso(ao_progredir, len(historico_fitness), best_fit, fits, inicio)
+
+            # Critérios de parada antecipada
+            if cancelamento is not None and cancelamento.is_set():
+                self.motivo_parada = "cancelado"
+                break
+            if (
+                    paciencia
+                    and len(historico_fitness) > paciencia
+                    and historico_fitness[-1] >= historico_fitness[-1 - paciencia]
+            ):
+                self.motivo_parada = "estagnacao"
+                break
+            if tempo_limite is not None and time.perf_counter() - inicio >= tempo_limite:
+                self.motivo_parada = "tempo"
+                break
+
+            # Elitismo: os melhores seguem para a próxima geração com a avaliação herdada
+            for i in sorted(range(len(pop)), key=fits.__getitem__)[:elitismo]:
+                new_pop.append(pop[i][:])
+                herdados.append((fits[i], penalties[i]))
+
+            # Gerar nova população
+            while len(new_pop) < tam_pop:
+                i1 = self.torneio(pop, fits)
+                i2 = self.torneio(pop, fits)
+                p1 = pop[i1]
+                p2 = pop[i2]
+
+                if random.random() < pc:
+                    c1, c2 = self.crossover(p1, p2)
+                else:
+                    c1, c2 = p1[:], p2[:]
+
+                if random.random() < pm:
+                    c1 = self.mutacao(c1, colab_ids, 0.1, elegiveis)
+                if random.random() < pm:
+                    c2 = self.mutacao(c2, colab_ids, 0.1, elegiveis)
+
+                # Filhos idênticos a um dos pais herdam a avaliação sem recalcular
+                for filho in (c1, c2):
+                    if len(new_pop) == tam_pop:
+                        break
+                    pai = i1 if filho == p1 else i2 if filho == p2 else None
+                    new_pop.append(filho)
+                    herdados.append((fits[pai], penalties[pai]) if pai is not None else None)
+
+            # Avalia nova população
+            fits, penalties = self._avaliar_geracao(
+                new_pop, herdados, problema, avaliador, cache
+            )
+            pop = new_pop
+
+        if checkpoint is not None and self.motivo_parada == "geracoes" and n_gen > geracao_inicial:
+            # Permite continuar a execução mais tarde com um número maior de gerações
+            self._salvar_checkpoint(
+                checkpoint, n_gen, (pop, fits, penalties), historico_fitness,
+                (best_sol, best_fit, best_penalty)
+            )
+
+        # Avaliação final (em uma parada antecipada, a última geração já foi examinada no loop)
+        if self.motivo_parada == "geracoes":
+            for i, f in enumerate(fits):
+                if f < best_fit:
+                    best_fit = f
+                    best_sol = pop[i][:]
+                    best_penalty = penalties[i]
+
+            historico_fitness.append(best_fit)
+            if ao_progredir is not None:
+                self._informar_progresso(ao_progredir, len(historico_fitness), best_fit, fits, inicio)
+        self.populacao_final = (pop, fits, penalties)
+
+        if cache is not None:
+            self.estatisticas["cache_acertos"] = cache.acertos
+            self.estatisticas["cache_falhas"] = cache.falhas
+
+        return best_sol, best_fit, historico_fitness, best_penalty
+
+    def _informar_progresso(
+            self,
+            ao_progredir,
+            geracao: int,
+            melhor_fitness: float,
+            fitnesses: list,
+            inicio: float
+    ):
+        """
+        Envia a ao_progredir o progresso da execução: um dicionário com a geração, a melhor
+        fitness até o momento, a fitness média da população atual, a quantidade de avaliações,
+        a vazão de avaliações por segundo e o tempo decorrido (em segundos).
+        """
+        tempo = time.perf_counter() - inicio
+        avaliacoes = self.estatisticas["avaliacoes"]
+        ao_progredir({
+            "geracao": geracao,
+            "melhor_fitness": melhor_fitness,
+            "media_fitness": sum(fitnesses) / len(fitnesses),
+            "avaliacoes": avaliacoes,
+            "avaliacoes_por_segundo": avaliacoes / tempo if tempo > 0 else 0.0,
+            "tempo": tempo,
+        })
+
+    @staticmethod
+    def _salvar_checkpoint(
+            checkpoint: tuple,
+            geracao: int,
+            populacao: tuple,
+            historico_fitness: list,
+            melhor: tuple
+    ):
+        """
+        Grava o estado da execução no início da geração 'geracao' (ver Checkpoint.salvar).
+        """
+        caminho, _, assinatura = checkpoint
+        Checkpoint.salvar(caminho, {
+            "geracao": geracao,
+            "assinatura": assinatura,
+            "populacao": populacao,
+            "historico_fitness": historico_fitness,
+            "melhor": melhor,
+            "estado_aleatorio": random.getstate(),
+        })
+
+    def _avaliar_geracao(
+            self,
+            populacao: list,
+            herdados: list,
+            problema: ProblemaCompilado,
+            avaliador,
+            cache: CacheFitness = None
+    ) -> tuple:
+        """
+        Avalia uma geração, reaproveitando avaliações herdadas dos pais e do cache,
+        e calculando apenas os cromossomos inéditos.
+
+        Os cromossomos inéditos são sempre simulados desde a primeira tarefa. Retomar a
+        simulação do pai a partir do primeiro gene alterado foi medido e descartado: a
+        mutação altera cada gene com 10% de chance, então o prefixo comum costuma ser quase
+        vazio, e o ganho (cerca de 12% com pm=0.05, nenhum com pm=0.3) não compensava
+        manter o estado do cronograma de cada indivíduo.
+
+        :param populacao: Lista de indivíduos.
+        :param herdados: Para cada indivíduo, (fitness, penalidades) herdados de um pai
+            idêntico, ou None.
+        :param problema: Problema compilado (ver ProblemaCompilado).
+        :param avaliador: Avaliador em lote da população, ou um Escalonador para usar pontuar.
+        :param cache: Cache de fitness por cromossomo (None desativa o cache).
+        :return: Tupla (fitnesses, penalidades), listas com um item por indivíduo.
+        """
+        fits = [None] * len(populacao)
+        penalties = [None] * len(populacao)
+        pendentes = {}
+
+        for i, ind in enumerate(populacao):
+            if herdados[i] is not None:
+                fits[i], penalties[i] = herdados[i]
+                self.estatisticas["reaproveitados_pais"] += 1
+                continue
+
+            chave = tuple(ind)
+            if chave in pendentes:
+                # Duplicado dentro da mesma geração
+                pendentes[chave].append(i)
+                if cache is not None:
+                    cache.acertos += 1
+                continue
+
+            em_cache = cache.obter(chave) if cache is not None else None
+            if em_cache is not None:
+                fits[i], penalties[i] = em_cache
+            else:
+                pendentes[chave] = [i]
+
+        if pendentes:
+            ineditos = [populacao[indices[0]] for indices in pendentes.values()]
+            if isinstance(avaliador, Escalonador):
+                resultados = [
+                    self.pontuar(ind, problema, escalonador=avaliador)
+                    for ind in ineditos
+                ]
+                novos_fits = [item[0] for item in resultados]
+                novas_penalties = [item[1] for item in resultados]
+            else:
+                novos_fits, novas_penalties = self.avaliar_populacao(ineditos, avaliador)
+            self.estatisticas["avaliacoes"] += len(ineditos)
+
+            for (chave, indices), f, pen in zip(pendentes.items(), novos_fits, novas_penalties):
+                if cache is not None:
+                    cache.inserir(chave, (f, pen))
+                for i in indices:
+                    fits[i], penalties[i] = f, pen
+
+        return fits, penalties
+
+
+# Problema, avaliador e cache de cada processo do modelo de ilhas, criados na inicialização
+_ilha_worker = None
+
+
+def _inicializar_ilha(
+        problema: ProblemaCompilado,
+        ref_date: datetime.date,
+        tamanho_cache: int,
+        restringir_elegiveis: bool = True
+):
+    """
+    Inicializa um processo do modelo de ilhas. O problema compilado é enviado uma única
+    vez por processo; o cache é compartilhado pelas ilhas que evoluem no mesmo processo,
+    já que a fitness de um cromossomo não depende da ilha.
+    """
+    global _ilha_worker
+    _ilha_worker = {
+        "problema": problema,
+        "avaliador": AvaliadorLote(problema, ref_date=ref_date),
+        "cache": CacheFitness(tamanho_cache) if tamanho_cache > 0 else None,
+        "elegiveis": problema.elegiveis() if restringir_elegiveis else None,
+    }
+
+
+def _evoluir_ilha(ilha: dict) -> dict:
+    """
+    Evolui uma ilha por ilha["geracoes"] gerações no processo atual, a partir da sua
+    população avaliada e do estado do seu gerador aleatório.
+    """
+    # Preserva o gerador global do processo (as ilhas podem rodar no processo principal)
+    estado_processo = random.getstate()
+    random.setstate(ilha["estado_aleatorio"])
+    cache = _ilha_worker["cache"]
+    acertos, falhas = (cache.acertos, cache.falhas) if cache is not None else (0, 0)
+
+    ga = GeneticAlgorithm()
+    best_sol, best_fit, historico, best_penalty = ga._executar_geracoes(
+        ilha["tam_pop"], ilha["geracoes"], ilha["pc"], ilha["pm"],
+        _ilha_worker["problema"], _ilha_worker["avaliador"], cache, ilha["populacao"], ilha["elitismo"],
+        elegiveis=_ilha_worker["elegiveis"]
+    )
+
+    estatisticas = ga.estatisticas
+    if cache is not None:
+        estatisticas["cache_acertos"] -= acertos
+        estatisticas["cache_falhas"] -= falhas
+
+    estado_ilha = random.getstate()
+    random.setstate(estado_processo)
+
+    return {
+        **ilha,
+        "populacao": ga.populacao_final,
+        "estado_aleatorio": estado_ilha,
+        "historico": historico,
+        "melhor": (best_sol, best_fit, best_penalty),
+        "estatisticas": estatisticas,
+    }
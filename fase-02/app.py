@@ -1,12 +1,24 @@
 import datetime
+import functools
+import html
 import json
-import random
+import math
+import os
+import threading
+import time
 
 import pandas as pd
 import streamlit as st
 import streamlit.components.v1 as components
 import plotly.graph_objects as go
 
+from alocacao import DataManager, GeneticAlgorithm
+from multiobjetivo import AlgoritmoMultiobjetivo
+from replanejamento import Replanejador
+
+# Quantidade máxima de eventos enviados ao calendário de uma só vez
+LIMITE_EVENTOS_CALENDARIO = 2000
+
 st.set_page_config(
     page_title="Algoritmo Genético para alocação de colaboradores",
     layout="wide",
@@ -14,431 +26,6 @@ st.set_page_config(
 )
 
 
-class Utils:
-    """
-    Classe utilitária para conversão de datas.
-    """
-
-    @staticmethod
-    def date_to_int(date_str: str, ref_date: datetime.date) -> int:
-        """
-        Converte uma string de data (YYYY-MM-DD) para um inteiro que representa
-        a distância (em dias) em relação a uma data de referência.
-
-        :param date_str: Data no formato 'YYYY-MM-DD'.
-        :param ref_date: Data de referência para o cálculo.
-        :return: Número de dias entre a data especificada e a data de referência.
-        """
-        ano, mes, dia = map(int, date_str.split("-"))
-        d = datetime.date(ano, mes, dia)
-        delta = d - ref_date
-        return delta.days
-
-    @staticmethod
-    def int_to_date(days: int, ref_date: datetime.date) -> str:
-        """
-        Converte um inteiro (dias) em string de data (YYYY-MM-DD),
-        adicionando 'days' dias à data de referência.
-
-        :param days: Número de dias a adicionar.
-        :param ref_date: Data de referência.
-        :return: Data no formato 'YYYY-MM-DD' resultante.
-        """
-        target_date = ref_date + datetime.timedelta(days=days)
-        return target_date.strftime("%d/%m/%Y")
-
-
-class DataManager:
-    """
-    Classe responsável por ler dados de arquivos JSON e organizar
-    as informações de colaboradores e projetos.
-    """
-
-    @staticmethod
-    def read_json_from_file(file_path: str) -> dict:
-        """
-        Lê um arquivo JSON e retorna seu conteúdo como dicionário ou lista.
-
-        :param file_path: Caminho do arquivo JSON.
-        :return: Dados carregados do arquivo JSON.
-        """
-        with open(file_path, "r") as f:
-            data = json.load(f)
-        return data
-
-    def gerar_dados(self):
-        """
-        Lê as informações de colaboradores e projetos de arquivos JSON.
-
-        :return: Tupla (colaboradores, projetos).
-        """
-        colaboradores = self.read_json_from_file("dados/colaboradores.json")
-        projetos = self.read_json_from_file("dados/projetos.json")
-
-        # Converte as datas de ausência de cada colaborador para dias (inteiros)
-        for colab in colaboradores:
-            ausencias_convertidas = []
-            for data_str in colab["ausencias"]:
-                dia_int = Utils.date_to_int(data_str, st.session_state.ref_date)
-                ausencias_convertidas.append(dia_int)
-            colab["ausencias"] = ausencias_convertidas
-
-        return colaboradores, projetos
-
-    def montar_tarefas_globais(self, colaboradores: list, projetos: list):
-        """
-        Monta uma lista global de tarefas, organizando as etapas de cada projeto.
-
-        :param colaboradores: Lista de colaboradores.
-        :param projetos: Lista de projetos, cada um contendo etapas.
-        :return: Tupla (tarefas_globais, colaboradores).
-        """
-        tarefas_globais = []
-        for proj in projetos:
-            etapas_ordenadas = sorted(proj["etapas"], key=lambda e: e["id"])
-            for etapa in etapas_ordenadas:
-                tarefas_globais.append({
-                    "projeto": proj["nome"],
-                    "task_id": etapa["id"],
-                    "nome": etapa["nome"],
-                    "duracao_dias": etapa["duracao_dias"],
-                    "habilidades_necessarias": set(etapa["habilidades_necessarias"]),
-                    "cargo_necessario": etapa["cargo_necessario"],
-                })
-        return tarefas_globais, colaboradores
-
-
-class GeneticAlgorithm:
-    """
-    Classe responsável por implementar o Algoritmo Genético para alocação de colaboradores.
-    """
-
-    @staticmethod
-    def criar_individuo(num_tarefas: int, lista_colab_ids: list) -> list:
-        """
-        Cria um indivíduo (solução) selecionando aleatoriamente um colaborador para cada tarefa.
-
-        :param num_tarefas: Quantidade de tarefas do problema.
-        :param lista_colab_ids: IDs de todos os colaboradores disponíveis.
-        :return: Lista de IDs de colaboradores correspondente ao indivíduo gerado.
-        """
-        return [random.choice(lista_colab_ids) for _ in range(num_tarefas)]
-
-    @staticmethod
-    def populacao_inicial(tam_pop: int, num_tarefas: int, lista_colab_ids: list) -> list:
-        """
-        Gera a população inicial para o Algoritmo Genético, criando vários indivíduos.
-
-        :param tam_pop: Tamanho da população.
-        :param num_tarefas: Quantidade total de tarefas.
-        :param lista_colab_ids: IDs de todos os colaboradores disponíveis.
-        :return: Lista de indivíduos (população inicial).
-        """
-        return [
-            GeneticAlgorithm.criar_individuo(num_tarefas, lista_colab_ids)
-            for _ in range(tam_pop)
-        ]
-
-    @staticmethod
-    def avaliar(
-            individuo: list,
-            tarefas_globais: list,
-            colaboradores: list,
-            peso_makespan: int = 200
-    ) -> tuple:
-        """
-        Avalia a aptidão (fitness) de um indivíduo, aplicando penalidades por incompatibilidades,
-        ausências e sobreposições de tarefas, além de penalizar o makespan.
-
-        :param individuo: Indivíduo (solução) representado por uma lista de IDs de colaboradores.
-        :param tarefas_globais: Lista de tarefas globais (estrutura de cada projeto).
-        :param colaboradores: Lista de colaboradores com habilidades, cargos e ausências.
-        :param peso_makespan: Fator de multiplicação para o makespan no cálculo da fitness.
-        :return: Tupla (fitness, penalidades), onde penalidades é um dicionário detalhado.
-        """
-        alocacoes = {col["id"]: [] for col in colaboradores}
-        fim_projeto = {t["projeto"]: 0 for t in tarefas_globais}
-        intervalos_projetos = {t["projeto"]: [] for t in tarefas_globais}
-
-        # Dicionário que acumula os valores totais
-        penalidades = {
-            "habilidades_incorretas": 0,
-            "cargo_incorreto": 0,
-            "ausencias": 0,
-            "sobreposicoes_colaborador": 0,
-            "sobreposicoes_projeto": 0
-        }
-
-        # Dicionário que lista cada ocorrência das penalidades
-        ocorrencias_penalidades = {
-            "habilidades_incorretas": [],
-            "cargo_incorreto": [],
-            "ausencias": [],
-            "sobreposicoes_colaborador": [],
-            "sobreposicoes_projeto": [],
-        }
-
-        makespan = 0
-
-        # Avaliação das tarefas
-        for i, tarefa in enumerate(tarefas_globais):
-            cid = individuo[i]
-            colab = next(c for c in colaboradores if c["id"] == cid)
-
-            # Penalidade por habilidades incorretas
-            if not tarefa["habilidades_necessarias"].issubset(colab["habilidades"]):
-                penalidades["habilidades_incorretas"] += 10_000
-                ocorrencias_penalidades["habilidades_incorretas"].append({
-                    "projeto": tarefa["projeto"],
-                    "tarefa": tarefa["nome"],
-                    "colaborador": colab["nome"],
-                    "habilidades_necessarias": ", ".join(tarefa["habilidades_necessarias"]),
-                    "habilidades_colaborador": ", ".join(colab["habilidades"])
-                })
-
-            # Penalidade por cargo incorreto
-            if tarefa["cargo_necessario"] != colab["cargo"]:
-                penalidades["cargo_incorreto"] += 10_000
-                ocorrencias_penalidades["cargo_incorreto"].append({
-                    "projeto": tarefa["projeto"],
-                    "tarefa": tarefa["nome"],
-                    "colaborador": colab["nome"],
-                    "cargo_necessario": tarefa["cargo_necessario"],
-                    "cargo_colaborador": colab["cargo"]
-                })
-
-            proj_atual = tarefa["projeto"]
-            ultimo_fim_proj = fim_projeto[proj_atual]
-
-            # Descobrir o fim da última tarefa desse colaborador
-            ultimo_fim_colab = max(e for (_, e) in alocacoes[cid]) if alocacoes[cid] else 0
-
-            inicio_tarefa = max(ultimo_fim_proj, ultimo_fim_colab)
-
-            # Ajusta o início para não cair em ausência
-            while inicio_tarefa in colab["ausencias"]:
-                inicio_tarefa += 1
-
-            fim_tarefa = inicio_tarefa
-            duracao_restante = tarefa["duracao_dias"]
-            while duracao_restante > 0:
-                if fim_tarefa not in colab["ausencias"]:
-                    duracao_restante -= 1
-                fim_tarefa += 1
-
-            # Se caiu em ausência, registrar penalidade
-            for dia in range(inicio_tarefa, fim_tarefa):
-                if dia in colab["ausencias"]:
-                    penalidades["ausencias"] += 500
-                    ocorrencias_penalidades["ausencias"].append({
-                        "projeto": tarefa["projeto"],
-                        "tarefa": tarefa["nome"],
-                        "colaborador": colab["nome"],
-                        "dia_ausencia": Utils.int_to_date(dia, st.session_state.ref_date)
-                    })
-                    break
-
-            fim_projeto[proj_atual] = fim_tarefa
-            alocacoes[cid].append((inicio_tarefa, fim_tarefa))
-            intervalos_projetos[proj_atual].append((inicio_tarefa, fim_tarefa))
-
-            if fim_tarefa > makespan:
-                makespan = fim_tarefa
-
-        # Penalizar sobreposições por colaborador
-        for cid, intervals in alocacoes.items():
-            intervals_sorted = sorted(intervals, key=lambda x: x[0])
-            for i1 in range(len(intervals_sorted)):
-                for i2 in range(i1 + 1, len(intervals_sorted)):
-                    s1, e1 = intervals_sorted[i1]
-                    s2, e2 = intervals_sorted[i2]
-                    if (s1 < e2) and (s2 < e1):
-                        penalidades["sobreposicoes_colaborador"] += 2000
-                        ocorrencias_penalidades["sobreposicoes_colaborador"].append({
-                            "colaborador": next(c["nome"] for c in colaboradores if c["id"] == cid),
-                            "intervalo1": (s1, e1),
-                            "intervalo2": (s2, e2)
-                        })
-
-        # Penalizar sobreposições dentro do mesmo projeto
-        for pid, intervals in intervalos_projetos.items():
-            intervals_sorted = sorted(intervals, key=lambda x: x[0])
-            for i1 in range(len(intervals_sorted)):
-                for i2 in range(i1 + 1, len(intervals_sorted)):
-                    s1, e1 = intervals_sorted[i1]
-                    s2, e2 = intervals_sorted[i2]
-                    if (s1 < e2) and (s2 < e1):
-                        penalidades["sobreposicoes_projeto"] += 5000
-                        ocorrencias_penalidades["sobreposicoes_projeto"].append({
-                            "projeto": proj_atual,
-                            "intervalo1": (s1, e1),
-                            "intervalo2": (s2, e2)
-                        })
-
-        penalidades["makespan"] = makespan * peso_makespan
-        soma_pens = sum(penalidades.values())
-        fitness = soma_pens  # soma de todas as penalidades (incluindo makespan)
-
-        # Retorna também a lista de ocorrências detalhadas
-        return fitness, penalidades, ocorrencias_penalidades
-
-    @staticmethod
-    def torneio(populacao: list, fitnesses: list, k: int = 3) -> int:
-        """
-        Seleciona o melhor indivíduo dentre k indivíduos escolhidos aleatoriamente (torneio).
-
-        :param populacao: Lista de indivíduos.
-        :param fitnesses: Lista de valores de fitness correspondentes a cada indivíduo.
-        :param k: Tamanho do torneio.
-        :return: Índice do melhor indivíduo escolhido.
-        """
-        indices = random.sample(range(len(populacao)), k)
-        best_idx = indices[0]
-        best_fit = fitnesses[best_idx]
-        for idx in indices[1:]:
-            if fitnesses[idx] < best_fit:
-                best_fit = fitnesses[idx]
-                best_idx = idx
-        return best_idx
-
-    @staticmethod
-    def crossover(ind1: list, ind2: list) -> tuple:
-        """
-        Realiza o crossover entre dois indivíduos, trocando uma parte de seus genes.
-
-        :param ind1: Indivíduo 1 (lista de IDs de colaboradores).
-        :param ind2: Indivíduo 2 (lista de IDs de colaboradores).
-        :return: Uma tupla com dois novos indivíduos resultantes do crossover.
-        """
-        size = len(ind1)
-        if size < 2:
-            return ind1[:], ind2[:]
-        cx = random.randint(1, size - 1)
-        f1 = ind1[:cx] + ind2[cx:]
-        f2 = ind2[:cx] + ind1[cx:]
-        return f1, f2
-
-    @staticmethod
-    def mutacao(individuo: list, lista_colab_ids: list, taxa_mut: float = 0.1) -> list:
-        """
-        Aplica mutação a um indivíduo, trocando ocasionalmente o colaborador de uma tarefa.
-
-        :param individuo: Indivíduo (lista de IDs de colaboradores).
-        :param lista_colab_ids: IDs de todos os colaboradores disponíveis.
-        :param taxa_mut: Probabilidade de mutar uma determinada tarefa.
-        :return: Indivíduo mutado.
-        """
-        for i in range(len(individuo)):
-            if random.random() < taxa_mut:
-                individuo[i] = random.choice(lista_colab_ids)
-        return individuo
-
-    def algoritmo_genetico(
-            self,
-            tam_pop: int,
-            n_gen: int,
-            pc: float,
-            pm: float,
-            tarefas_globais: list,
-            colaboradores: list
-    ) -> tuple:
-        """
-        Executa o loop principal do Algoritmo Genético, gerando e evoluindo a população
-        ao longo de n_gen gerações.
-
-        :param tam_pop: Tamanho da população.
-        :param n_gen: Número de gerações.
-        :param pc: Probabilidade de crossover.
-        :param pm: Probabilidade de mutação.
-        :param tarefas_globais: Lista de todas as tarefas (estrutura do problema).
-        :param colaboradores: Lista de colaboradores com suas habilidades, cargos e ausências.
-        :return: Tupla contendo (melhor_solucao, melhor_fitness, historico_fitness, melhor_penalty).
-        """
-        num_t = len(tarefas_globais)
-        colab_ids = [c["id"] for c in colaboradores]
-
-        # População inicial
-        pop = self.populacao_inicial(tam_pop, num_t, colab_ids)
-
-        # Avalia a população inicial
-        fits_and_penalties = [
-            self.avaliar(ind, tarefas_globais, colaboradores)
-            for ind in pop
-        ]
-        fits = [item[0] for item in fits_and_penalties]
-        penalties = [item[1] for item in fits_and_penalties]
-        penalties_occurrences = [item[2] for item in fits_and_penalties]
-
-        best_sol = None
-        best_fit = float("inf")
-        best_penalty = {}
-        best_penalty_occurrences = {}
-
-        historico_fitness = []
-
-        # Loop principal de gerações
-        for _ in range(n_gen):
-            new_pop = []
-            new_fits = []
-            new_penalties = []
-            new_occurrences = []
-
-            # Atualiza melhor indivíduo
-            for i, f in enumerate(fits):
-                if f < best_fit:
-                    best_fit = f
-                    best_sol = pop[i][:]
-                    best_penalty = penalties[i]
-                    best_penalty_occurrences = penalties_occurrences[i]
-
-            historico_fitness.append(best_fit)
-
-            # Gerar nova população
-            while len(new_pop) < tam_pop:
-                p1 = pop[self.torneio(pop, fits)]
-                p2 = pop[self.torneio(pop, fits)]
-
-                if random.random() < pc:
-                    c1, c2 = self.crossover(p1, p2)
-                else:
-                    c1, c2 = p1[:], p2[:]
-
-                if random.random() < pm:
-                    c1 = self.mutacao(c1, colab_ids, 0.1)
-                if random.random() < pm:
-                    c2 = self.mutacao(c2, colab_ids, 0.1)
-
-                new_pop.append(c1)
-                if len(new_pop) < tam_pop:
-                    new_pop.append(c2)
-
-            # Avalia nova população
-            fits_and_penalties = [
-                self.avaliar(ind, tarefas_globais, colaboradores)
-                for ind in new_pop
-            ]
-            new_fits = [item[0] for item in fits_and_penalties]
-            new_penalties = [item[1] for item in fits_and_penalties]
-            new_occurrences = [item[2] for item in fits_and_penalties]
-
-            pop = new_pop
-            fits = new_fits
-            penalties = new_penalties
-            penalties_occurrences = new_occurrences
-
-        # Avaliação final
-        for i, f in enumerate(fits):
-            if f < best_fit:
-                best_fit = f
-                best_sol = pop[i][:]
-                best_penalty = penalties[i]
-                best_penalty_occurrences = penalties_occurrences[i]
-
-        historico_fitness.append(best_fit)
-
-        return best_sol, best_fit, historico_fitness, best_penalty, best_penalty_occurrences
-
-
 class Visualization:
     """
     Classe que agrega funções de geração de componentes de visualização,
@@ -585,16 +172,27 @@ class Visualization:
         return html_code
 
     @staticmethod
-    def gerar_tabela_html(df: pd.DataFrame, duracao_maxima: int) -> str:
+    def gerar_tabela_html(
+            df: pd.DataFrame,
+            duracao_maxima: int,
+            inicio_janela: int = 0,
+            fim_janela: int = None
+    ) -> str:
         """
         Gera código HTML contendo uma tabela que ilustra um gráfico de Gantt simplificado
         para as tarefas listadas no DataFrame.
 
+        As linhas são montadas a partir das colunas inteiras do DataFrame (sem iterar linha a
+        linha com iterrows); para cronogramas grandes, passe apenas as tarefas visíveis
+        (ver filtrar_cronograma) e a janela de dias exibida.
+
         :param df: DataFrame com as colunas necessárias para renderização (Início, Fim, etc.).
         :param duracao_maxima: Duração total (maior valor de fim).
+        :param inicio_janela: Primeiro dia exibido no Gantt.
+        :param fim_janela: Último dia exibido no Gantt (None usa duracao_maxima).
         :return: String HTML que exibe a tabela com barras de Gantt.
         """
-        tabela_html = """
+        cabecalho_html = """
         <style>
             body {
                 font-family: Arial, sans-serif;
@@ -641,41 +239,149 @@ class Visualization:
             <tbody>
         """
 
-        for _, row in df.iterrows():
-            proporcao_inicio = (row["Início (dias)"] / duracao_maxima) * 100
-            proporcao_duracao = (
-                                        (row["Fim (dias)"] - row["Início (dias)"]) / duracao_maxima
-                                ) * 100
-
-            # Calculando a duração como diferença entre Data Início e Data Fim
-            data_inicio = pd.to_datetime(row["Data Início"], format="%d/%m/%Y")
-            data_fim = pd.to_datetime(row["Data Fim"], format="%d/%m/%Y")
-            duracao_dias = (data_fim - data_inicio).days + 1  # +1 para incluir o último dia
-
-            gantt_html = f"""
-            <div class="gantt">
-                <div class="gantt-bar" style="left: {proporcao_inicio}%; width: {proporcao_duracao}%;"></div>
-            </div>
-            """
-
-            tabela_html += f"""
-            <tr>
-                <td>{row['Projeto']}</td>
-                <td>{row['Nome Tarefa']}</td>
-                <td>{row['Data Início']}</td>
-                <td>{row['Data Fim']}</td>
-                <td>{row['Colaborador']}</td>
-                <td>{row['Duração (dias)']}</td>
-                <td>{duracao_dias}</td>
-                <td>{gantt_html}</td>
-            </tr>
-            """
-
-        tabela_html += """
+        fim_janela = duracao_maxima if fim_janela is None else fim_janela
+        largura_janela = max(fim_janela - inicio_janela, 1)
+
+        # Barras recortadas à janela exibida, em % da largura da coluna
+        inicio = df["Início (dias)"].clip(inicio_janela, fim_janela)
+        fim = df["Fim (dias)"].clip(inicio_janela, fim_janela)
+        proporcao_inicio = (inicio - inicio_janela) / largura_janela * 100
+        proporcao_duracao = (fim - inicio) / largura_janela * 100
+
+        # Duração em dias corridos, incluindo o último dia
+        duracao_dias = df["Fim (dias)"] - df["Início (dias)"] + 1
+
+        textos = {
+            coluna: df[coluna].astype(str).map(html.escape).tolist()
+            for coluna in ("Projeto", "Nome Tarefa", "Data Início", "Data Fim", "Colaborador")
+        }
+        linhas = [
+            f"""<tr><td>{projeto}</td><td>{tarefa}</td><td>{data_inicio}</td><td>{data_fim}</td>"""
+            f"""<td>{colaborador}</td><td>{trabalho}</td><td>{duracao}</td>"""
+            f"""<td><div class="gantt"><div class="gantt-bar" style="left: {esquerda}%; """
+            f"""width: {largura}%;"></div></div></td></tr>"""
+            for projeto, tarefa, data_inicio, data_fim, colaborador, trabalho, duracao, esquerda, largura
+            in zip(
+                textos["Projeto"], textos["Nome Tarefa"], textos["Data Início"], textos["Data Fim"],
+                textos["Colaborador"], df["Duração (dias)"].tolist(), duracao_dias.tolist(),
+                proporcao_inicio.tolist(), proporcao_duracao.tolist()
+            )
+        ]
+
+        return cabecalho_html + "\n".join(linhas) + """
             </tbody>
         </table>
         """
-        return tabela_html
+
+    @staticmethod
+    def filtrar_cronograma(
+            df: pd.DataFrame,
+            projetos: list = None,
+            colaboradores: list = None,
+            inicio: int = None,
+            fim: int = None
+    ) -> pd.DataFrame:
+        """
+        Seleciona as tarefas dos projetos e colaboradores informados que se sobrepõem
+        ao intervalo de dias [inicio, fim].
+
+        :param df: Cronograma (ver DataManager.montar_cronograma).
+        :param projetos: Projetos exibidos (None exibe todos).
+        :param colaboradores: Colaboradores exibidos (None exibe todos).
+        :param inicio: Primeiro dia do intervalo (None não limita).
+        :param fim: Último dia do intervalo (None não limita).
+        :return: DataFrame filtrado.
+        """
+        mascara = pd.Series(True, index=df.index)
+        if projetos is not None:
+            mascara &= df["Projeto"].isin(projetos)
+        if colaboradores is not None:
+            mascara &= df["Colaborador"].isin(colaboradores)
+        if inicio is not None:
+            mascara &= df["Fim (dias)"] >= inicio
+        if fim is not None:
+            mascara &= df["Início (dias)"] <= fim
+        return df[mascara]
+
+    @staticmethod
+    def gerar_eventos_calendario(df: pd.DataFrame, ref_date: datetime.date, cores: dict) -> list:
+        """
+        Converte as tarefas do cronograma em eventos do FullCalendar.
+
+        :param df: Cronograma (já filtrado com as tarefas a exibir).
+        :param ref_date: Data de referência (dia 0) do cronograma.
+        :param cores: Cor de cada projeto.
+        :return: Lista de eventos.
+        """
+        ref = pd.Timestamp(ref_date)
+        inicios = (ref + pd.to_timedelta(df["Início (dias)"], unit="D")).dt.strftime("%Y-%m-%d")
+        # O fim do evento no FullCalendar é exclusivo
+        fins = (ref + pd.to_timedelta(df["Fim (dias)"] + 1, unit="D")).dt.strftime("%Y-%m-%d")
+
+        return [
+            {
+                "title": f"{tarefa} - {colaborador}",
+                "start": inicio,
+                "end": fim,
+                "color": cores.get(projeto, "#999999"),
+                "extendedProps": {
+                    "projeto": projeto,
+                    "tarefa": tarefa,
+                    "colaborador": colaborador,
+                    "duracao": duracao,
+                    "dataInicio": data_inicio,
+                    "dataFim": data_fim
+                }
+            }
+            for projeto, tarefa, colaborador, duracao, data_inicio, data_fim, inicio, fim in zip(
+                df["Projeto"].tolist(), df["Nome Tarefa"].tolist(), df["Colaborador"].tolist(),
+                df["Duração (dias)"].tolist(), df["Data Início"].tolist(), df["Data Fim"].tolist(),
+                inicios.tolist(), fins.tolist()
+            )
+        ]
+
+
+class ExecucaoGA:
+    """
+    Execução do Algoritmo Genético em uma thread de segundo plano, para que a interface
+    acompanhe o progresso geração a geração e possa cancelar a execução.
+    """
+
+    def __init__(self, ga: GeneticAlgorithm, funcao, tarefas_globais: list, colaboradores: list,
+                 n_gen: int):
+        """
+        :param ga: Instância do GeneticAlgorithm usada na execução (guarda as estatísticas).
+        :param funcao: Método do AG já com os parâmetros da execução (functools.partial),
+            chamado com ao_progredir e cancelamento.
+        :param tarefas_globais: Tarefas globais do problema.
+        :param colaboradores: Colaboradores do problema.
+        :param n_gen: Número de gerações solicitado.
+        """
+        self.ga = ga
+        self.funcao = funcao
+        self.tarefas_globais = tarefas_globais
+        self.colaboradores = colaboradores
+        self.n_gen = n_gen
+        self.progresso = []
+        self.cancelamento = threading.Event()
+        self.resultado = None
+        self.erro = None
+        self.thread = threading.Thread(target=self._executar, daemon=True)
+
+    def _executar(self):
+        try:
+            self.resultado = self.funcao(
+                ao_progredir=self.progresso.append, cancelamento=self.cancelamento
+            )
+        except Exception as erro:
+            self.erro = erro
+
+    def iniciar(self):
+        self.thread.start()
+
+    @property
+    def em_andamento(self) -> bool:
+        return self.thread.is_alive()
 
 
 class App:
@@ -692,6 +398,196 @@ class App:
         self.ga = GeneticAlgorithm()
         self.vis = Visualization()
 
+    @staticmethod
+    def selecionar_periodo(container, ref_date: datetime.date, duracao_maxima: int, key: str) -> tuple:
+        """
+        Exibe um seletor de período (datas) do cronograma e o converte em dias.
+
+        :param container: Onde exibir o seletor (st ou uma coluna).
+        :param ref_date: Data de referência (dia 0) do cronograma.
+        :param duracao_maxima: Último dia do cronograma.
+        :param key: Chave do widget.
+        :return: Tupla (primeiro dia, último dia) selecionados.
+        """
+        ultima_data = ref_date + datetime.timedelta(days=max(duracao_maxima, 1))
+        data_inicio, data_fim = container.slider(
+            "Período", min_value=ref_date, max_value=ultima_data, value=(ref_date, ultima_data),
+            format="DD/MM/YYYY", key=key
+        )
+        return (data_inicio - ref_date).days, (data_fim - ref_date).days
+
+    def acompanhar_execucao(self, execucao: ExecucaoGA):
+        """
+        Exibe o progresso de uma execução em andamento (melhor fitness e fitness média por
+        geração, avaliações por segundo e tempo decorrido), atualizando-o até que ela termine.
+        Um botão permite cancelar a execução ao final da geração atual.
+
+        :param execucao: Execução iniciada em segundo plano.
+        """
+        cabecalho = st.empty()
+        cabecalho.subheader("Execução em andamento")
+        area_botao = st.empty()
+        if area_botao.button("Cancelar execução", disabled=execucao.cancelamento.is_set()):
+            execucao.cancelamento.set()
+        if execucao.cancelamento.is_set():
+            area_botao.caption("Cancelando ao final da geração atual...")
+
+        barra = st.progress(0.0)
+        painel = st.empty()
+        exibidos = -1
+
+        while True:
+            terminou = not execucao.em_andamento
+            progresso = list(execucao.progresso)
+            if progresso and len(progresso) != exibidos:
+                exibidos = len(progresso)
+                atual = progresso[-1]
+                barra.progress(
+                    min(1.0, (atual["geracao"] - 1) / max(1, execucao.n_gen)),
+                    text=f"Geração {atual['geracao'] - 1} de {execucao.n_gen}"
+                )
+
+                geracoes = [item["geracao"] for item in progresso]
+                fig = go.Figure()
+                fig.add_trace(go.Scatter(
+                    x=geracoes, y=[item["melhor_fitness"] for item in progresso],
+                    mode='lines', name='Melhor'
+                ))
+                fig.add_trace(go.Scatter(
+                    x=geracoes, y=[item["media_fitness"] for item in progresso],
+                    mode='lines', name='Média', line=dict(dash='dot')
+                ))
+                fig.update_layout(xaxis_title="Gerações", yaxis_title="Fitness", height=350)
+
+                with painel.container():
+                    col_fit, col_vazao, col_tempo = st.columns(3)
+                    col_fit.metric("Melhor fitness", atual["melhor_fitness"])
+                    col_vazao.metric("Avaliações/s", f"{atual['avaliacoes_por_segundo']:,.0f}")
+                    col_tempo.metric("Tempo decorrido", f"{atual['tempo']:.1f} s")
+                    st.plotly_chart(fig, use_container_width=True, key=f"progresso_{exibidos}")
+            if terminou:
+                break
+            time.sleep(0.5)
+
+        barra.empty()
+        area_botao.empty()
+        cabecalho.subheader("Última execução")
+
+    def salvar_resultado(self, execucao: ExecucaoGA):
+        """
+        Monta o cronograma e os detalhes da melhor solução de uma execução concluída
+        e os salva na sessão.
+
+        :param execucao: Execução concluída.
+        """
+        best_ind, best_val, hist_fit, detalhes_penalidades = execucao.resultado
+        ga = execucao.ga
+
+        st.session_state["hist_fit"] = hist_fit
+        st.session_state["historico_ilhas"] = getattr(ga, "historico_ilhas", None)
+        st.session_state["estatisticas"] = ga.estatisticas
+        st.session_state["motivo_parada"] = ga.motivo_parada
+        st.session_state["frente_pareto"] = getattr(ga, "frente_pareto", None)
+        st.session_state["tarefas_replanejadas"] = getattr(ga, "tarefas_replanejadas", None)
+        st.session_state["dados_execucao"] = (execucao.tarefas_globais, execucao.colaboradores)
+        # Ponto de partida de um replanejamento posterior
+        st.session_state["plano_anterior"] = (
+            best_ind, execucao.tarefas_globais, execucao.colaboradores, st.session_state.ref_date
+        )
+        self.exibir_solucao(best_ind, best_val, detalhes_penalidades)
+
+    def exibir_solucao(self, individuo: list, fitness: int, penalidades: dict):
+        """
+        Monta o cronograma e as ocorrências de penalidade de uma solução da última execução
+        e os salva na sessão, para exibição nas abas de resultado.
+
+        :param individuo: Solução (lista de IDs de colaboradores, um por tarefa).
+        :param fitness: Fitness da solução.
+        :param penalidades: Penalidades da solução, por tipo.
+        """
+        tarefas_globais, colaboradores = st.session_state["dados_execucao"]
+        ref_date = st.session_state.ref_date
+
+        # Detalha as penalidades apenas da solução exibida
+        ocorrencias_penalidades = GeneticAlgorithm.explicar_penalidades(
+            individuo, tarefas_globais, colaboradores, ref_date
+        )
+
+        # Reconstrói o cronograma (df_res) com o mesmo escalonador usado na avaliação
+        df_res = self.data_manager.montar_cronograma(
+            individuo, tarefas_globais, colaboradores, ref_date
+        )
+
+        # Salva em sessão (a tabela Gantt é gerada sob demanda, apenas para a página exibida)
+        st.session_state["df_result"] = df_res
+        st.session_state["melhor_fit"] = fitness
+        st.session_state["detalhes_penalidades"] = penalidades
+        st.session_state["ocorrencias_penalidades"] = ocorrencias_penalidades
+
+    def exibir_frente_pareto(self, frente_pareto: list):
+        """
+        Exibe a frente de Pareto da execução multiobjetivo (makespan x penalidades de restrição,
+        com a cor indicando o desequilíbrio de carga) e permite escolher a solução exibida
+        nas demais abas.
+
+        :param frente_pareto: Soluções não dominadas (ver AlgoritmoMultiobjetivo).
+        """
+        st.subheader("Frente de Pareto")
+        df_frente = pd.DataFrame({
+            "Solução": range(1, len(frente_pareto) + 1),
+            "Makespan (dias)": [solucao["makespan"] for solucao in frente_pareto],
+            "Penalidades de restrição": [solucao["restricoes"] for solucao in frente_pareto],
+            "Desequilíbrio de carga": [solucao["desequilibrio"] for solucao in frente_pareto],
+            "Fitness ponderada": [solucao["fitness"] for solucao in frente_pareto],
+        })
+
+        fig = go.Figure(go.Scatter(
+            x=df_frente["Makespan (dias)"],
+            y=df_frente["Penalidades de restrição"],
+            mode='markers',
+            text=df_frente["Solução"],
+            marker=dict(
+                size=10,
+                color=df_frente["Desequilíbrio de carga"],
+                colorscale="Viridis",
+                colorbar=dict(title="Desequilíbrio")
+            ),
+            hovertemplate=(
+                "<b>Solução</b>: %{text}<br>"
+                "<b>Makespan</b>: %{x} dias<br>"
+                "<b>Restrições</b>: %{y}<extra></extra>"
+            )
+        ))
+        fig.update_layout(xaxis_title="Makespan (dias)", yaxis_title="Penalidades de restrição")
+        st.plotly_chart(fig, use_container_width=True)
+        st.dataframe(df_frente, hide_index=True)
+
+        st.selectbox(
+            "Solução exibida nas demais abas",
+            range(len(frente_pareto)),
+            index=None,
+            format_func=lambda i: (
+                f"Solução {i + 1}: makespan {frente_pareto[i]['makespan']}, "
+                f"restrições {frente_pareto[i]['restricoes']}, "
+                f"desequilíbrio {frente_pareto[i]['desequilibrio']:.2f}"
+            ),
+            placeholder="Menor fitness ponderada",
+            key="solucao_pareto",
+            on_change=self.selecionar_solucao_pareto
+        )
+
+    def selecionar_solucao_pareto(self):
+        """
+        Exibe a solução da frente de Pareto escolhida na aba "Pareto".
+        """
+        indice = st.session_state["solucao_pareto"]
+        frente_pareto = st.session_state["frente_pareto"]
+        if indice is None:
+            solucao = min(frente_pareto, key=lambda item: item["fitness"])
+        else:
+            solucao = frente_pareto[indice]
+        self.exibir_solucao(solucao["individuo"], solucao["fitness"], solucao["penalidades"])
+
     def run(self):
         """
         Executa a aplicação Streamlit, construindo a interface e
@@ -702,7 +598,6 @@ class App:
         # Estado inicial (variáveis de sessão)
         if "df_result" not in st.session_state:
             st.info("Execute o algoritmo na barra lateral.")
-            st.session_state["table_result"] = None
             st.session_state["df_result"] = None
             st.session_state["melhor_fit"] = None
             st.session_state["hist_fit"] = None
@@ -713,94 +608,137 @@ class App:
         n_gen = st.sidebar.slider("Número de gerações", 5, 1000, 100)
         pc = st.sidebar.slider("Prob. crossover", 0.0, 1.0, 0.7)
         pm = st.sidebar.slider("Prob. mutação", 0.0, 1.0, 0.3)
+        multiobjetivo = st.sidebar.checkbox(
+            "Multiobjetivo (NSGA-II)", value=False,
+            help="Busca, em uma única execução, a frente de Pareto entre makespan, penalidades "
+                 "de restrição e desequilíbrio de carga. Não usa elitismo, parada por "
+                 "estagnação, processos, ilhas nem checkpoint."
+        )
+        elitismo = st.sidebar.slider(
+            "Elitismo", 0, 10, 1,
+            help="Quantidade dos melhores indivíduos mantidos de uma geração para a outra."
+        )
+        paciencia = st.sidebar.number_input(
+            "Parar após gerações sem melhora", min_value=0, max_value=1000, value=0,
+            help="Encerra a execução quando a melhor fitness não melhora por esse número de gerações (0 desativa)."
+        )
+        restringir_elegiveis = st.sidebar.checkbox(
+            "Sortear apenas colaboradores elegíveis", value=True,
+            help="A população inicial e a mutação usam apenas colaboradores com as habilidades e o cargo da tarefa."
+        )
+        tempo_limite = st.sidebar.number_input(
+            "Tempo limite (s)", min_value=0, max_value=3600, value=0,
+            help="Encerra a execução após esse tempo, em segundos (0 desativa)."
+        )
+        processos = st.sidebar.number_input(
+            "Processos (avaliação)", min_value=1, max_value=os.cpu_count() or 1, value=1,
+            help="Quantidade de processos usados para avaliar a população em paralelo."
+        )
+        n_ilhas = st.sidebar.number_input(
+            "Ilhas", min_value=1, max_value=16, value=1, disabled=multiobjetivo,
+            help="Quantidade de subpopulações (modelo de ilhas); cada ilha tem o tamanho de população acima."
+        )
+        intervalo_migracao = st.sidebar.slider(
+            "Migração a cada (gerações)", 1, 100, 10, disabled=n_ilhas == 1
+        )
+        caminho_checkpoint = st.sidebar.text_input(
+            "Arquivo de checkpoint", "", disabled=n_ilhas > 1 or multiobjetivo,
+            help="Grava periodicamente o estado da execução nesse arquivo (.npz); vazio desativa. "
+                 "Disponível apenas com uma única ilha."
+        )
+        intervalo_checkpoint = st.sidebar.number_input(
+            "Checkpoint a cada (gerações)", min_value=1, max_value=1000, value=10,
+            disabled=n_ilhas > 1 or not caminho_checkpoint
+        )
+        retomar = st.sidebar.checkbox(
+            "Retomar do checkpoint", value=False, disabled=n_ilhas > 1 or not caminho_checkpoint,
+            help="Continua a execução a partir do checkpoint, até o número de gerações acima."
+        )
         st.sidebar.date_input("Data de referência", datetime.date(2025, 1, 1), key="ref_date")
+        plano_anterior = st.session_state.get("plano_anterior")
+        replanejar = st.sidebar.checkbox(
+            "Replanejar a partir da última solução", value=False,
+            disabled=plano_anterior is None or multiobjetivo or n_ilhas > 1,
+            help="Parte da melhor solução da última execução e otimiza primeiro as tarefas afetadas "
+                 "por mudanças nos dados (ausências, novas etapas). Não usa ilhas nem checkpoint."
+        )
 
         # Gera dados
-        colaboradores, projetos = self.data_manager.gerar_dados()
+        colaboradores, projetos = self.data_manager.gerar_dados(st.session_state.ref_date)
         project_colors = {proj["nome"]: proj["color"] for proj in projetos}
 
-        if st.sidebar.button("Executar"):
+        execucao = st.session_state.get("execucao")
+        em_andamento = execucao is not None and execucao.em_andamento
+
+        if st.sidebar.button("Executar", disabled=em_andamento):
             # Monta tarefas globais
             tarefas_globais, colaboradores = self.data_manager.montar_tarefas_globais(
                 colaboradores, projetos
             )
 
-            # Executa Algoritmo Genético
-            best_ind, best_val, hist_fit, detalhes_penalidades, ocorrencias_penalidades = self.ga.algoritmo_genetico(
-                tam_pop, n_gen, pc, pm, tarefas_globais, colaboradores
-            )
+            # Executa Algoritmo Genético em segundo plano
+            ga = self.ga
+            if replanejar and plano_anterior is not None:
+                ga = Replanejador()
+                solucao_anterior, tarefas_anteriores, colaboradores_anteriores, ref_date_anterior = plano_anterior
+                funcao = functools.partial(
+                    ga.replanejar,
+                    solucao_anterior, tarefas_anteriores, colaboradores_anteriores,
+                    tam_pop, n_gen, pc, pm, tarefas_globais, colaboradores,
+                    ref_date=st.session_state.ref_date,
+                    deslocamento=(st.session_state.ref_date - ref_date_anterior).days,
+                    elitismo=elitismo, paciencia=paciencia or None, tempo_limite=tempo_limite or None,
+                    restringir_elegiveis=restringir_elegiveis
+                )
+            elif multiobjetivo:
+                ga = AlgoritmoMultiobjetivo()
+                funcao = functools.partial(
+                    ga.algoritmo_genetico_nsga2,
+                    tam_pop, n_gen, pc, pm, tarefas_globais, colaboradores,
+                    ref_date=st.session_state.ref_date, restringir_elegiveis=restringir_elegiveis,
+                    tempo_limite=tempo_limite or None
+                )
+            elif n_ilhas > 1:
+                funcao = functools.partial(
+                    self.ga.algoritmo_genetico_ilhas,
+                    n_ilhas, tam_pop, n_gen, pc, pm, tarefas_globais, colaboradores,
+                    intervalo_migracao, processos=processos, ref_date=st.session_state.ref_date,
+                    elitismo=elitismo, paciencia=paciencia or None, tempo_limite=tempo_limite or None,
+                    restringir_elegiveis=restringir_elegiveis
+                )
+            else:
+                funcao = functools.partial(
+                    self.ga.algoritmo_genetico,
+                    tam_pop, n_gen, pc, pm, tarefas_globais, colaboradores, processos=processos,
+                    ref_date=st.session_state.ref_date, elitismo=elitismo, paciencia=paciencia or None,
+                    tempo_limite=tempo_limite or None, restringir_elegiveis=restringir_elegiveis,
+                    caminho_checkpoint=caminho_checkpoint or None,
+                    intervalo_checkpoint=intervalo_checkpoint, retomar=retomar
+                )
+            execucao = ExecucaoGA(ga, funcao, tarefas_globais, colaboradores, n_gen)
+            execucao.iniciar()
+            st.session_state["execucao"] = execucao
 
-            # Reconstrói o cronograma final (df_res)
-            project_end = {}
-            rows = []
-            for i, tsk in enumerate(tarefas_globais):
-                cid = best_ind[i]
-                colab = next(c for c in colaboradores if c["id"] == cid)
-                duracao = tsk["duracao_dias"]
+        if execucao is not None:
+            # Acompanha a execução até o fim (a cada nova interação o acompanhamento é retomado)
+            self.acompanhar_execucao(execucao)
+            del st.session_state["execucao"]
 
-                fim_colab = max(
-                    [r["Fim (dias)"] + 1 for r in rows if r["Colaborador"] == colab["nome"]] or [0]
-                )
-                fim_proj = project_end.get(tsk["projeto"], 0)
-
-                start = max(fim_colab, fim_proj)
-                while start in colab["ausencias"] or (
-                        st.session_state.ref_date + datetime.timedelta(days=start)
-                ).weekday() >= 5:
-                    start += 1
-
-                end = start
-                duracao_restante = duracao
-                while duracao_restante > 0:
-
-                    if end not in colab["ausencias"] and (
-                            st.session_state.ref_date + datetime.timedelta(days=end)
-                    ).weekday() < 5:
-                        duracao_restante -= 1
-                    end += 1
-
-                project_end[tsk["projeto"]] = end
-
-                start_date = (
-                        st.session_state.ref_date + datetime.timedelta(days=start)
-                ).strftime("%d/%m/%Y")
-                end_date = (
-                        st.session_state.ref_date + datetime.timedelta(days=end - 1)  # -1 para incluir o último dia
-                ).strftime("%d/%m/%Y")
-
-                # Adicionar ao cronograma
-                rows.append({
-                    "Projeto": tsk["projeto"],
-                    "Nome Tarefa": tsk["nome"],
-                    "Início (dias)": start,
-                    "Data Início": start_date,
-                    "Fim (dias)": end - 1,  # -1 para refletir o último dia de trabalho
-                    "Data Fim": end_date,
-                    "Colaborador": colab["nome"],
-                    "Duração (dias)": duracao,
-                })
-
-            df_res = pd.DataFrame(rows)
-            duracao_maxima = df_res["Fim (dias)"].max()
-
-            # Gera tabela Gantt em HTML
-            tabela_html = self.vis.gerar_tabela_html(df_res, duracao_maxima)
-
-            # Salva em sessão
-            st.session_state["df_result"] = df_res
-            st.session_state["table_result"] = tabela_html
-            st.session_state["melhor_fit"] = best_val
-            st.session_state["hist_fit"] = hist_fit
-            st.session_state["detalhes_penalidades"] = detalhes_penalidades
-            st.session_state["ocorrencias_penalidades"] = ocorrencias_penalidades
+            if execucao.erro is not None:
+                st.error(f"Erro na execução do algoritmo: {execucao.erro}")
+            else:
+                self.salvar_resultado(execucao)
 
         df_result = st.session_state["df_result"]
 
+
         # Exibe resultados
         if df_result is not None:
-            tab_data, tab_fitness, tab_conflicts, tab_gant, tab_calendar = st.tabs(
-                ["Dados", "Fitness", "Conflitos", "Gant", "Calendário"]
-            )
+            frente_pareto = st.session_state.get("frente_pareto")
+            nomes_abas = ["Dados", "Fitness", "Conflitos", "Gant", "Calendário"]
+            if frente_pareto:
+                nomes_abas.append("Pareto")
+            tab_data, tab_fitness, tab_conflicts, tab_gant, tab_calendar, *tab_pareto = st.tabs(nomes_abas)
 
             with tab_data:
                 st.subheader("Projetos")
@@ -835,8 +773,48 @@ class App:
                     })
                 st.table(pd.DataFrame(df_colaboradores))
 
+            ref_date = st.session_state.ref_date
+            duracao_maxima = int(df_result["Fim (dias)"].max())
+            projetos_unicos = sorted(df_result["Projeto"].unique())
+            colabs_unicos = sorted(df_result["Colaborador"].unique())
+
             with tab_gant:
-                components.html(st.session_state["table_result"], height=600, scrolling=True)
+                col_proj, col_periodo = st.columns(2)
+                filtro_proj_gantt = col_proj.multiselect(
+                    "Projetos", projetos_unicos, default=projetos_unicos, key="gantt_projetos"
+                )
+                inicio_gantt, fim_gantt = self.selecionar_periodo(
+                    col_periodo, ref_date, duracao_maxima, "gantt_periodo"
+                )
+
+                df_gantt = self.vis.filtrar_cronograma(
+                    df_result, filtro_proj_gantt, inicio=inicio_gantt, fim=fim_gantt
+                )
+                if df_gantt.empty:
+                    st.info("Nenhuma tarefa nos filtros selecionados.")
+                else:
+                    col_tamanho, col_pagina = st.columns(2)
+                    tamanho_pagina = col_tamanho.selectbox(
+                        "Tarefas por página", [50, 100, 250, 500], index=1, key="gantt_tamanho_pagina"
+                    )
+                    paginas = math.ceil(len(df_gantt) / tamanho_pagina)
+                    if st.session_state.get("gantt_pagina", 1) > paginas:
+                        # Os filtros reduziram a quantidade de páginas
+                        st.session_state["gantt_pagina"] = paginas
+                    pagina = col_pagina.number_input(
+                        "Página", min_value=1, max_value=paginas, value=1, key="gantt_pagina"
+                    )
+                    inicio_pagina = (pagina - 1) * tamanho_pagina
+                    df_pagina = df_gantt.iloc[inicio_pagina:inicio_pagina + tamanho_pagina]
+                    st.caption(
+                        f"Tarefas {inicio_pagina + 1}–{inicio_pagina + len(df_pagina)} "
+                        f"de {len(df_gantt)} (página {pagina} de {paginas})"
+                    )
+
+                    tabela_html = self.vis.gerar_tabela_html(
+                        df_pagina, duracao_maxima, inicio_gantt, fim_gantt
+                    )
+                    components.html(tabela_html, height=600, scrolling=True)
 
             with tab_conflicts:
                 st.subheader("Resumo das Penalidades")
@@ -887,6 +865,21 @@ class App:
                             )
                         )
                     )
+                    for k, historico in enumerate(st.session_state.get("historico_ilhas") or [], start=1):
+                        fig.add_trace(
+                            go.Scatter(
+                                x=df_fit["Geração"],
+                                y=historico,
+                                mode='lines',
+                                name=f'Ilha {k}',
+                                line=dict(width=1, dash='dot'),
+                                hovertemplate=(
+                                    f"<b>Ilha {k}</b><br>"
+                                    "<b>Geração</b>: %{x}<br>"
+                                    "<b>Fitness</b>: %{y}<extra></extra>"
+                                )
+                            )
+                        )
                     fig.update_layout(
                         xaxis_title="Gerações",
                         yaxis_title="Fitness",
@@ -901,10 +894,36 @@ class App:
                 if "melhor_fit" in st.session_state:
                     st.write(f"**Melhor Fitness**: {st.session_state['melhor_fit']}")
 
+                motivo_parada = st.session_state.get("motivo_parada")
+                geracoes_executadas = len(st.session_state["hist_fit"] or [1]) - 1
+                if motivo_parada == "estagnacao":
+                    st.caption(f"Execução encerrada por estagnação após {geracoes_executadas} gerações.")
+                elif motivo_parada == "tempo":
+                    st.caption(f"Execução encerrada pelo tempo limite após {geracoes_executadas} gerações.")
+                elif motivo_parada == "cancelado":
+                    st.caption(f"Execução cancelada após {geracoes_executadas} gerações.")
+
+                tarefas_replanejadas = st.session_state.get("tarefas_replanejadas")
+                if tarefas_replanejadas is not None:
+                    st.caption(
+                        f"Replanejamento a partir da solução anterior: {len(tarefas_replanejadas)} "
+                        "tarefa(s) afetada(s) pelas mudanças nos dados."
+                    )
+
+                if "estatisticas" in st.session_state:
+                    estatisticas = st.session_state["estatisticas"]
+                    col_aval, col_pais, col_acertos, col_falhas = st.columns(4)
+                    col_aval.metric("Avaliações calculadas", estatisticas["avaliacoes"])
+                    col_pais.metric("Herdadas dos pais", estatisticas["reaproveitados_pais"])
+                    col_acertos.metric("Acertos do cache", estatisticas.get("cache_acertos", 0))
+                    col_falhas.metric("Falhas do cache", estatisticas.get("cache_falhas", 0))
+
+            if frente_pareto:
+                with tab_pareto[0]:
+                    self.exibir_frente_pareto(frente_pareto)
+
             with tab_calendar:
                 st.subheader("Filtros")
-                projetos_unicos = sorted(df_result["Projeto"].unique())
-                colabs_unicos = sorted(df_result["Colaborador"].unique())
 
                 filtro_proj = st.multiselect(
                     "Projeto", projetos_unicos, default=projetos_unicos
@@ -912,46 +931,33 @@ class App:
                 filtro_colab = st.multiselect(
                     "Colaborador", colabs_unicos, default=colabs_unicos
                 )
+                inicio_cal, fim_cal = self.selecionar_periodo(
+                    st, ref_date, duracao_maxima, "calendario_periodo"
+                )
 
-                df_result_filtered = df_result[
-                    (df_result["Projeto"].isin(filtro_proj)) &
-                    (df_result["Colaborador"].isin(filtro_colab))
-                    ]
+                df_result_filtered = self.vis.filtrar_cronograma(
+                    df_result, filtro_proj, filtro_colab, inicio_cal, fim_cal
+                )
 
                 st.subheader("Calendário de Alocação (Filtrado)")
                 if df_result_filtered.empty:
                     st.info("Nenhuma tarefa nos filtros selecionados.")
                 else:
-                    eventos = []
-                    for _, row in df_result_filtered.iterrows():
-                        ini_dias = row["Início (dias)"]
-                        fim_dias = row["Fim (dias)"]
-
-                        start_date = (
-                                st.session_state.ref_date + datetime.timedelta(days=ini_dias)
-                        ).strftime("%Y-%m-%d")
-                        end_date = (
-                                st.session_state.ref_date + datetime.timedelta(days=fim_dias + 1)
-                        ).strftime("%Y-%m-%d")
-
-                        # # Adicionar ao calendário
-                        eventos.append({
-                            "title": f"{row['Nome Tarefa']} - {row['Colaborador']}",
-                            "start": start_date,
-                            "end": end_date,
-                            "color": project_colors.get(row["Projeto"], "#999999"),
-                            "extendedProps": {
-                                "projeto": row["Projeto"],
-                                "tarefa": row["Nome Tarefa"],
-                                "colaborador": row["Colaborador"],
-                                "duracao": row["Duração (dias)"],
-                                "dataInicio": row["Data Início"],
-                                "dataFim": row["Data Fim"]
-                            }
-                        })
+                    if len(df_result_filtered) > LIMITE_EVENTOS_CALENDARIO:
+                        st.warning(
+                            f"{len(df_result_filtered)} tarefas no período; exibindo as "
+                            f"{LIMITE_EVENTOS_CALENDARIO} primeiras. Reduza o período ou os "
+                            "filtros para ver as demais."
+                        )
+                        df_result_filtered = df_result_filtered.nsmallest(
+                            LIMITE_EVENTOS_CALENDARIO, "Início (dias)"
+                        )
+                    eventos = self.vis.gerar_eventos_calendario(
+                        df_result_filtered, ref_date, project_colors
+                    )
 
                     cal_html = self.vis.gerar_fullcalendar_html(
-                        eventos, st.session_state.ref_date.strftime("%Y-%m-%d")
+                        eventos, (ref_date + datetime.timedelta(days=inicio_cal)).strftime("%Y-%m-%d")
                     )
                     components.html(cal_html, height=1000, scrolling=True)
 
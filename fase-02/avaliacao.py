@@ -0,0 +1,256 @@
+import datetime
+import math
+import multiprocessing
+from collections import OrderedDict
+
+import numpy as np
+
+from escalonador import Escalonador
+from problema import ProblemaCompilado
+
+
+class AvaliadorLote:
+    """
+    Avaliador vetorizado (NumPy) que calcula a fitness de uma população inteira de uma só vez.
+
+    Todas as estruturas que não dependem do indivíduo (compatibilidade de habilidades e cargos,
+    calendário de dias úteis de cada colaborador) vêm do ProblemaCompilado ou são pré-calculadas
+    uma única vez na construção. A avaliação percorre as tarefas em ordem, mas cada passo processa todos os
+    indivíduos da população simultaneamente.
+    """
+
+    PENALIDADE_HABILIDADE = 10_000
+    PENALIDADE_CARGO = 10_000
+    PENALIDADE_AUSENCIA = 500
+
+    def __init__(
+            self,
+            problema: ProblemaCompilado,
+            peso_makespan: int = 200,
+            ref_date: datetime.date = None
+    ):
+        """
+        Prepara o mapeamento de IDs e o calendário de dias úteis.
+
+        :param problema: Problema compilado (ver ProblemaCompilado).
+        :param peso_makespan: Fator de multiplicação para o makespan no cálculo da fitness.
+        :param ref_date: Data de referência do Escalonador (se informada, pula fins de semana).
+        """
+        self.peso_makespan = peso_makespan
+        self.num_tarefas = problema.num_tarefas
+
+        # Mapeamento ID do colaborador -> índice (0..n-1)
+        self.ids = problema.colaborador_ids
+        self._ordem_ids = np.argsort(self.ids, kind="stable")
+        self._ids_ordenados = self.ids[self._ordem_ids]
+
+        # Matrizes (tarefa x colaborador) de compatibilidade
+        self.compat_habilidades = problema.compat_habilidades
+        self.compat_cargo = problema.compat_cargo
+
+        # Regras de posicionamento das tarefas no tempo
+        self.escalonador = Escalonador(problema, ref_date)
+        self.num_projetos = problema.num_projetos
+
+    def indices_colaboradores(self, populacao: np.ndarray) -> np.ndarray:
+        """
+        Converte uma matriz de IDs de colaboradores em índices internos (0..n-1).
+
+        :param populacao: Matriz (tam_pop, num_tarefas) com IDs de colaboradores.
+        :return: Matriz de mesmo formato com os índices dos colaboradores.
+        """
+        posicoes = np.searchsorted(self._ids_ordenados, populacao)
+        return self._ordem_ids[posicoes]
+
+    def avaliar(self, populacao: np.ndarray) -> tuple:
+        """
+        Avalia todos os indivíduos da população, com as mesmas regras de GeneticAlgorithm.pontuar.
+
+        As sobreposições por colaborador e por projeto não são recalculadas: como cada tarefa só
+        começa após o fim da última tarefa do colaborador e do projeto, elas são sempre zero.
+
+        :param populacao: Matriz (tam_pop, num_tarefas) com IDs de colaboradores.
+        :return: Tupla (fitness, penalidades), com um array por tipo de penalidade.
+        """
+        populacao = np.asarray(populacao, dtype=np.int64).reshape(-1, self.num_tarefas)
+        idx = self.indices_colaboradores(populacao)
+        tam_pop = idx.shape[0]
+        linhas = np.arange(tam_pop)
+        tarefas = np.arange(self.num_tarefas)
+
+        hab_incorretas = (~self.compat_habilidades[tarefas, idx]).sum(axis=1)
+        cargo_incorreto = (~self.compat_cargo[tarefas, idx]).sum(axis=1)
+
+        fim_colab = np.zeros((tam_pop, len(self.ids)), dtype=np.int64)
+        fim_projeto = np.zeros((tam_pop, self.num_projetos), dtype=np.int64)
+        ausencias = np.zeros(tam_pop, dtype=np.int64)
+        makespan = np.zeros(tam_pop, dtype=np.int64)
+
+        for i in range(self.num_tarefas):
+            c = idx[:, i]
+            p = self.escalonador.projeto_tarefa[i]
+
+            inicio = np.maximum(fim_projeto[:, p], fim_colab[linhas, c])
+
+            inicio, fim, com_ausencia = self.escalonador.agendar_lote(i, c, inicio)
+            ausencias += com_ausencia
+
+            fim_projeto[:, p] = fim
+            fim_colab[linhas, c] = fim
+            np.maximum(makespan, fim, out=makespan)
+
+        penalidades = {
+            "habilidades_incorretas": hab_incorretas * self.PENALIDADE_HABILIDADE,
+            "cargo_incorreto": cargo_incorreto * self.PENALIDADE_CARGO,
+            "ausencias": ausencias * self.PENALIDADE_AUSENCIA,
+            "sobreposicoes_colaborador": np.zeros(tam_pop, dtype=np.int64),
+            "sobreposicoes_projeto": np.zeros(tam_pop, dtype=np.int64),
+            "makespan": makespan * self.peso_makespan,
+        }
+        fitness = sum(penalidades.values())
+        return fitness, penalidades
+
+
+# Avaliador de cada processo do pool, criado uma única vez na inicialização do worker
+_avaliador_worker = None
+
+
+def _inicializar_worker(
+        problema: ProblemaCompilado,
+        peso_makespan: int,
+        ref_date: datetime.date
+):
+    """
+    Inicializa um processo do pool, construindo o seu AvaliadorLote. O problema compilado
+    é enviado uma única vez por processo, e não a cada indivíduo avaliado.
+    """
+    global _avaliador_worker
+    _avaliador_worker = AvaliadorLote(problema, peso_makespan, ref_date)
+
+
+def _avaliar_bloco(bloco: np.ndarray) -> tuple:
+    """
+    Avalia um bloco da população no processo atual.
+    """
+    return _avaliador_worker.avaliar(bloco)
+
+
+class AvaliadorParalelo:
+    """
+    Avaliador que divide a população em blocos e avalia cada bloco, de forma vetorizada,
+    em um pool de processos. Possui a mesma interface de AvaliadorLote.avaliar.
+
+    A ordem dos resultados é preservada, de modo que a execução continua determinística
+    para uma mesma semente. Deve ser encerrado com fechar() (ou usado com 'with').
+    """
+
+    def __init__(
+            self,
+            problema: ProblemaCompilado,
+            processos: int,
+            tamanho_bloco: int = None,
+            peso_makespan: int = 200,
+            ref_date: datetime.date = None
+    ):
+        """
+        Inicia o pool de processos.
+
+        :param problema: Problema compilado (ver ProblemaCompilado).
+        :param processos: Quantidade de processos do pool.
+        :param tamanho_bloco: Indivíduos por bloco; se None, divide a população igualmente
+            entre os processos.
+        :param peso_makespan: Fator de multiplicação para o makespan no cálculo da fitness.
+        :param ref_date: Data de referência do Escalonador (se informada, pula fins de semana).
+        """
+        self.processos = processos
+        self.tamanho_bloco = tamanho_bloco
+        self.num_tarefas = problema.num_tarefas
+
+        # 'spawn' evita copiar via fork as threads do servidor do Streamlit
+        contexto = multiprocessing.get_context("spawn")
+        self._pool = contexto.Pool(
+            processes=processos,
+            initializer=_inicializar_worker,
+            initargs=(problema, peso_makespan, ref_date),
+        )
+
+    def avaliar(self, populacao: np.ndarray) -> tuple:
+        """
+        Avalia todos os indivíduos da população, distribuindo os blocos entre os processos.
+
+        :param populacao: Matriz (tam_pop, num_tarefas) com IDs de colaboradores.
+        :return: Tupla (fitness, penalidades), com um array por tipo de penalidade.
+        """
+        populacao = np.asarray(populacao, dtype=np.int64).reshape(-1, self.num_tarefas)
+        tamanho_bloco = max(self.tamanho_bloco or math.ceil(len(populacao) / self.processos), 1)
+        blocos = [populacao[i:i + tamanho_bloco] for i in range(0, len(populacao), tamanho_bloco)]
+
+        resultados = self._pool.map(_avaliar_bloco, blocos)
+
+        fitness = np.concatenate([fit for fit, _ in resultados])
+        penalidades = {
+            chave: np.concatenate([pens[chave] for _, pens in resultados])
+            for chave in resultados[0][1]
+        }
+        return fitness, penalidades
+
+    def fechar(self):
+        """
+        Encerra o pool de processos.
+        """
+        self._pool.close()
+        self._pool.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fechar()
+
+
+class CacheFitness:
+    """
+    Cache LRU limitado de avaliações, indexado pelo cromossomo (tupla de IDs de colaboradores).
+
+    Mantém contadores de acertos e falhas para acompanhar o quanto da busca é repetida.
+    """
+
+    def __init__(self, capacidade: int = 10_000):
+        """
+        :param capacidade: Quantidade máxima de cromossomos mantidos; os menos usados
+            recentemente são descartados primeiro.
+        """
+        self.capacidade = capacidade
+        self.acertos = 0
+        self.falhas = 0
+        self._itens = OrderedDict()
+
+    def obter(self, chave: tuple):
+        """
+        Busca a avaliação de um cromossomo, atualizando os contadores.
+
+        :param chave: Cromossomo como tupla.
+        :return: Valor armazenado, ou None se o cromossomo não estiver no cache.
+        """
+        valor = self._itens.get(chave)
+        if valor is None:
+            self.falhas += 1
+            return None
+        self._itens.move_to_end(chave)
+        self.acertos += 1
+        return valor
+
+    def inserir(self, chave: tuple, valor):
+        """
+        Armazena a avaliação de um cromossomo, descartando o item menos usado se necessário.
+
+        :param chave: Cromossomo como tupla.
+        :param valor: Avaliação a armazenar (por exemplo, (fitness, penalidades)).
+        """
+        self._itens[chave] = valor
+        self._itens.move_to_end(chave)
+        while len(self._itens) > self.capacidade:
+            self._itens.popitem(last=False)
+
+    def __len__(self):
+        return len(self._itens)
@@ -0,0 +1,302 @@
+import argparse
+import datetime
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+from alocacao import DataManager, GeneticAlgorithm
+from avaliacao import AvaliadorLote
+from escalonador import Escalonador
+from gerador import GeradorInstancias
+from problema import ProblemaCompilado
+
+REF_DATE = datetime.date(2025, 1, 1)
+
+# Tamanhos das instâncias sintéticas: colaboradores, projetos, etapas e densidade de ausências.
+# Como cada etapa gerada costuma ter um único colaborador elegível, a instância precisa de
+# colaboradores de sobra para que a restrição aos elegíveis não reduza a população a cópias
+# de um mesmo indivíduo
+INSTANCIAS = {
+    "pequena": {"n_colaboradores": 30, "n_projetos": 8, "n_etapas": 5, "densidade_ausencias": 0.05},
+    "media": {"n_colaboradores": 50, "n_projetos": 30, "n_etapas": 6, "densidade_ausencias": 0.05},
+    "grande": {"n_colaboradores": 200, "n_projetos": 150, "n_etapas": 8, "densidade_ausencias": 0.1},
+}
+
+# Métricas em que um valor menor é melhor (nas demais, vazões, um valor maior é melhor)
+MENOR_MELHOR = {"tempo", "pico_memoria_mb", "melhor_fitness"}
+
+# Vazões dos operadores abaixo deste tempo por item (em segundos) são micro-medições, mais
+# sujeitas a ruído, e são comparadas com a tolerância de micro-medições
+LIMITE_MICRO = 1e-3
+
+# Métricas apenas informativas, exibidas na comparação mas nunca apontadas como regressão
+INFORMATIVAS = {"taxa_acerto_cache"}
+
+
+class Benchmark:
+    """
+    Mede o desempenho do Algoritmo Genético em instâncias sintéticas (ver GeradorInstancias):
+    vazão da avaliação (GeneticAlgorithm.avaliar, pontuar e AvaliadorLote) e dos operadores
+    genéticos, além do tempo, dos indivíduos gerados por segundo, da taxa de acerto do cache
+    de fitness, do pico de memória e da fitness final de uma execução completa.
+    """
+
+    @staticmethod
+    def carregar_instancia(nome: str, semente: int = 0) -> tuple:
+        """
+        Gera a instância sintética 'nome' (ver INSTANCIAS) e a carrega pelo mesmo caminho da
+        aplicação (DataManager.gerar_dados e montar_tarefas_globais).
+
+        :param nome: Nome da instância.
+        :param semente: Semente do gerador da instância.
+        :return: Tupla (tarefas_globais, colaboradores).
+        """
+        colaboradores, projetos = GeradorInstancias.gerar(
+            **INSTANCIAS[nome], ref_date=REF_DATE, semente=semente
+        )
+        data_manager = DataManager()
+        with tempfile.TemporaryDirectory() as diretorio:
+            caminhos = GeradorInstancias.salvar(colaboradores, projetos, diretorio)
+            colaboradores, projetos = data_manager.gerar_dados(
+                REF_DATE, *caminhos, diretorio_cache=None
+            )
+        return data_manager.montar_tarefas_globais(colaboradores, projetos)
+
+    @staticmethod
+    def _ciclo(populacao: list):
+        """
+        Percorre cópias dos indivíduos da população indefinidamente (os operadores podem
+        alterar o indivíduo recebido).
+        """
+        while True:
+            for individuo in populacao:
+                yield individuo[:]
+
+    @staticmethod
+    def vazao(funcao, itens_por_chamada: int = 1, tempo_minimo: float = 0.2, rodadas: int = 5) -> float:
+        """
+        Itens processados por segundo por 'funcao': ela é chamada repetidamente por pelo menos
+        tempo_minimo segundos em cada rodada, e a melhor rodada é a considerada.
+
+        :param funcao: Função sem argumentos a medir.
+        :param itens_por_chamada: Itens (avaliações, operações) processados em cada chamada.
+        :param tempo_minimo: Duração mínima de cada rodada, em segundos.
+        :param rodadas: Quantidade de rodadas.
+        :return: Itens por segundo.
+        """
+        melhor = 0.0
+        for _ in range(rodadas):
+            chamadas = 0
+            inicio = time.perf_counter()
+            while True:
+                funcao()
+                chamadas += 1
+                decorrido = time.perf_counter() - inicio
+                if decorrido >= tempo_minimo:
+                    break
+            melhor = max(melhor, chamadas * itens_por_chamada / decorrido)
+        return melhor
+
+    @staticmethod
+    def medir_instancia(
+            nome: str,
+            tam_pop: int = 50,
+            n_gen: int = 50,
+            semente: int = 0
+    ) -> dict:
+        """
+        Executa todas as medições em uma instância.
+
+        :param nome: Nome da instância (ver INSTANCIAS).
+        :param tam_pop: Tamanho da população da execução completa e dos lotes avaliados.
+        :param n_gen: Número de gerações da execução completa.
+        :param semente: Semente da instância e do gerador aleatório.
+        :return: Dicionário com as métricas da instância.
+        """
+        tarefas_globais, colaboradores = Benchmark.carregar_instancia(nome, semente)
+        ga = GeneticAlgorithm()
+        problema = ProblemaCompilado(tarefas_globais, colaboradores)
+        escalonador = Escalonador(problema, REF_DATE)
+        avaliador = AvaliadorLote(problema, ref_date=REF_DATE)
+        colab_ids = problema.colaborador_ids.tolist()
+        elegiveis = problema.elegiveis()
+
+        random.seed(semente)
+        populacao = ga.populacao_inicial(tam_pop, problema.num_tarefas, colab_ids, elegiveis)
+        matriz = np.asarray(populacao)
+        fitnesses, _ = ga.avaliar_populacao(populacao, avaliador)
+        individuos = Benchmark._ciclo(populacao)
+
+        metricas = {
+            "avaliar": Benchmark.vazao(lambda: ga.avaliar(
+                next(individuos), tarefas_globais, colaboradores, REF_DATE
+            )),
+            "pontuar": Benchmark.vazao(lambda: ga.pontuar(
+                next(individuos), problema, escalonador=escalonador
+            )),
+            "avaliar_lote": Benchmark.vazao(lambda: avaliador.avaliar(matriz), tam_pop),
+            "torneio": Benchmark.vazao(lambda: ga.torneio(populacao, fitnesses)),
+            "crossover": Benchmark.vazao(lambda: ga.crossover(next(individuos), next(individuos))),
+            "mutacao": Benchmark.vazao(lambda: ga.mutacao(next(individuos), colab_ids, 0.1, elegiveis)),
+        }
+
+        # Execução completa: tempo (melhor de 3) sem o tracemalloc, que a deixa mais lenta,
+        # e memória com ele
+        tempo = float("inf")
+        for _ in range(3):
+            random.seed(semente)
+            inicio = time.perf_counter()
+            _, melhor_fitness, _, _ = ga.algoritmo_genetico(
+                tam_pop, n_gen, 0.7, 0.3, tarefas_globais, colaboradores, ref_date=REF_DATE, elitismo=1
+            )
+            tempo = min(tempo, time.perf_counter() - inicio)
+        consultas_cache = ga.estatisticas["cache_acertos"] + ga.estatisticas["cache_falhas"]
+        taxa_acerto_cache = ga.estatisticas["cache_acertos"] / consultas_cache if consultas_cache else 0.0
+
+        random.seed(semente)
+        tracemalloc.start()
+        ga.algoritmo_genetico(
+            tam_pop, n_gen, 0.7, 0.3, tarefas_globais, colaboradores, ref_date=REF_DATE, elitismo=1
+        )
+        _, pico = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        metricas["execucao"] = {
+            "tempo": tempo,
+            # Indivíduos gerados, e não simulados: os herdados dos pais e os encontrados no
+            # cache não são avaliados, e contá-los de fora premiaria uma população estagnada
+            "individuos_por_segundo": tam_pop * n_gen / tempo,
+            "taxa_acerto_cache": taxa_acerto_cache,
+            "pico_memoria_mb": pico / 2 ** 20,
+            "melhor_fitness": melhor_fitness,
+        }
+        return metricas
+
+    @staticmethod
+    def executar(instancias: list, tam_pop: int = 50, n_gen: int = 50, semente: int = 0) -> dict:
+        """
+        Mede as instâncias informadas.
+
+        :param instancias: Nomes das instâncias (ver INSTANCIAS).
+        :param tam_pop: Tamanho da população.
+        :param n_gen: Número de gerações da execução completa.
+        :param semente: Semente das instâncias e do gerador aleatório.
+        :return: Dicionário com o ambiente, os parâmetros e os resultados por instância.
+        """
+        return {
+            "ambiente": {
+                "python": platform.python_version(),
+                "numpy": np.__version__,
+                "plataforma": platform.platform(),
+                "processador": platform.processor() or platform.machine(),
+                "data": datetime.date.today().isoformat(),
+            },
+            "parametros": {"populacao": tam_pop, "geracoes": n_gen, "semente": semente},
+            "resultados": {
+                nome: Benchmark.medir_instancia(nome, tam_pop, n_gen, semente) for nome in instancias
+            },
+        }
+
+    @staticmethod
+    def comparar(atual: dict, baseline: dict, tolerancia: float = 0.3, tolerancia_micro: float = 0.6) -> list:
+        """
+        Compara os resultados com uma baseline.
+
+        :param atual: Resultado de Benchmark.executar.
+        :param baseline: Resultado gravado anteriormente (mesmo formato).
+        :param tolerancia: Piora relativa aceita antes de apontar uma regressão (0.3 = 30%);
+            a fitness final é comparada sem tolerância, e as métricas informativas (ver
+            INFORMATIVAS) nunca são apontadas como regressão.
+        :param tolerancia_micro: Piora relativa aceita nas vazões de menos de LIMITE_MICRO
+            segundos por item, em que poucos microssegundos de ruído já mudam bastante o valor.
+        :return: Lista de linhas (instancia, metrica, baseline, atual, variacao, regressao),
+            em que variacao é a mudança relativa (positiva = melhora).
+        """
+        linhas = []
+        for instancia, metricas in atual["resultados"].items():
+            base = baseline.get("resultados", {}).get(instancia)
+            if base is None:
+                continue
+            planas = {**metricas, **metricas["execucao"]}
+            planas_base = {**base, **base.get("execucao", {})}
+            for metrica, valor in planas.items():
+                if metrica == "execucao" or metrica not in planas_base:
+                    continue
+                valor_base = planas_base[metrica]
+                if metrica in MENOR_MELHOR:
+                    variacao = (valor_base - valor) / valor_base if valor_base else 0.0
+                else:
+                    variacao = (valor - valor_base) / valor_base if valor_base else 0.0
+                if metrica == "melhor_fitness":
+                    limite = 0.0
+                elif metrica in metricas and valor_base and 1 / valor_base < LIMITE_MICRO:
+                    limite = tolerancia_micro
+                else:
+                    limite = tolerancia
+                regressao = metrica not in INFORMATIVAS and variacao < -limite
+                linhas.append((instancia, metrica, valor_base, valor, variacao, regressao))
+        return linhas
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Mede o desempenho do Algoritmo Genético em instâncias sintéticas e compara "
+                    "com a baseline."
+    )
+    parser.add_argument("--instancias", nargs="+", choices=list(INSTANCIAS), default=list(INSTANCIAS),
+                        help="Instâncias medidas")
+    parser.add_argument("--populacao", type=int, default=50, help="Tamanho da população")
+    parser.add_argument("--geracoes", type=int, default=50,
+                        help="Número de gerações da execução completa")
+    parser.add_argument("--semente", type=int, default=0, help="Semente das instâncias e do AG")
+    parser.add_argument("--baseline", default="benchmark_baseline.json",
+                        help="Arquivo da baseline usada na comparação")
+    parser.add_argument("--salvar-baseline", action="store_true",
+                        help="Grava os resultados como a nova baseline, em vez de comparar")
+    parser.add_argument("--tolerancia", type=float, default=0.3,
+                        help="Piora relativa aceita antes de apontar uma regressão")
+    parser.add_argument("--tolerancia-micro", type=float, default=0.6,
+                        help="Piora relativa aceita nas vazões de menos de 1 ms por item")
+
+    args = parser.parse_args()
+
+    resultado = Benchmark.executar(args.instancias, args.populacao, args.geracoes, args.semente)
+
+    if args.salvar_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(resultado, f, ensure_ascii=False, indent=2)
+        print(f"Baseline gravada em {args.baseline}")
+        sys.exit(0)
+
+    if not os.path.exists(args.baseline):
+        print(json.dumps(resultado, ensure_ascii=False, indent=2))
+        print(f"Baseline {args.baseline} não encontrada; use --salvar-baseline para criá-la.")
+        sys.exit(0)
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    if baseline.get("parametros") != resultado["parametros"]:
+        print("Aviso: parâmetros diferentes dos da baseline; as métricas não são comparáveis.")
+
+    linhas = Benchmark.comparar(resultado, baseline, args.tolerancia, args.tolerancia_micro)
+    print(f"{'Instância':<10} {'Métrica':<24} {'Baseline':>14} {'Atual':>14} {'Variação':>9}")
+    for instancia, metrica, valor_base, valor, variacao, regressao in linhas:
+        print(
+            f"{instancia:<10} {metrica:<24} {valor_base:>14,.2f} {valor:>14,.2f} {variacao:>+8.1%}"
+            + ("  REGRESSÃO" if regressao else "")
+        )
+
+    regressoes = [linha for linha in linhas if linha[5]]
+    if regressoes:
+        print(
+            f"{len(regressoes)} regressão(ões) acima da tolerância de {args.tolerancia:.0%} "
+            f"({args.tolerancia_micro:.0%} nas micro-medições)."
+        )
+        sys.exit(1)
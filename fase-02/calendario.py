@@ -0,0 +1,249 @@
+import bisect
+import datetime
+
+import numpy as np
+
+
+class CalendarioTrabalho:
+    """
+    Índice de dias úteis de cada colaborador, usado para posicionar as tarefas no tempo.
+
+    Os dias são contados a partir da data de referência (dia 0). Um dia é útil para o
+    colaborador quando não é uma ausência e, se pular_fins_de_semana for True, não cai
+    em um sábado ou domingo.
+
+    Em vez de avançar dia a dia, as consultas usam as ausências ordenadas de cada colaborador
+    (em "dias de semana", isto é, descontando os fins de semana): o número de dias úteis antes
+    de um dia é o número de dias de semana menos as ausências anteriores, e o k-ésimo dia útil
+    é encontrado com uma busca binária. Cada consulta custa O(log a), onde a é o número de
+    ausências do colaborador.
+    """
+
+    # Deslocamento que separa as ausências de cada colaborador nos arrays concatenados
+    _DESLOCAMENTO = 1 << 40
+
+    # Memória máxima (em bytes) das tabelas densas; acima dela, as consultas usam buscas binárias
+    LIMITE_TABELAS = 16 << 20
+
+    __slots__ = (
+        "pular_fins_de_semana", "indice", "_parcial", "_posicao", "_ausencias", "_chaves",
+        "_ausencias_np", "_chaves_np", "_inicio_np", "_parcial_np", "_posicao_np",
+        "_usar_tabelas", "_horizonte", "_max_ausencias", "_disponiveis_antes", "_dia_util",
+    )
+
+    def __init__(
+            self,
+            colaborador_ids: list,
+            ausencias: list,
+            ref_date: datetime.date = None,
+            pular_fins_de_semana: bool = False,
+            usar_tabelas: bool = False
+    ):
+        """
+        :param colaborador_ids: IDs dos colaboradores.
+        :param ausencias: Para cada colaborador, os dias de ausência (já convertidos em dias).
+        :param ref_date: Data de referência (dia 0); obrigatória para pular fins de semana.
+        :param pular_fins_de_semana: Se True, sábados e domingos não são dias úteis.
+        :param usar_tabelas: Se True, as consultas vetorizadas usam tabelas (colaborador x dia)
+            com acesso direto em vez de buscas binárias. As tabelas cobrem apenas os dias já
+            consultados e são ampliadas sob demanda, até LIMITE_TABELAS.
+        """
+        self.pular_fins_de_semana = pular_fins_de_semana
+        self.indice = {cid: i for i, cid in enumerate(colaborador_ids)}
+
+        if pular_fins_de_semana:
+            primeiro_dia_semana = ref_date.weekday()
+            dias_semana = [
+                d for d in range(7) if (primeiro_dia_semana + d) % 7 < 5
+            ]
+            # Dias de semana em [0, r) para r = 0..6, e posição do n-ésimo dia de semana
+            self._parcial = [sum(1 for d in dias_semana if d < r) for r in range(7)]
+            self._posicao = dias_semana
+        else:
+            self._parcial = None
+            self._posicao = None
+
+        # Por colaborador: ausências (em dias de semana) ordenadas e chaves ausencia[j] - j
+        self._ausencias = []
+        self._chaves = []
+        for dias_ausencia in ausencias:
+            dias_semana = sorted({
+                self.dia_semana(d) for d in dias_ausencia
+                if d >= 0 and self.eh_dia_de_semana(d)
+            })
+            self._ausencias.append(dias_semana)
+            self._chaves.append([a - j for j, a in enumerate(dias_semana)])
+
+        # Versões concatenadas para as consultas vetorizadas
+        deslocamentos = [ci * self._DESLOCAMENTO for ci in range(len(colaborador_ids))]
+        self._ausencias_np = np.array(
+            [d + desloc for aus, desloc in zip(self._ausencias, deslocamentos) for d in aus],
+            dtype=np.int64
+        )
+        self._chaves_np = np.array(
+            [k + desloc for chaves, desloc in zip(self._chaves, deslocamentos) for k in chaves],
+            dtype=np.int64
+        )
+        self._inicio_np = np.cumsum(
+            [0] + [len(aus) for aus in self._ausencias[:-1]], dtype=np.int64
+        )
+        self._parcial_np = None if self._parcial is None else np.array(self._parcial, dtype=np.int64)
+        self._posicao_np = None if self._posicao is None else np.array(self._posicao, dtype=np.int64)
+
+        # Tabelas densas das consultas vetorizadas, montadas e ampliadas sob demanda
+        self._usar_tabelas = usar_tabelas
+        self._horizonte = 0
+        self._max_ausencias = max((len(aus) for aus in self._ausencias), default=0)
+        self._disponiveis_antes = None
+        self._dia_util = None
+
+    def _montar_tabelas(self, horizonte: int):
+        """
+        Pré-calcula, em "dias de semana" e para os dias em [0, horizonte), a quantidade de
+        dias úteis antes de cada dia e o k-ésimo dia útil de cada colaborador.
+        """
+        num_colab = len(self._ausencias)
+        ausente = np.zeros((num_colab, horizonte), dtype=bool)
+        for ci, ausencias in enumerate(self._ausencias):
+            ausente[ci, ausencias[:bisect.bisect_left(ausencias, horizonte)]] = True
+
+        # disponiveis_antes[c, d]: quantidade de dias úteis em [0, d)
+        self._disponiveis_antes = np.zeros((num_colab, horizonte + 1), dtype=np.int32)
+        np.cumsum(~ausente, axis=1, out=self._disponiveis_antes[:, 1:])
+
+        # dia_util[c, k]: k-ésimo dia útil do colaborador (preenchido com o horizonte)
+        self._dia_util = np.full((num_colab, horizonte + 1), horizonte, dtype=np.int32)
+        for ci in range(num_colab):
+            dias_livres = np.flatnonzero(~ausente[ci])
+            self._dia_util[ci, :len(dias_livres)] = dias_livres
+        self._horizonte = horizonte
+
+    def _preparar_tabelas(self, semana: np.ndarray, duracao: int) -> bool:
+        """
+        Garante que as tabelas cubram as consultas de agendar_lote: o k-ésimo dia útil
+        consultado é no máximo o último dia de semana do início somado à duração e às
+        ausências do colaborador. O horizonte é ao menos dobrado a cada ampliação.
+
+        :return: False se as tabelas necessárias ultrapassariam LIMITE_TABELAS; nesse caso,
+            elas são descartadas e as consultas passam a usar buscas binárias.
+        """
+        necessario = int(semana.max()) + max(duracao, 1) + self._max_ausencias
+        if necessario <= self._horizonte:
+            return True
+
+        horizonte = max(necessario, 2 * self._horizonte)
+        # Duas tabelas int32 de (colaboradores x horizonte + 1)
+        if 8 * len(self._ausencias) * (horizonte + 1) > self.LIMITE_TABELAS:
+            self._usar_tabelas = False
+            self._disponiveis_antes = None
+            self._dia_util = None
+            return False
+        self._montar_tabelas(horizonte)
+        return True
+
+    def eh_dia_de_semana(self, dia: int) -> bool:
+        """
+        Indica se o dia não cai em um fim de semana (sempre True se os fins de semana não são pulados).
+        """
+        if not self.pular_fins_de_semana:
+            return True
+        return dia % 7 in self._posicao
+
+    def dia_semana(self, dia):
+        """
+        Quantidade de dias de semana em [0, dia), isto é, o índice do dia em "dias de semana".
+        Aceita inteiros ou arrays NumPy.
+        """
+        if not self.pular_fins_de_semana:
+            return dia
+        if isinstance(dia, np.ndarray):
+            return dia // 7 * 5 + self._parcial_np[dia % 7]
+        return dia // 7 * 5 + self._parcial[dia % 7]
+
+    def dia_calendario(self, dia_semana):
+        """
+        Inverso de dia_semana: converte o índice em "dias de semana" no dia do calendário.
+        Aceita inteiros ou arrays NumPy.
+        """
+        if not self.pular_fins_de_semana:
+            return dia_semana
+        if isinstance(dia_semana, np.ndarray):
+            return dia_semana // 5 * 7 + self._posicao_np[dia_semana % 5]
+        return dia_semana // 5 * 7 + self._posicao[dia_semana % 5]
+
+    def agendar(self, cid: int, inicio_minimo: int, duracao: int) -> tuple:
+        """
+        Posiciona uma tarefa no primeiro dia útil a partir de inicio_minimo, terminando
+        após 'duracao' dias úteis do colaborador.
+
+        :param cid: ID do colaborador.
+        :param inicio_minimo: Primeiro dia em que a tarefa pode começar.
+        :param duracao: Duração da tarefa em dias úteis.
+        :return: Tupla (inicio, fim), com fim exclusivo.
+        """
+        ci = self.indice[cid]
+        ausencias = self._ausencias[ci]
+        chaves = self._chaves[ci]
+
+        semana = self.dia_semana(inicio_minimo)
+        k = semana - bisect.bisect_left(ausencias, semana)  # dias úteis antes do início
+        inicio = self.dia_calendario(k + bisect.bisect_right(chaves, k))
+        if duracao <= 0:
+            return inicio, inicio
+
+        ultimo = k + duracao - 1
+        fim = self.dia_calendario(ultimo + bisect.bisect_right(chaves, ultimo)) + 1
+        return inicio, fim
+
+    def ausencias_entre(self, cid: int, inicio: int, fim: int) -> int:
+        """
+        Quantidade de ausências do colaborador (em dias de semana) no intervalo [inicio, fim).
+        """
+        ausencias = self._ausencias[self.indice[cid]]
+        return (
+            bisect.bisect_left(ausencias, self.dia_semana(fim))
+            - bisect.bisect_left(ausencias, self.dia_semana(inicio))
+        )
+
+    def agendar_lote(self, ci: np.ndarray, inicio_minimo: np.ndarray, duracao: int) -> tuple:
+        """
+        Versão vetorizada de agendar, para vários colaboradores (por índice) de uma vez.
+
+        :param ci: Array com o índice (0..n-1) do colaborador de cada linha.
+        :param inicio_minimo: Array com o primeiro dia possível de cada linha.
+        :param duracao: Duração da tarefa em dias úteis.
+        :return: Tupla (inicio, fim) de arrays, com fim exclusivo.
+        """
+        semana = self.dia_semana(inicio_minimo)
+
+        if self._usar_tabelas and semana.size and self._preparar_tabelas(semana, duracao):
+            k = self._disponiveis_antes[ci, semana]
+
+            def k_esimo_dia_util(n):
+                return self.dia_calendario(self._dia_util[ci, n])
+        else:
+            deslocamento = ci * self._DESLOCAMENTO
+            anteriores = (
+                np.searchsorted(self._ausencias_np, semana + deslocamento, side="left")
+                - self._inicio_np[ci]
+            )
+            k = semana - anteriores
+
+            def k_esimo_dia_util(n):
+                posicao = np.searchsorted(self._chaves_np, n + deslocamento, side="right")
+                return self.dia_calendario(n + posicao - self._inicio_np[ci])
+
+        inicio = k_esimo_dia_util(k)
+        if duracao <= 0:
+            return inicio, inicio
+        return inicio, k_esimo_dia_util(k + duracao - 1) + 1
+
+    def ausencias_entre_lote(self, ci: np.ndarray, inicio: np.ndarray, fim: np.ndarray) -> np.ndarray:
+        """
+        Versão vetorizada de ausencias_entre.
+        """
+        deslocamento = ci * self._DESLOCAMENTO
+        return (
+            np.searchsorted(self._ausencias_np, self.dia_semana(fim) + deslocamento, side="left")
+            - np.searchsorted(self._ausencias_np, self.dia_semana(inicio) + deslocamento, side="left")
+        )
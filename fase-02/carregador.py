@@ -0,0 +1,298 @@
+import datetime
+import glob
+import hashlib
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+# Campos obrigatórios e tipos esperados de cada registro
+CAMPOS_COLABORADOR = {"id": int, "nome": str, "habilidades": list, "cargo": str, "ausencias": list}
+CAMPOS_PROJETO = {"nome": str, "color": str, "etapas": list}
+CAMPOS_ETAPA = {
+    "id": int, "nome": str, "duracao_dias": int, "habilidades_necessarias": list,
+    "cargo_necessario": str,
+}
+LISTAS_DE_TEXTO = {"habilidades", "ausencias", "habilidades_necessarias"}
+
+# Separador das listas (habilidades, ausências) dentro de uma célula CSV
+SEPARADOR_LISTA = ";"
+
+# Incrementar quando o formato dos dados em cache mudar
+VERSAO_CACHE = 2
+
+
+class CarregadorDados:
+    """
+    Leitura de colaboradores e projetos a partir de arquivos JSON, JSON Lines (.jsonl, um
+    registro por linha) ou CSV, com validação do esquema, conversão vetorizada das datas de
+    ausência e cache em disco do resultado, indexado pelo hash do conteúdo dos arquivos.
+
+    Nos arquivos CSV, habilidades e ausências ficam em uma única célula, separadas por ';'.
+    O CSV de colaboradores tem as colunas id, nome, habilidades, cargo e ausencias; o de
+    projetos tem uma linha por etapa, com as colunas projeto, color, id, nome, duracao_dias,
+    habilidades_necessarias e cargo_necessario.
+    """
+
+    @staticmethod
+    def ler_registros(caminho: str, tipo: str) -> list:
+        """
+        Lê os registros de um arquivo, de acordo com a extensão (.json, .jsonl ou .csv).
+
+        :param caminho: Caminho do arquivo.
+        :param tipo: "colaboradores" ou "projetos" (define o formato das linhas do CSV).
+        :return: Lista de registros no formato dos arquivos JSON.
+        """
+        extensao = os.path.splitext(caminho)[1].lower()
+        if extensao == ".jsonl":
+            with open(caminho, "r", encoding="utf-8") as f:
+                return [json.loads(linha) for linha in f if linha.strip()]
+        if extensao == ".csv":
+            return CarregadorDados._ler_csv(caminho, tipo)
+        with open(caminho, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    @staticmethod
+    def _ler_csv(caminho: str, tipo: str) -> list:
+        """
+        Lê um CSV exportado (ver CarregadorDados) e o converte em registros no formato JSON.
+        """
+        df = pd.read_csv(caminho, dtype=str, keep_default_na=False)
+
+        def lista(valor: str) -> list:
+            return [item.strip() for item in valor.split(SEPARADOR_LISTA) if item.strip()]
+
+        def inteiro(valor: str):
+            try:
+                return int(valor)
+            except ValueError:
+                return valor
+
+        if tipo == "colaboradores":
+            return [
+                {
+                    "id": inteiro(linha.get("id", "")),
+                    "nome": linha.get("nome", ""),
+                    "habilidades": lista(linha.get("habilidades", "")),
+                    "cargo": linha.get("cargo", ""),
+                    "ausencias": lista(linha.get("ausencias", "")),
+                }
+                for linha in df.to_dict(orient="records")
+            ]
+
+        projetos = {}
+        for linha in df.to_dict(orient="records"):
+            projeto = projetos.setdefault(linha.get("projeto", ""), {
+                "nome": linha.get("projeto", ""),
+                "color": linha.get("color", ""),
+                "etapas": [],
+            })
+            projeto["etapas"].append({
+                "id": inteiro(linha.get("id", "")),
+                "nome": linha.get("nome", ""),
+                "duracao_dias": inteiro(linha.get("duracao_dias", "")),
+                "habilidades_necessarias": lista(linha.get("habilidades_necessarias", "")),
+                "cargo_necessario": linha.get("cargo_necessario", ""),
+            })
+        return list(projetos.values())
+
+    @staticmethod
+    def _erros_campos(registro, campos: dict, descricao: str) -> list:
+        """
+        Verifica a presença e o tipo dos campos de um registro.
+        """
+        if not isinstance(registro, dict):
+            return [f"{descricao}: esperado um objeto"]
+        erros = []
+        for campo, tipo in campos.items():
+            if campo not in registro:
+                erros.append(f"{descricao}: campo '{campo}' ausente")
+            elif not isinstance(registro[campo], tipo) or isinstance(registro[campo], bool):
+                erros.append(f"{descricao}: campo '{campo}' deveria ser {tipo.__name__}")
+            elif campo in LISTAS_DE_TEXTO and not all(isinstance(item, str) for item in registro[campo]):
+                erros.append(f"{descricao}: campo '{campo}' deveria conter apenas textos")
+        return erros
+
+    @staticmethod
+    def validar_colaboradores(colaboradores: list, origem: str):
+        """
+        Valida o esquema dos colaboradores (campos, tipos e IDs únicos).
+
+        :param colaboradores: Registros lidos (ver ler_registros).
+        :param origem: Nome do arquivo, usado nas mensagens de erro.
+        :raises ValueError: Se algum registro for inválido.
+        """
+        if not isinstance(colaboradores, list):
+            raise ValueError(f"{origem}: esperada uma lista de colaboradores")
+        erros = []
+        ids = set()
+        for i, colab in enumerate(colaboradores, start=1):
+            erros_registro = CarregadorDados._erros_campos(colab, CAMPOS_COLABORADOR, f"registro {i}")
+            if not erros_registro:
+                if colab["id"] in ids:
+                    erros_registro.append(f"registro {i}: id {colab['id']} repetido")
+                ids.add(colab["id"])
+            erros.extend(erros_registro)
+        CarregadorDados._lancar_erros(erros, origem)
+
+    @staticmethod
+    def validar_projetos(projetos: list, origem: str):
+        """
+        Valida o esquema dos projetos e das etapas (campos, tipos, durações não negativas,
+        nomes de projeto e IDs de etapa únicos).
+
+        :param projetos: Registros lidos (ver ler_registros).
+        :param origem: Nome do arquivo, usado nas mensagens de erro.
+        :raises ValueError: Se algum registro for inválido.
+        """
+        if not isinstance(projetos, list):
+            raise ValueError(f"{origem}: esperada uma lista de projetos")
+        erros = []
+        nomes = set()
+        for i, proj in enumerate(projetos, start=1):
+            erros_projeto = CarregadorDados._erros_campos(proj, CAMPOS_PROJETO, f"projeto {i}")
+            erros.extend(erros_projeto)
+            if erros_projeto:
+                continue
+            if proj["nome"] in nomes:
+                erros.append(f"projeto {i}: nome '{proj['nome']}' repetido")
+            nomes.add(proj["nome"])
+
+            ids_etapas = set()
+            for j, etapa in enumerate(proj["etapas"], start=1):
+                descricao = f"projeto {i} ('{proj['nome']}'), etapa {j}"
+                erros_etapa = CarregadorDados._erros_campos(etapa, CAMPOS_ETAPA, descricao)
+                if not erros_etapa:
+                    if etapa["duracao_dias"] < 0:
+                        erros_etapa.append(f"{descricao}: duração negativa")
+                    if etapa["id"] in ids_etapas:
+                        erros_etapa.append(f"{descricao}: id {etapa['id']} repetido")
+                    ids_etapas.add(etapa["id"])
+                erros.extend(erros_etapa)
+        CarregadorDados._lancar_erros(erros, origem)
+
+    @staticmethod
+    def _lancar_erros(erros: list, origem: str, limite: int = 10):
+        if erros:
+            detalhes = "\n".join(erros[:limite])
+            if len(erros) > limite:
+                detalhes += f"\n... e mais {len(erros) - limite} erro(s)"
+            raise ValueError(f"{origem}: dados inválidos\n{detalhes}")
+
+    @staticmethod
+    def converter_ausencias(colaboradores: list, ref_date: datetime.date, origem: str = "colaboradores"):
+        """
+        Converte, de uma só vez, as datas de ausência (AAAA-MM-DD) de todos os colaboradores
+        em dias relativos a ref_date. Os colaboradores são alterados no lugar.
+
+        :param colaboradores: Colaboradores já validados.
+        :param ref_date: Data de referência (dia 0).
+        :param origem: Nome do arquivo, usado nas mensagens de erro.
+        :raises ValueError: Se alguma data for inválida.
+        """
+        textos = [data for colab in colaboradores for data in colab["ausencias"]]
+        datas = pd.to_datetime(pd.Series(textos, dtype=object), format="%Y-%m-%d", errors="coerce")
+        invalidas = datas.isna().to_numpy()
+        if invalidas.any():
+            exemplos = ", ".join(repr(textos[i]) for i in np.flatnonzero(invalidas)[:5])
+            raise ValueError(f"{origem}: datas de ausência inválidas: {exemplos}")
+
+        dias = (
+            datas.to_numpy().astype("datetime64[D]") - np.datetime64(ref_date, "D")
+        ).astype(np.int64).tolist()
+        inicio = 0
+        for colab in colaboradores:
+            fim = inicio + len(colab["ausencias"])
+            colab["ausencias"] = dias[inicio:fim]
+            inicio = fim
+
+    @staticmethod
+    def chave_cache(caminhos: tuple, ref_date: datetime.date) -> str:
+        """
+        Chave do cache: hash SHA-256 do conteúdo dos arquivos, da data de referência e da
+        versão do formato do cache.
+        """
+        resumo = hashlib.sha256(f"{VERSAO_CACHE}|{ref_date.isoformat()}".encode())
+        for caminho in caminhos:
+            resumo.update(os.path.splitext(caminho)[1].lower().encode())
+            with open(caminho, "rb") as f:
+                for bloco in iter(lambda: f.read(1 << 20), b""):
+                    resumo.update(bloco)
+        return resumo.hexdigest()
+
+    @staticmethod
+    def chave_entrada(caminhos: tuple) -> str:
+        """
+        Identificação dos arquivos de entrada (pelos caminhos absolutos, não pelo conteúdo),
+        usada para manter no cache apenas a versão mais recente de cada entrada.
+        """
+        caminhos_absolutos = "\0".join(os.path.abspath(caminho) for caminho in caminhos)
+        return hashlib.sha256(caminhos_absolutos.encode()).hexdigest()[:16]
+
+    @staticmethod
+    def _remover_entradas_antigas(diretorio_cache: str, entrada: str, caminho_atual: str):
+        """
+        Remove do cache as versões anteriores da mesma entrada (outro conteúdo ou outra data
+        de referência) e os arquivos dos formatos anteriores, gravados com pickle.
+        """
+        antigos = glob.glob(os.path.join(diretorio_cache, f"{entrada}-*.json"))
+        antigos += glob.glob(os.path.join(diretorio_cache, "*.pkl"))
+        for caminho in antigos:
+            if caminho != caminho_atual:
+                try:
+                    os.remove(caminho)
+                except FileNotFoundError:
+                    # Já removido por outra execução
+                    pass
+
+    @staticmethod
+    def carregar(
+            caminho_colaboradores: str,
+            caminho_projetos: str,
+            ref_date: datetime.date,
+            diretorio_cache: str = None
+    ) -> tuple:
+        """
+        Lê, valida e converte colaboradores e projetos. Se diretorio_cache for informado, o
+        resultado é gravado em disco e reaproveitado enquanto o conteúdo dos arquivos e a data
+        de referência não mudarem. Apenas a versão mais recente de cada par de arquivos é
+        mantida no cache. O cache é gravado em JSON, e não com pickle, para que a leitura de um
+        arquivo adulterado no diretório do cache não execute código.
+
+        :param caminho_colaboradores: Arquivo de colaboradores (.json, .jsonl ou .csv).
+        :param caminho_projetos: Arquivo de projetos (.json, .jsonl ou .csv).
+        :param ref_date: Data de referência (dia 0) usada para converter as ausências em dias.
+        :param diretorio_cache: Diretório do cache em disco (None desativa o cache).
+        :return: Tupla (colaboradores, projetos), com as ausências em dias.
+        :raises ValueError: Se os dados não seguirem o esquema esperado.
+        """
+        caminho_cache = None
+        if diretorio_cache:
+            caminhos = (caminho_colaboradores, caminho_projetos)
+            entrada = CarregadorDados.chave_entrada(caminhos)
+            chave = CarregadorDados.chave_cache(caminhos, ref_date)
+            caminho_cache = os.path.join(diretorio_cache, f"{entrada}-{chave}.json")
+            try:
+                with open(caminho_cache, "r", encoding="utf-8") as f:
+                    colaboradores, projetos = json.load(f)
+                return colaboradores, projetos
+            except FileNotFoundError:
+                pass
+
+        colaboradores = CarregadorDados.ler_registros(caminho_colaboradores, "colaboradores")
+        projetos = CarregadorDados.ler_registros(caminho_projetos, "projetos")
+        CarregadorDados.validar_colaboradores(colaboradores, caminho_colaboradores)
+        CarregadorDados.validar_projetos(projetos, caminho_projetos)
+        CarregadorDados.converter_ausencias(colaboradores, ref_date, caminho_colaboradores)
+
+        if caminho_cache is not None:
+            # Escrita atômica, para que execuções simultâneas não leiam um arquivo incompleto
+            os.makedirs(diretorio_cache, exist_ok=True)
+            temporario = f"{caminho_cache}.{os.getpid()}.tmp"
+            with open(temporario, "w", encoding="utf-8") as f:
+                json.dump([colaboradores, projetos], f, ensure_ascii=False)
+            os.replace(temporario, caminho_cache)
+            CarregadorDados._remover_entradas_antigas(diretorio_cache, entrada, caminho_cache)
+
+        return colaboradores, projetos
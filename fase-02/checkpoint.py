@@ -0,0 +1,90 @@
+import os
+
+import numpy as np
+
+
+class Checkpoint:
+    """
+    Persistência do estado de uma execução do Algoritmo Genético em um arquivo binário
+    compacto (NumPy .npz comprimido), para retomar execuções interrompidas.
+
+    O estado guarda a população avaliada da geração atual (indivíduos, fitness e penalidades),
+    o histórico de fitness, a melhor solução encontrada, o estado do gerador aleatório e a
+    assinatura do problema, de modo que a execução retomada é idêntica à que teria continuado.
+    """
+
+    @staticmethod
+    def salvar(caminho: str, estado: dict):
+        """
+        Grava o estado de forma atômica: o arquivo é escrito ao lado do destino e só então
+        renomeado, para que uma interrupção no meio da escrita não corrompa o checkpoint anterior.
+
+        :param caminho: Caminho do arquivo de checkpoint (.npz).
+        :param estado: Dicionário com as chaves "geracao", "populacao" (tupla com indivíduos,
+            fitnesses e penalidades), "historico_fitness", "melhor" (tupla com solução,
+            fitness e penalidades), "estado_aleatorio" (random.getstate()) e "assinatura".
+        """
+        pop, fits, penalties = estado["populacao"]
+        best_sol, best_fit, best_penalty = estado["melhor"]
+        chaves = list(penalties[0]) if penalties else []
+        versao, estado_mt, gauss = estado["estado_aleatorio"]
+
+        diretorio = os.path.dirname(os.path.abspath(caminho))
+        os.makedirs(diretorio, exist_ok=True)
+        temporario = os.path.join(diretorio, f".{os.path.basename(caminho)}.tmp")
+        with open(temporario, "wb") as f:
+            np.savez_compressed(
+                f,
+                geracao=np.int64(estado["geracao"]),
+                assinatura=np.str_(estado["assinatura"]),
+                populacao=np.asarray(pop, dtype=np.int64),
+                fitness=np.asarray(fits, dtype=np.int64),
+                chaves_penalidades=np.array(chaves, dtype=np.str_),
+                penalidades=np.array(
+                    [[pen[chave] for chave in chaves] for pen in penalties], dtype=np.int64
+                ).reshape(len(penalties), len(chaves)),
+                historico_fitness=np.asarray(estado["historico_fitness"], dtype=np.int64),
+                melhor_solucao=np.asarray(best_sol if best_sol is not None else [], dtype=np.int64),
+                melhor_fitness=np.float64(best_fit),
+                melhor_penalidades=np.array(
+                    [best_penalty.get(chave, 0) for chave in chaves], dtype=np.int64
+                ),
+                aleatorio_versao=np.int64(versao),
+                aleatorio_estado=np.asarray(estado_mt, dtype=np.uint32),
+                aleatorio_gauss=np.float64(np.nan if gauss is None else gauss),
+            )
+        os.replace(temporario, caminho)
+
+    @staticmethod
+    def carregar(caminho: str) -> dict:
+        """
+        Lê um checkpoint gravado por Checkpoint.salvar.
+
+        :param caminho: Caminho do arquivo de checkpoint (.npz).
+        :return: Dicionário no mesmo formato recebido por Checkpoint.salvar.
+        """
+        with np.load(caminho) as dados:
+            chaves = dados["chaves_penalidades"].tolist()
+            penalties = [dict(zip(chaves, linha)) for linha in dados["penalidades"].tolist()]
+            melhor_fitness = float(dados["melhor_fitness"])
+            gauss = float(dados["aleatorio_gauss"])
+
+            return {
+                "geracao": int(dados["geracao"]),
+                "assinatura": str(dados["assinatura"]),
+                "populacao": (
+                    dados["populacao"].tolist(), dados["fitness"].tolist(), penalties
+                ),
+                "historico_fitness": dados["historico_fitness"].tolist(),
+                "melhor": (
+                    dados["melhor_solucao"].tolist() or None,
+                    int(melhor_fitness) if np.isfinite(melhor_fitness) else melhor_fitness,
+                    dict(zip(chaves, dados["melhor_penalidades"].tolist()))
+                    if np.isfinite(melhor_fitness) else {},
+                ),
+                "estado_aleatorio": (
+                    int(dados["aleatorio_versao"]),
+                    tuple(dados["aleatorio_estado"].tolist()),
+                    None if np.isnan(gauss) else gauss,
+                ),
+            }
@@ -0,0 +1,87 @@
+import datetime
+
+import numpy as np
+
+from calendario import CalendarioTrabalho
+from problema import ProblemaCompilado
+
+
+class Escalonador:
+    """
+    Escalonador único do problema: define o início e o fim de cada tarefa para uma alocação
+    de colaboradores. É usado tanto na avaliação do Algoritmo Genético (escalar e vetorizada)
+    quanto na reconstrução do cronograma exibido na interface, de modo que o cronograma
+    mostrado é exatamente o que foi pontuado.
+
+    Regras: as tarefas são processadas na ordem global; cada tarefa começa após o fim da
+    sua tarefa predecessora (a etapa anterior do projeto) e da última tarefa do colaborador,
+    no primeiro dia útil do colaborador, e termina após 'duracao_dias' dias úteis. Com data
+    de referência, sábados e domingos não são dias úteis.
+    """
+
+    __slots__ = (
+        "problema", "num_tarefas", "indice_colaborador", "num_projetos", "projeto_tarefa",
+        "duracoes", "calendario",
+    )
+
+    def __init__(self, problema: ProblemaCompilado, ref_date: datetime.date = None):
+        """
+        :param problema: Problema compilado (ver ProblemaCompilado).
+        :param ref_date: Data de referência (dia 0). Se informada, os fins de semana são pulados.
+        """
+        self.problema = problema
+        self.num_tarefas = problema.num_tarefas
+        self.indice_colaborador = problema.indice_colaborador
+        self.num_projetos = problema.num_projetos
+        self.projeto_tarefa = problema.projeto_tarefa
+        self.duracoes = problema.duracoes
+
+        self.calendario = CalendarioTrabalho(
+            problema.colaborador_ids.tolist(),
+            problema.ausencias,
+            ref_date,
+            pular_fins_de_semana=ref_date is not None,
+            usar_tabelas=True,
+        )
+
+    def escalonar(self, individuo: list) -> tuple:
+        """
+        Calcula o cronograma de um indivíduo em tempo linear no número de tarefas.
+
+        :param individuo: Lista de IDs de colaboradores, um por tarefa.
+        :return: Tupla (inicio, fim) de arrays com um dia por tarefa (fim exclusivo).
+        """
+        fim_colaborador = [0] * len(self.indice_colaborador)
+        inicio = [0] * self.num_tarefas
+        fim = [0] * self.num_tarefas
+
+        predecessoras = self.problema.predecessora.tolist()
+        duracoes = self.duracoes.tolist()
+        for i, cid in enumerate(individuo):
+            ci = self.indice_colaborador[cid]
+            anterior = predecessoras[i]
+            fim_predecessora = fim[anterior] if anterior >= 0 else 0
+            inicio[i], fim[i] = self.calendario.agendar(
+                cid, max(fim_predecessora, fim_colaborador[ci]), duracoes[i]
+            )
+            fim_colaborador[ci] = fim[i]
+
+        return np.array(inicio, dtype=np.int64), np.array(fim, dtype=np.int64)
+
+    def agendar_lote(self, i: int, ci: np.ndarray, inicio_minimo: np.ndarray) -> tuple:
+        """
+        Posiciona a tarefa i para vários indivíduos de uma vez (passo da avaliação vetorizada).
+
+        :param i: Índice da tarefa.
+        :param ci: Índice (0..n-1) do colaborador alocado em cada indivíduo.
+        :param inicio_minimo: Primeiro dia possível em cada indivíduo.
+        :return: Tupla (inicio, fim, com_ausencia) de arrays, onde com_ausencia indica se
+            alguma ausência do colaborador caiu dentro da tarefa.
+        """
+        duracao = self.duracoes[i]
+        inicio, fim = self.calendario.agendar_lote(ci, inicio_minimo, duracao)
+
+        # A tarefa ocupa exatamente 'duracao' dias úteis; qualquer dia de semana a mais
+        # no intervalo é uma ausência do colaborador
+        dias_semana = self.calendario.dia_semana(fim) - self.calendario.dia_semana(inicio)
+        return inicio, fim, dias_semana > duracao
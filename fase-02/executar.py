@@ -0,0 +1,317 @@
+import argparse
+import datetime
+import json
+import os
+import random
+
+import pandas as pd
+
+from alocacao import DataManager, GeneticAlgorithm
+from multiobjetivo import AlgoritmoMultiobjetivo
+from replanejamento import Replanejador
+
+
+def executar(
+        caminho_colaboradores: str,
+        caminho_projetos: str,
+        ref_date: datetime.date,
+        tam_pop: int,
+        n_gen: int,
+        pc: float,
+        pm: float,
+        semente: int = None,
+        processos: int = 1,
+        n_ilhas: int = 1,
+        intervalo_migracao: int = 10,
+        n_migrantes: int = 2,
+        elitismo: int = 1,
+        paciencia: int = None,
+        tempo_limite: float = None,
+        restringir_elegiveis: bool = True,
+        caminho_checkpoint: str = None,
+        intervalo_checkpoint: int = 10,
+        retomar: bool = False,
+        multiobjetivo: bool = False,
+        caminho_replanejamento: str = None,
+        geracoes_locais: int = None
+) -> dict:
+    """
+    Executa o Algoritmo Genético sem a interface Streamlit.
+
+    :param caminho_colaboradores: Caminho do arquivo JSON de colaboradores.
+    :param caminho_projetos: Caminho do arquivo JSON de projetos.
+    :param ref_date: Data de referência (dia 0) do cronograma.
+    :param tam_pop: Tamanho da população.
+    :param n_gen: Número de gerações.
+    :param pc: Probabilidade de crossover.
+    :param pm: Probabilidade de mutação.
+    :param semente: Semente do gerador aleatório, para execuções reprodutíveis.
+    :param processos: Quantidade de processos usados para avaliar a população
+        (ou para evoluir as ilhas).
+    :param n_ilhas: Quantidade de ilhas; acima de 1, usa o modelo de ilhas.
+    :param intervalo_migracao: Gerações entre duas migrações (modelo de ilhas).
+    :param n_migrantes: Indivíduos enviados por ilha em cada migração (modelo de ilhas).
+    :param elitismo: Melhores indivíduos mantidos de uma geração para a outra.
+    :param paciencia: Gerações sem melhora que encerram a execução (None desativa).
+    :param tempo_limite: Tempo máximo de execução, em segundos (None desativa).
+    :param restringir_elegiveis: Se True, sorteia apenas colaboradores elegíveis para cada tarefa.
+    :param caminho_checkpoint: Arquivo onde o estado da execução é gravado periodicamente
+        (apenas com uma única população).
+    :param intervalo_checkpoint: Gerações entre duas gravações do checkpoint.
+    :param retomar: Se True, continua a execução a partir do checkpoint, se ele existir.
+    :param multiobjetivo: Se True, usa o NSGA-II e devolve também a frente de Pareto entre
+        makespan, penalidades de restrição e desequilíbrio de carga.
+    :param caminho_replanejamento: resultado.json de uma execução anterior; se informado, a
+        execução parte da solução gravada nele (ver Replanejador.replanejar).
+    :param geracoes_locais: Gerações em que o replanejamento otimiza apenas as tarefas afetadas
+        pelas mudanças (None usa o padrão de Replanejador.replanejar).
+    :return: Dicionário com o cronograma (DataFrame), a melhor solução, o histórico de
+        fitness (geral e por ilha), as penalidades e as estatísticas da execução.
+    """
+    if semente is not None:
+        random.seed(semente)
+
+    data_manager = DataManager()
+    if multiobjetivo:
+        ga = AlgoritmoMultiobjetivo()
+    elif caminho_replanejamento:
+        ga = Replanejador()
+    else:
+        ga = GeneticAlgorithm()
+
+    colaboradores, projetos = data_manager.gerar_dados(
+        ref_date, caminho_colaboradores, caminho_projetos
+    )
+    tarefas_globais, colaboradores = data_manager.montar_tarefas_globais(colaboradores, projetos)
+
+    if n_ilhas > 1 and caminho_checkpoint:
+        raise ValueError("O checkpoint está disponível apenas para execuções com uma única população.")
+    if multiobjetivo and (n_ilhas > 1 or caminho_checkpoint):
+        raise ValueError("O modo multiobjetivo não suporta ilhas nem checkpoint.")
+    if caminho_replanejamento and (multiobjetivo or n_ilhas > 1 or caminho_checkpoint):
+        raise ValueError("O replanejamento não suporta o modo multiobjetivo, ilhas nem checkpoint.")
+
+    frente_pareto = []
+    if multiobjetivo:
+        best_ind, best_val, hist_fit, detalhes_penalidades = ga.algoritmo_genetico_nsga2(
+            tam_pop, n_gen, pc, pm, tarefas_globais, colaboradores, ref_date=ref_date,
+            restringir_elegiveis=restringir_elegiveis, tempo_limite=tempo_limite
+        )
+        historico_ilhas = []
+        frente_pareto = ga.frente_pareto
+    elif caminho_replanejamento:
+        solucao_anterior, tarefas_anteriores, colaboradores_anteriores, ref_date_anterior = carregar_plano(
+            caminho_replanejamento
+        )
+        best_ind, best_val, hist_fit, detalhes_penalidades = ga.replanejar(
+            solucao_anterior, tarefas_anteriores, colaboradores_anteriores, tam_pop, n_gen, pc, pm,
+            tarefas_globais, colaboradores, ref_date=ref_date,
+            deslocamento=(ref_date - ref_date_anterior).days, geracoes_locais=geracoes_locais,
+            elitismo=elitismo, paciencia=paciencia, tempo_limite=tempo_limite,
+            restringir_elegiveis=restringir_elegiveis
+        )
+        historico_ilhas = []
+    elif n_ilhas > 1:
+        best_ind, best_val, hist_fit, detalhes_penalidades = ga.algoritmo_genetico_ilhas(
+            n_ilhas, tam_pop, n_gen, pc, pm, tarefas_globais, colaboradores, intervalo_migracao,
+            n_migrantes, processos=processos, ref_date=ref_date, elitismo=elitismo,
+            paciencia=paciencia, tempo_limite=tempo_limite, restringir_elegiveis=restringir_elegiveis
+        )
+        historico_ilhas = ga.historico_ilhas
+    else:
+        best_ind, best_val, hist_fit, detalhes_penalidades = ga.algoritmo_genetico(
+            tam_pop, n_gen, pc, pm, tarefas_globais, colaboradores, processos=processos,
+            ref_date=ref_date, elitismo=elitismo, paciencia=paciencia, tempo_limite=tempo_limite,
+            restringir_elegiveis=restringir_elegiveis, caminho_checkpoint=caminho_checkpoint,
+            intervalo_checkpoint=intervalo_checkpoint, retomar=retomar
+        )
+        historico_ilhas = []
+
+    return {
+        "cronograma": data_manager.montar_cronograma(best_ind, tarefas_globais, colaboradores, ref_date),
+        "melhor_solucao": best_ind,
+        "melhor_fitness": best_val,
+        "historico_fitness": hist_fit,
+        "historico_ilhas": historico_ilhas,
+        "penalidades": detalhes_penalidades,
+        "ocorrencias_penalidades": ga.explicar_penalidades(
+            best_ind, tarefas_globais, colaboradores, ref_date
+        ),
+        "estatisticas": ga.estatisticas,
+        "motivo_parada": ga.motivo_parada,
+        "frente_pareto": frente_pareto,
+        "tarefas_replanejadas": getattr(ga, "tarefas_replanejadas", None),
+        "tarefas_globais": tarefas_globais,
+        "colaboradores": colaboradores,
+    }
+
+
+def carregar_plano(caminho: str) -> tuple:
+    """
+    Lê de um resultado.json (ver salvar_resultado) o plano usado no replanejamento.
+
+    :param caminho: Caminho do resultado.json da execução anterior.
+    :return: Tupla (melhor_solucao, tarefas_globais, colaboradores, ref_date) da execução anterior.
+    :raises ValueError: Se o arquivo não contiver o plano (gerado por uma versão anterior).
+    """
+    with open(caminho, "r", encoding="utf-8") as f:
+        resumo = json.load(f)
+    if "plano" not in resumo:
+        raise ValueError(f"{caminho}: o resultado não contém o plano necessário ao replanejamento.")
+    plano = resumo["plano"]
+    return (
+        resumo["melhor_solucao"], plano["tarefas"], plano["colaboradores"],
+        datetime.date.fromisoformat(plano["data_referencia"])
+    )
+
+
+def salvar_resultado(resultado: dict, diretorio: str, parametros: dict):
+    """
+    Grava o resultado de uma execução em 'diretorio':
+    cronograma.csv, historico_fitness.csv, resultado.json (resumo com os parâmetros) e,
+    no modo multiobjetivo, frente_pareto.csv.
+
+    :param resultado: Dicionário retornado por executar.
+    :param diretorio: Diretório de saída (criado se não existir).
+    :param parametros: Parâmetros da execução, registrados no resultado.json.
+    """
+    os.makedirs(diretorio, exist_ok=True)
+
+    resultado["cronograma"].to_csv(os.path.join(diretorio, "cronograma.csv"), index=False)
+    pd.DataFrame({
+        "Geração": range(1, len(resultado["historico_fitness"]) + 1),
+        "Fitness": resultado["historico_fitness"],
+        **{
+            f"Ilha {k}": historico
+            for k, historico in enumerate(resultado["historico_ilhas"], start=1)
+        },
+    }).to_csv(os.path.join(diretorio, "historico_fitness.csv"), index=False)
+
+    if resultado["frente_pareto"]:
+        pd.DataFrame([
+            {
+                "makespan": solucao["makespan"],
+                "restricoes": solucao["restricoes"],
+                "desequilibrio": solucao["desequilibrio"],
+                "fitness": solucao["fitness"],
+                "solucao": json.dumps(solucao["individuo"]),
+            }
+            for solucao in resultado["frente_pareto"]
+        ]).to_csv(os.path.join(diretorio, "frente_pareto.csv"), index=False)
+
+    resumo = {
+        "parametros": parametros,
+        "melhor_fitness": resultado["melhor_fitness"],
+        "melhor_solucao": resultado["melhor_solucao"],
+        "penalidades": resultado["penalidades"],
+        "ocorrencias_penalidades": resultado["ocorrencias_penalidades"],
+        "historico_fitness": resultado["historico_fitness"],
+        "historico_ilhas": resultado["historico_ilhas"],
+        "estatisticas": resultado["estatisticas"],
+        "motivo_parada": resultado["motivo_parada"],
+        "frente_pareto": resultado["frente_pareto"],
+        "tarefas_replanejadas": resultado["tarefas_replanejadas"],
+        "cronograma": resultado["cronograma"].to_dict(orient="records"),
+        # Tarefas e colaboradores desta execução, para replanejar a partir dela (--replanejar)
+        "plano": {
+            "data_referencia": parametros["data_referencia"],
+            "tarefas": [
+                {**tarefa, "habilidades_necessarias": sorted(tarefa["habilidades_necessarias"])}
+                for tarefa in resultado["tarefas_globais"]
+            ],
+            "colaboradores": resultado["colaboradores"],
+        },
+    }
+    with open(os.path.join(diretorio, "resultado.json"), "w") as f:
+        json.dump(resumo, f, ensure_ascii=False, indent=2, default=int)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Executa o Algoritmo Genético de alocação de colaboradores sem a interface."
+    )
+    parser.add_argument("--colaboradores", default="dados/colaboradores.json",
+                        help="Caminho do JSON de colaboradores")
+    parser.add_argument("--projetos", default="dados/projetos.json",
+                        help="Caminho do JSON de projetos")
+    parser.add_argument("--data-referencia", type=datetime.date.fromisoformat,
+                        default=datetime.date(2025, 1, 1),
+                        help="Data de referência (dia 0), no formato AAAA-MM-DD")
+    parser.add_argument("--populacao", type=int, default=20, help="Tamanho da população")
+    parser.add_argument("--geracoes", type=int, default=100, help="Número de gerações")
+    parser.add_argument("--pc", type=float, default=0.7, help="Probabilidade de crossover")
+    parser.add_argument("--pm", type=float, default=0.3, help="Probabilidade de mutação")
+    parser.add_argument("--semente", type=int, default=None, help="Semente do gerador aleatório")
+    parser.add_argument("--processos", type=int, default=1,
+                        help="Quantidade de processos para avaliar a população")
+    parser.add_argument("--ilhas", type=int, default=1,
+                        help="Quantidade de ilhas (subpopulações); acima de 1, usa o modelo de ilhas")
+    parser.add_argument("--intervalo-migracao", type=int, default=10,
+                        help="Gerações entre duas migrações entre ilhas")
+    parser.add_argument("--migrantes", type=int, default=2,
+                        help="Indivíduos enviados por ilha em cada migração")
+    parser.add_argument("--elitismo", type=int, default=1,
+                        help="Melhores indivíduos mantidos de uma geração para a outra")
+    parser.add_argument("--paciencia", type=int, default=None,
+                        help="Encerra após esse número de gerações sem melhora da fitness")
+    parser.add_argument("--tempo-limite", type=float, default=None,
+                        help="Encerra após esse tempo, em segundos")
+    parser.add_argument("--sem-elegibilidade", action="store_true",
+                        help="Sorteia entre todos os colaboradores, e não apenas entre os elegíveis")
+    parser.add_argument("--checkpoint", default=None,
+                        help="Arquivo (.npz) onde o estado da execução é gravado periodicamente")
+    parser.add_argument("--intervalo-checkpoint", type=int, default=10,
+                        help="Gerações entre duas gravações do checkpoint")
+    parser.add_argument("--retomar", action="store_true",
+                        help="Continua a execução a partir do checkpoint, se ele existir")
+    parser.add_argument("--multiobjetivo", action="store_true",
+                        help="Usa o NSGA-II e grava a frente de Pareto (makespan, restrições e "
+                             "desequilíbrio de carga)")
+    parser.add_argument("--replanejar", default=None,
+                        help="resultado.json de uma execução anterior, usado como ponto de partida "
+                             "(replanejamento incremental)")
+    parser.add_argument("--geracoes-locais", type=int, default=None,
+                        help="Gerações em que o replanejamento otimiza apenas as tarefas afetadas")
+    parser.add_argument("--saida", default="resultados",
+                        help="Diretório onde os resultados serão gravados")
+
+    args = parser.parse_args()
+
+    resultado = executar(
+        args.colaboradores, args.projetos, args.data_referencia, args.populacao,
+        args.geracoes, args.pc, args.pm, args.semente, args.processos, args.ilhas,
+        args.intervalo_migracao, args.migrantes, args.elitismo, args.paciencia, args.tempo_limite,
+        not args.sem_elegibilidade, args.checkpoint, args.intervalo_checkpoint, args.retomar,
+        args.multiobjetivo, args.replanejar, args.geracoes_locais
+    )
+    salvar_resultado(resultado, args.saida, {
+        "colaboradores": args.colaboradores,
+        "projetos": args.projetos,
+        "data_referencia": args.data_referencia.isoformat(),
+        "populacao": args.populacao,
+        "geracoes": args.geracoes,
+        "pc": args.pc,
+        "pm": args.pm,
+        "semente": args.semente,
+        "processos": args.processos,
+        "ilhas": args.ilhas,
+        "intervalo_migracao": args.intervalo_migracao,
+        "migrantes": args.migrantes,
+        "elitismo": args.elitismo,
+        "paciencia": args.paciencia,
+        "tempo_limite": args.tempo_limite,
+        "restringir_elegiveis": not args.sem_elegibilidade,
+        "checkpoint": args.checkpoint,
+        "intervalo_checkpoint": args.intervalo_checkpoint,
+        "retomar": args.retomar,
+        "multiobjetivo": args.multiobjetivo,
+        "replanejar": args.replanejar,
+        "geracoes_locais": args.geracoes_locais,
+    })
+
+    print(f"Melhor fitness: {resultado['melhor_fitness']} (parada: {resultado['motivo_parada']})")
+    if resultado["frente_pareto"]:
+        print(f"Frente de Pareto: {len(resultado['frente_pareto'])} soluções")
+    if resultado["tarefas_replanejadas"] is not None:
+        print(f"Tarefas afetadas pelas mudanças: {len(resultado['tarefas_replanejadas'])}")
+    print(f"Resultados gravados em {args.saida}")
@@ -0,0 +1,145 @@
+import argparse
+import datetime
+import json
+import os
+import random
+
+HABILIDADES = [
+    "Análise", "Auditoria", "Python", "Java", "JavaScript", "SQL", "Go", "Docker",
+    "Kubernetes", "AWS", "Testes", "UX", "Scrum", "Segurança", "Dados", "Mobile",
+]
+
+CARGOS = [
+    "Analista de Sistemas", "Dev Backend", "Dev Frontend", "QA", "DevOps",
+    "Cientista de Dados", "Designer", "Gerente de Projetos",
+]
+
+ETAPAS = [
+    "Análise", "Design", "Desenvolvimento", "Integração", "Testes", "Auditoria",
+    "Implantação", "Documentação", "Homologação", "Treinamento",
+]
+
+
+class GeradorInstancias:
+    """
+    Gera instâncias sintéticas do problema de alocação (colaboradores e projetos) no mesmo
+    formato dos arquivos JSON em dados/, para testes de desempenho com tamanhos configuráveis.
+    """
+
+    @staticmethod
+    def gerar(
+            n_colaboradores: int,
+            n_projetos: int,
+            n_etapas: int,
+            densidade_ausencias: float = 0.05,
+            ref_date: datetime.date = datetime.date(2025, 1, 1),
+            horizonte: int = 180,
+            semente: int = None
+    ) -> tuple:
+        """
+        Gera colaboradores e projetos aleatórios.
+
+        A maior parte das etapas exige um cargo e habilidades de algum colaborador existente,
+        para que a instância tenha soluções sem penalidades de habilidade e cargo; as demais
+        são sorteadas livremente.
+
+        :param n_colaboradores: Quantidade de colaboradores.
+        :param n_projetos: Quantidade de projetos.
+        :param n_etapas: Quantidade de etapas de cada projeto.
+        :param densidade_ausencias: Fração dos dias do horizonte em que cada colaborador
+            está ausente.
+        :param ref_date: Data de referência (dia 0) das ausências.
+        :param horizonte: Quantidade de dias, a partir de ref_date, em que as ausências são sorteadas.
+        :param semente: Semente do gerador aleatório (a mesma semente gera a mesma instância).
+        :return: Tupla (colaboradores, projetos), com as ausências no formato AAAA-MM-DD.
+        """
+        aleatorio = random.Random(semente)
+
+        colaboradores = []
+        for i in range(n_colaboradores):
+            dias_ausentes = sorted(aleatorio.sample(
+                range(horizonte), min(horizonte, round(densidade_ausencias * horizonte))
+            ))
+            colaboradores.append({
+                "id": 1000 + i,
+                "nome": f"Colaborador {i + 1}",
+                "habilidades": aleatorio.sample(HABILIDADES, aleatorio.randint(1, 4)),
+                "cargo": aleatorio.choice(CARGOS),
+                "ausencias": [
+                    (ref_date + datetime.timedelta(days=dia)).isoformat() for dia in dias_ausentes
+                ],
+            })
+
+        projetos = []
+        for p in range(n_projetos):
+            etapas = []
+            for e in range(n_etapas):
+                if colaboradores and aleatorio.random() < 0.9:
+                    modelo = aleatorio.choice(colaboradores)
+                    habilidades = aleatorio.sample(
+                        modelo["habilidades"], aleatorio.randint(1, min(2, len(modelo["habilidades"])))
+                    )
+                    cargo = modelo["cargo"]
+                else:
+                    habilidades = aleatorio.sample(HABILIDADES, aleatorio.randint(1, 2))
+                    cargo = aleatorio.choice(CARGOS)
+                etapas.append({
+                    "id": e + 1,
+                    "nome": ETAPAS[e % len(ETAPAS)],
+                    "duracao_dias": aleatorio.randint(1, 10),
+                    "habilidades_necessarias": habilidades,
+                    "cargo_necessario": cargo,
+                })
+            projetos.append({
+                "nome": f"Projeto {p + 1}",
+                "color": f"#{aleatorio.randrange(0x1000000):06X}",
+                "etapas": etapas,
+            })
+
+        return colaboradores, projetos
+
+    @staticmethod
+    def salvar(colaboradores: list, projetos: list, diretorio: str) -> tuple:
+        """
+        Grava a instância em 'diretorio' como colaboradores.json e projetos.json.
+
+        :param colaboradores: Lista de colaboradores (ver GeradorInstancias.gerar).
+        :param projetos: Lista de projetos (ver GeradorInstancias.gerar).
+        :param diretorio: Diretório de saída (criado se não existir).
+        :return: Tupla (caminho_colaboradores, caminho_projetos).
+        """
+        os.makedirs(diretorio, exist_ok=True)
+        caminho_colaboradores = os.path.join(diretorio, "colaboradores.json")
+        caminho_projetos = os.path.join(diretorio, "projetos.json")
+        with open(caminho_colaboradores, "w") as f:
+            json.dump(colaboradores, f, ensure_ascii=False, indent=2)
+        with open(caminho_projetos, "w") as f:
+            json.dump(projetos, f, ensure_ascii=False, indent=2)
+        return caminho_colaboradores, caminho_projetos
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Gera uma instância sintética (colaboradores.json e projetos.json)."
+    )
+    parser.add_argument("--colaboradores", type=int, default=50, help="Quantidade de colaboradores")
+    parser.add_argument("--projetos", type=int, default=20, help="Quantidade de projetos")
+    parser.add_argument("--etapas", type=int, default=5, help="Quantidade de etapas por projeto")
+    parser.add_argument("--densidade-ausencias", type=float, default=0.05,
+                        help="Fração dos dias do horizonte com ausência de cada colaborador")
+    parser.add_argument("--data-referencia", type=datetime.date.fromisoformat,
+                        default=datetime.date(2025, 1, 1),
+                        help="Data de referência (dia 0), no formato AAAA-MM-DD")
+    parser.add_argument("--horizonte", type=int, default=180,
+                        help="Dias, a partir da data de referência, em que as ausências são sorteadas")
+    parser.add_argument("--semente", type=int, default=None, help="Semente do gerador aleatório")
+    parser.add_argument("--saida", default="dados/sintetico", help="Diretório de saída")
+
+    args = parser.parse_args()
+
+    colaboradores, projetos = GeradorInstancias.gerar(
+        args.colaboradores, args.projetos, args.etapas, args.densidade_ausencias,
+        args.data_referencia, args.horizonte, args.semente
+    )
+    caminhos = GeradorInstancias.salvar(colaboradores, projetos, args.saida)
+    print(f"Instância gravada em {', '.join(caminhos)}")
@@ -0,0 +1,209 @@
+import datetime
+import random
+import time
+
+import numpy as np
+from deap import base, creator, tools
+
+from alocacao import GeneticAlgorithm
+from avaliacao import AvaliadorLote
+from problema import ProblemaCompilado
+
+# Três objetivos, todos minimizados: makespan, penalidades de restrição e desequilíbrio de carga
+if not hasattr(creator, "FitnessAlocacao"):
+    creator.create("FitnessAlocacao", base.Fitness, weights=(-1.0, -1.0, -1.0))
+    creator.create("IndividuoAlocacao", list, fitness=creator.FitnessAlocacao)
+
+
+class AlgoritmoMultiobjetivo(GeneticAlgorithm):
+    """
+    Modo multiobjetivo do Algoritmo Genético (NSGA-II, com a ordenação não dominada e a
+    distância de aglomeração do DEAP), que em uma única execução devolve a frente de Pareto
+    entre três objetivos, em vez de combiná-los em uma soma ponderada:
+
+    - makespan: dias até o fim da última tarefa;
+    - restrições: soma das penalidades de habilidades, cargo e ausências;
+    - desequilíbrio de carga: desvio padrão dos dias de trabalho alocados a cada colaborador.
+
+    Os operadores de crossover e mutação são os mesmos do GeneticAlgorithm, e a população é
+    avaliada em lote pelo AvaliadorLote.
+    """
+
+    @staticmethod
+    def objetivos(
+            populacao: list,
+            avaliador: AvaliadorLote,
+            problema: ProblemaCompilado,
+            peso_makespan: int = 200
+    ) -> tuple:
+        """
+        Calcula os três objetivos de cada indivíduo, além da fitness ponderada equivalente
+        à do modo de um único objetivo.
+
+        :param populacao: Lista de indivíduos.
+        :param avaliador: AvaliadorLote construído com peso_makespan=1 (a penalidade de
+            makespan é o próprio makespan, em dias).
+        :param problema: Problema compilado.
+        :param peso_makespan: Peso do makespan na fitness ponderada.
+        :return: Tupla (objetivos, fitnesses, penalidades): para cada indivíduo, a tupla
+            (makespan, restricoes, desequilibrio), a fitness ponderada e o dicionário de
+            penalidades (como em GeneticAlgorithm.pontuar).
+        """
+        matriz = np.asarray(populacao)
+        fitness, penalidades = avaliador.avaliar(matriz)
+        makespan = penalidades["makespan"]
+        restricoes = fitness - makespan
+
+        # Dias de trabalho de cada colaborador (matriz indivíduo x colaborador)
+        tam_pop, num_colab = len(matriz), problema.num_colaboradores
+        idx = avaliador.indices_colaboradores(matriz)
+        posicoes = (np.arange(tam_pop)[:, None] * num_colab + idx).ravel()
+        cargas = np.bincount(
+            posicoes, weights=np.broadcast_to(problema.duracoes, idx.shape).ravel(),
+            minlength=tam_pop * num_colab
+        ).reshape(tam_pop, num_colab)
+        desequilibrio = cargas.std(axis=1)
+
+        penalidades["makespan"] = makespan * peso_makespan
+        fitnesses = (restricoes + penalidades["makespan"]).tolist()
+        objetivos = list(zip(makespan.tolist(), restricoes.tolist(), desequilibrio.round(4).tolist()))
+        penalidades_individuos = [
+            {chave: int(valores[i]) for chave, valores in penalidades.items()}
+            for i in range(tam_pop)
+        ]
+        return objetivos, fitnesses, penalidades_individuos
+
+    def _avaliar_pendentes(self, individuos: list, avaliador: AvaliadorLote, problema: ProblemaCompilado):
+        """
+        Avalia, em um único lote, os indivíduos ainda sem fitness (fitness.valid False).
+        """
+        pendentes = [ind for ind in individuos if not ind.fitness.valid]
+        if not pendentes:
+            return
+        objetivos, fitnesses, penalidades = self.objetivos(pendentes, avaliador, problema)
+        for ind, valores, fitness, penalidade in zip(pendentes, objetivos, fitnesses, penalidades):
+            ind.fitness.values = valores
+            ind.ponderada = (fitness, penalidade)
+        self.estatisticas["avaliacoes"] += len(pendentes)
+
+    @staticmethod
+    def _clonar(individuo):
+        """
+        Cópia de um indivíduo, mantendo a avaliação já calculada.
+        """
+        copia = creator.IndividuoAlocacao(individuo)
+        copia.fitness.values = individuo.fitness.values
+        copia.ponderada = individuo.ponderada
+        return copia
+
+    def algoritmo_genetico_nsga2(
+            self,
+            tam_pop: int,
+            n_gen: int,
+            pc: float,
+            pm: float,
+            tarefas_globais: list,
+            colaboradores: list,
+            ref_date: datetime.date = None,
+            restringir_elegiveis: bool = True,
+            tempo_limite: float = None,
+            ao_progredir=None,
+            cancelamento=None
+    ) -> tuple:
+        """
+        Executa o NSGA-II: a cada geração, os descendentes (torneio por dominância e distância
+        de aglomeração, crossover e mutação) disputam com os pais as vagas da população
+        seguinte, preenchidas pelas frentes não dominadas. As soluções não dominadas de
+        todas as gerações ficam em um arquivo de Pareto.
+
+        :param tam_pop: Tamanho da população (arredondado para um múltiplo de 4, exigido pelo
+            torneio do NSGA-II).
+        :param n_gen: Número de gerações.
+        :param pc: Probabilidade de crossover.
+        :param pm: Probabilidade de mutação.
+        :param tarefas_globais: Lista de todas as tarefas (estrutura do problema).
+        :param colaboradores: Lista de colaboradores com suas habilidades, cargos e ausências.
+        :param ref_date: Data de referência (dia 0) do cronograma.
+        :param restringir_elegiveis: Se True, sorteia apenas colaboradores elegíveis (ver
+            GeneticAlgorithm.algoritmo_genetico).
+        :param tempo_limite: Se informado, encerra a execução após esse tempo (em segundos).
+        :param ao_progredir: Função chamada a cada geração com o progresso da execução
+            (ver GeneticAlgorithm.algoritmo_genetico).
+        :param cancelamento: Sinal de cancelamento, verificado a cada geração.
+        :return: Tupla (melhor_solucao, melhor_fitness, historico_fitness, melhor_penalty) como
+            em algoritmo_genetico, considerando como melhor a solução da frente com a menor
+            fitness ponderada. A frente de Pareto fica em self.frente_pareto: uma lista, ordenada
+            por makespan, de dicionários com individuo, makespan, restricoes, desequilibrio,
+            fitness e penalidades.
+        """
+        inicio = time.perf_counter()
+        self.motivo_parada = "geracoes"
+        self.estatisticas = {"avaliacoes": 0, "reaproveitados_pais": 0}
+        tam_pop = max(4, tam_pop + (-tam_pop) % 4)
+
+        problema = ProblemaCompilado(tarefas_globais, colaboradores)
+        avaliador = AvaliadorLote(problema, peso_makespan=1, ref_date=ref_date)
+        elegiveis = problema.elegiveis() if restringir_elegiveis else None
+        colab_ids = problema.colaborador_ids.tolist()
+
+        pop = [
+            creator.IndividuoAlocacao(ind)
+            for ind in self.populacao_inicial(tam_pop, problema.num_tarefas, colab_ids, elegiveis)
+        ]
+        self._avaliar_pendentes(pop, avaliador, problema)
+        # Atribui a distância de aglomeração, usada no torneio
+        pop = tools.selNSGA2(pop, tam_pop)
+        arquivo = tools.ParetoFront()
+        historico_fitness = []
+
+        for geracao in range(n_gen + 1):
+            arquivo.update(pop)
+            historico_fitness.append(min(ind.ponderada[0] for ind in arquivo))
+            if ao_progredir is not None:
+                self._informar_progresso(
+                    ao_progredir, len(historico_fitness), historico_fitness[-1],
+                    [ind.ponderada[0] for ind in pop], inicio
+                )
+            if geracao == n_gen:
+                break
+            if cancelamento is not None and cancelamento.is_set():
+                self.motivo_parada = "cancelado"
+                break
+            if tempo_limite is not None and time.perf_counter() - inicio >= tempo_limite:
+                self.motivo_parada = "tempo"
+                break
+
+            descendentes = [self._clonar(ind) for ind in tools.selTournamentDCD(pop, tam_pop)]
+            for k in range(0, tam_pop, 2):
+                pai1, pai2 = descendentes[k], descendentes[k + 1]
+                if random.random() < pc:
+                    filho1, filho2 = self.crossover(pai1, pai2)
+                    descendentes[k] = creator.IndividuoAlocacao(filho1)
+                    descendentes[k + 1] = creator.IndividuoAlocacao(filho2)
+                for j in (k, k + 1):
+                    if random.random() < pm:
+                        self.mutacao(descendentes[j], colab_ids, 0.1, elegiveis)
+                        del descendentes[j].fitness.values
+
+            self.estatisticas["reaproveitados_pais"] += sum(ind.fitness.valid for ind in descendentes)
+            self._avaliar_pendentes(descendentes, avaliador, problema)
+            pop = tools.selNSGA2(pop + descendentes, tam_pop)
+
+        # Soluções com os mesmos objetivos são equivalentes: mantém apenas uma de cada
+        unicas = {tuple(ind.fitness.values): ind for ind in reversed(arquivo)}.values()
+        self.frente_pareto = sorted(
+            (
+                {
+                    "individuo": list(ind),
+                    "makespan": int(ind.fitness.values[0]),
+                    "restricoes": int(ind.fitness.values[1]),
+                    "desequilibrio": ind.fitness.values[2],
+                    "fitness": ind.ponderada[0],
+                    "penalidades": ind.ponderada[1],
+                }
+                for ind in unicas
+            ),
+            key=lambda solucao: (solucao["makespan"], solucao["restricoes"], solucao["desequilibrio"])
+        )
+        melhor = min(self.frente_pareto, key=lambda solucao: solucao["fitness"])
+        return melhor["individuo"], melhor["fitness"], historico_fitness, melhor["penalidades"]
@@ -0,0 +1,164 @@
+import hashlib
+
+import numpy as np
+
+
+class ProblemaCompilado:
+    """
+    Representação compacta do problema de alocação, montada uma única vez por execução a partir
+    das tarefas globais e dos colaboradores.
+
+    Habilidades e cargos são convertidos em IDs inteiros; as habilidades de cada tarefa e de cada
+    colaborador ficam em máscaras de bits (uma palavra de 64 bits a cada 64 habilidades).
+    Durações, projetos e a tarefa predecessora de cada tarefa ficam em arrays NumPy, e as
+    matrizes (tarefa x colaborador) de compatibilidade são calculadas com operações de bits.
+    """
+
+    __slots__ = (
+        "habilidades", "cargos", "projetos",
+        "colaborador_ids", "colaborador_nomes", "indice_colaborador",
+        "habilidades_colaborador", "cargo_colaborador", "ausencias",
+        "habilidades_tarefa", "cargo_tarefa", "duracoes", "projeto_tarefa", "predecessora",
+        "compat_habilidades", "compat_cargo",
+    )
+
+    def __init__(self, tarefas_globais: list, colaboradores: list):
+        """
+        :param tarefas_globais: Lista de tarefas globais (estrutura de cada projeto), na ordem
+            em que são escalonadas.
+        :param colaboradores: Lista de colaboradores com habilidades, cargos e ausências
+            (já convertidas em dias).
+        """
+        # Catálogos: nome -> ID inteiro, na ordem em que aparecem
+        self.habilidades = list(dict.fromkeys(
+            [h for c in colaboradores for h in c["habilidades"]]
+            + [h for t in tarefas_globais for h in t["habilidades_necessarias"]]
+        ))
+        self.cargos = list(dict.fromkeys(
+            [c["cargo"] for c in colaboradores] + [t["cargo_necessario"] for t in tarefas_globais]
+        ))
+        self.projetos = list(dict.fromkeys(t["projeto"] for t in tarefas_globais))
+        indice_habilidade = {nome: i for i, nome in enumerate(self.habilidades)}
+        indice_cargo = {nome: i for i, nome in enumerate(self.cargos)}
+        indice_projeto = {nome: i for i, nome in enumerate(self.projetos)}
+        palavras = max(1, -(-len(self.habilidades) // 64))
+
+        # Colaboradores
+        self.colaborador_ids = np.array([c["id"] for c in colaboradores], dtype=np.int64)
+        self.colaborador_nomes = [c["nome"] for c in colaboradores]
+        self.indice_colaborador = {c["id"]: i for i, c in enumerate(colaboradores)}
+        self.habilidades_colaborador = self._mascaras(
+            [c["habilidades"] for c in colaboradores], indice_habilidade, palavras
+        )
+        self.cargo_colaborador = np.array(
+            [indice_cargo[c["cargo"]] for c in colaboradores], dtype=np.int32
+        )
+        self.ausencias = [tuple(sorted(set(c["ausencias"]))) for c in colaboradores]
+
+        # Tarefas
+        self.habilidades_tarefa = self._mascaras(
+            [t["habilidades_necessarias"] for t in tarefas_globais], indice_habilidade, palavras
+        )
+        self.cargo_tarefa = np.array(
+            [indice_cargo[t["cargo_necessario"]] for t in tarefas_globais], dtype=np.int32
+        )
+        self.duracoes = np.array([t["duracao_dias"] for t in tarefas_globais], dtype=np.int64)
+        self.projeto_tarefa = np.array(
+            [indice_projeto[t["projeto"]] for t in tarefas_globais], dtype=np.int64
+        )
+
+        # Predecessora: tarefa anterior do mesmo projeto (-1 na primeira etapa)
+        self.predecessora = np.full(len(tarefas_globais), -1, dtype=np.int64)
+        ultima_do_projeto = {}
+        for i, p in enumerate(self.projeto_tarefa.tolist()):
+            self.predecessora[i] = ultima_do_projeto.get(p, -1)
+            ultima_do_projeto[p] = i
+
+        self._calcular_compatibilidade()
+
+    def _calcular_compatibilidade(self):
+        """
+        Monta as matrizes (tarefa x colaborador) de compatibilidade a partir das máscaras de
+        habilidades e dos IDs de cargo.
+        """
+        faltantes = self.habilidades_tarefa[:, None, :] & ~self.habilidades_colaborador[None, :, :]
+        self.compat_habilidades = ~faltantes.any(axis=2)
+        self.compat_cargo = self.cargo_tarefa[:, None] == self.cargo_colaborador[None, :]
+
+    def __getstate__(self):
+        # As matrizes de compatibilidade são derivadas; não são enviadas aos processos do pool
+        return {
+            nome: getattr(self, nome) for nome in self.__slots__
+            if nome not in ("compat_habilidades", "compat_cargo")
+        }
+
+    def __setstate__(self, estado: dict):
+        for nome, valor in estado.items():
+            setattr(self, nome, valor)
+        self._calcular_compatibilidade()
+
+    @staticmethod
+    def _mascaras(conjuntos: list, indice: dict, palavras: int) -> np.ndarray:
+        """
+        Converte conjuntos de nomes em máscaras de bits (uma linha por conjunto).
+        """
+        mascaras = np.zeros((len(conjuntos), palavras), dtype=np.uint64)
+        for linha, nomes in enumerate(conjuntos):
+            for nome in nomes:
+                bit = indice[nome]
+                mascaras[linha, bit // 64] |= np.uint64(1 << (bit % 64))
+        return mascaras
+
+    @property
+    def num_tarefas(self) -> int:
+        return len(self.duracoes)
+
+    @property
+    def num_colaboradores(self) -> int:
+        return len(self.colaborador_ids)
+
+    @property
+    def num_projetos(self) -> int:
+        return len(self.projetos)
+
+    def assinatura(self) -> str:
+        """
+        Resumo (SHA-256) do conteúdo do problema, usado para verificar se dados salvos em disco
+        (como um checkpoint) pertencem a este mesmo problema.
+        """
+        resumo = hashlib.sha256()
+        for nome in self.__slots__:
+            if nome in ("compat_habilidades", "compat_cargo"):
+                continue
+            valor = getattr(self, nome)
+            if isinstance(valor, np.ndarray):
+                resumo.update(valor.tobytes())
+            else:
+                resumo.update(repr(valor).encode())
+        return resumo.hexdigest()
+
+    def indices(self, individuo: list) -> list:
+        """
+        Converte um indivíduo (IDs de colaboradores) nos índices internos (0..n-1).
+        """
+        return [self.indice_colaborador[cid] for cid in individuo]
+
+    def elegiveis(self) -> list:
+        """
+        Colaboradores elegíveis de cada tarefa: os que possuem todas as habilidades necessárias
+        e o cargo exigido. Se nenhum atende aos dois critérios, usa os que atendem ao cargo,
+        depois os que atendem às habilidades e, por fim, todos os colaboradores.
+
+        :return: Lista, por tarefa, com os IDs dos colaboradores elegíveis (na ordem dos colaboradores).
+        """
+        ids = self.colaborador_ids.tolist()
+        ambos = self.compat_habilidades & self.compat_cargo
+        elegiveis = []
+        for i in range(self.num_tarefas):
+            for candidatos in (ambos[i], self.compat_cargo[i], self.compat_habilidades[i]):
+                if candidatos.any():
+                    elegiveis.append([ids[ci] for ci in np.flatnonzero(candidatos).tolist()])
+                    break
+            else:
+                elegiveis.append(ids)
+        return elegiveis
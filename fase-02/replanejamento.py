@@ -0,0 +1,251 @@
+import datetime
+import itertools
+import random
+import time
+
+from alocacao import GeneticAlgorithm
+from avaliacao import AvaliadorLote, CacheFitness
+from problema import ProblemaCompilado
+
+
+class Replanejador(GeneticAlgorithm):
+    """
+    Replanejamento incremental (warm start): quando as ausências de um colaborador mudam ou
+    um projeto ganha novas etapas, a nova execução parte da melhor solução anterior, em vez
+    de uma população aleatória.
+
+    A solução anterior é mapeada para a nova lista de tarefas (pelo projeto e pelo ID da
+    etapa) e a evolução ocorre em duas fases: primeiro apenas as tarefas afetadas pela mudança
+    são otimizadas, com as demais fixas; depois, a partir da população resultante, todas as
+    tarefas voltam a ser otimizadas com os operadores do GeneticAlgorithm.
+    """
+
+    @staticmethod
+    def chave_tarefa(tarefa: dict) -> tuple:
+        """
+        Identificação de uma tarefa entre execuções: (projeto, ID da etapa).
+        """
+        return tarefa["projeto"], tarefa["task_id"]
+
+    @staticmethod
+    def mapear_solucao(solucao_anterior: list, tarefas_anteriores: list, tarefas_globais: list) -> list:
+        """
+        Mapeia a solução anterior para a nova lista de tarefas.
+
+        :param solucao_anterior: Solução da execução anterior (IDs de colaboradores, um por tarefa).
+        :param tarefas_anteriores: Tarefas globais da execução anterior.
+        :param tarefas_globais: Tarefas globais atuais.
+        :return: Lista com o colaborador anterior de cada tarefa atual (None nas tarefas novas).
+        """
+        anteriores = {
+            Replanejador.chave_tarefa(tarefa): cid
+            for tarefa, cid in zip(tarefas_anteriores, solucao_anterior)
+        }
+        return [anteriores.get(Replanejador.chave_tarefa(tarefa)) for tarefa in tarefas_globais]
+
+    @staticmethod
+    def tarefas_afetadas(
+            solucao_mapeada: list,
+            tarefas_anteriores: list,
+            colaboradores_anteriores: list,
+            tarefas_globais: list,
+            colaboradores: list,
+            deslocamento: int = 0
+    ) -> list:
+        """
+        Identifica as tarefas afetadas pelas mudanças desde a execução anterior: tarefas novas
+        ou com duração, habilidades ou cargo alterados, e tarefas cujo colaborador foi removido
+        ou teve as habilidades, o cargo ou as ausências alterados.
+
+        :param solucao_mapeada: Solução anterior mapeada para as tarefas atuais (ver mapear_solucao).
+        :param tarefas_anteriores: Tarefas globais da execução anterior.
+        :param colaboradores_anteriores: Colaboradores da execução anterior (ausências em dias).
+        :param tarefas_globais: Tarefas globais atuais.
+        :param colaboradores: Colaboradores atuais (ausências em dias).
+        :param deslocamento: Dias entre a data de referência anterior e a atual, para comparar
+            as ausências (convertidas em dias relativos a datas de referência diferentes).
+        :return: Índices das tarefas afetadas, em ordem crescente.
+        """
+        def definicao(tarefa: dict) -> tuple:
+            return (
+                tarefa["duracao_dias"], frozenset(tarefa["habilidades_necessarias"]),
+                tarefa["cargo_necessario"]
+            )
+
+        def perfil(colab: dict, dias: int) -> tuple:
+            return (
+                frozenset(colab["habilidades"]), colab["cargo"],
+                frozenset(dia - dias for dia in colab["ausencias"])
+            )
+
+        definicoes_anteriores = {
+            Replanejador.chave_tarefa(tarefa): definicao(tarefa) for tarefa in tarefas_anteriores
+        }
+        perfis_anteriores = {colab["id"]: perfil(colab, deslocamento) for colab in colaboradores_anteriores}
+        inalterados = {
+            colab["id"] for colab in colaboradores
+            if perfis_anteriores.get(colab["id"]) == perfil(colab, 0)
+        }
+
+        return [
+            i for i, (tarefa, cid) in enumerate(zip(tarefas_globais, solucao_mapeada))
+            if cid not in inalterados
+            or definicoes_anteriores.get(Replanejador.chave_tarefa(tarefa)) != definicao(tarefa)
+        ]
+
+    def replanejar(
+            self,
+            solucao_anterior: list,
+            tarefas_anteriores: list,
+            colaboradores_anteriores: list,
+            tam_pop: int,
+            n_gen: int,
+            pc: float,
+            pm: float,
+            tarefas_globais: list,
+            colaboradores: list,
+            ref_date: datetime.date = None,
+            deslocamento: int = 0,
+            geracoes_locais: int = None,
+            tamanho_cache: int = 10_000,
+            elitismo: int = 1,
+            paciencia: int = None,
+            tempo_limite: float = None,
+            restringir_elegiveis: bool = True,
+            ao_progredir=None,
+            cancelamento=None
+    ) -> tuple:
+        """
+        Replaneja a alocação a partir da solução de uma execução anterior.
+
+        A população inicial é formada pela solução anterior mapeada (com as tarefas novas
+        sorteadas) e por variações dela nas tarefas afetadas. Nas primeiras geracoes_locais
+        gerações, apenas as tarefas afetadas podem mudar de colaborador; nas restantes, todas.
+        O elitismo mantém a melhor solução entre as fases.
+
+        :param solucao_anterior: Solução da execução anterior (IDs de colaboradores, um por tarefa).
+        :param tarefas_anteriores: Tarefas globais da execução anterior.
+        :param colaboradores_anteriores: Colaboradores da execução anterior (ausências em dias).
+        :param tam_pop: Tamanho da população.
+        :param n_gen: Número total de gerações (das duas fases).
+        :param pc: Probabilidade de crossover.
+        :param pm: Probabilidade de mutação.
+        :param tarefas_globais: Tarefas globais atuais.
+        :param colaboradores: Colaboradores atuais, com habilidades, cargos e ausências.
+        :param ref_date: Data de referência (dia 0) do cronograma.
+        :param deslocamento: Dias entre a data de referência anterior e ref_date
+            (ver tarefas_afetadas).
+        :param geracoes_locais: Gerações da fase que otimiza apenas as tarefas afetadas
+            (None usa 10% de n_gen). Sem tarefas afetadas, a fase é pulada.
+        :param tamanho_cache: Capacidade do cache LRU de fitness, compartilhado pelas duas
+            fases (0 desativa).
+        :param elitismo: Melhores indivíduos copiados para a geração seguinte.
+        :param paciencia: Gerações sem melhora que encerram cada fase (None desativa).
+        :param tempo_limite: Tempo máximo de execução das duas fases, em segundos.
+        :param restringir_elegiveis: Se True, sorteia apenas colaboradores elegíveis (ver
+            GeneticAlgorithm.algoritmo_genetico).
+        :param ao_progredir: Função chamada a cada geração com o progresso da execução
+            (ver GeneticAlgorithm.algoritmo_genetico).
+        :param cancelamento: Sinal de cancelamento, verificado a cada geração.
+        :return: Tupla (melhor_solucao, melhor_fitness, historico_fitness, melhor_penalty), como
+            em algoritmo_genetico. Os índices das tarefas afetadas ficam em
+            self.tarefas_replanejadas.
+        """
+        inicio = time.perf_counter()
+        problema = ProblemaCompilado(tarefas_globais, colaboradores)
+        avaliador = AvaliadorLote(problema, ref_date=ref_date)
+        cache = CacheFitness(tamanho_cache) if tamanho_cache > 0 else None
+        colab_ids = problema.colaborador_ids.tolist()
+        num_t = problema.num_tarefas
+        elegiveis = problema.elegiveis() if restringir_elegiveis else None
+        candidatos = elegiveis if elegiveis is not None else [colab_ids] * num_t
+
+        # Solução de partida: colaboradores anteriores, com as tarefas novas e as de
+        # colaboradores removidos (ou que deixaram de ser elegíveis) sorteadas
+        semente = self.mapear_solucao(solucao_anterior, tarefas_anteriores, tarefas_globais)
+        afetadas = self.tarefas_afetadas(
+            semente, tarefas_anteriores, colaboradores_anteriores, tarefas_globais, colaboradores,
+            deslocamento
+        )
+        semente = [
+            cid if cid in problema.indice_colaborador else random.choice(candidatos[i])
+            for i, cid in enumerate(semente)
+        ]
+        if elegiveis is not None:
+            self.reparar(semente, elegiveis)
+        self.tarefas_replanejadas = afetadas
+
+        if geracoes_locais is None:
+            geracoes_locais = n_gen // 10
+        geracoes_locais = min(geracoes_locais, n_gen) if afetadas else 0
+
+        if geracoes_locais:
+            # Fase 1: as tarefas não afetadas têm como único candidato o colaborador anterior
+            conjunto_afetadas = set(afetadas)
+            elegiveis_fase = [
+                candidatos[i] if i in conjunto_afetadas else [cid] for i, cid in enumerate(semente)
+            ]
+            pop = [semente] + self.populacao_inicial(tam_pop - 1, num_t, colab_ids, elegiveis_fase)
+        else:
+            elegiveis_fase = elegiveis
+            pop = [semente] + [
+                self.mutacao(semente[:], colab_ids, 0.1, elegiveis) for _ in range(tam_pop - 1)
+            ]
+        fits, penalties = self.avaliar_populacao(pop, avaliador)
+
+        fases = [(geracoes_locais, elegiveis_fase)] if geracoes_locais else []
+        fases.append((n_gen - geracoes_locais, elegiveis))
+
+        estatisticas = {"avaliacoes": len(pop), "reaproveitados_pais": 0}
+        historico_fitness = []
+        best_sol, best_fit, best_penalty = None, float("inf"), {}
+        for geracoes, elegiveis_fase in fases:
+            restante = None if tempo_limite is None else tempo_limite - (time.perf_counter() - inicio)
+            sol, fit, historico, penalty = self._executar_geracoes(
+                tam_pop, geracoes, pc, pm, problema, avaliador, cache, (pop, fits, penalties),
+                elitismo, paciencia, restante, elegiveis_fase,
+                ao_progredir=self._progresso_acumulado(
+                    ao_progredir, max(len(historico_fitness) - 1, 0), estatisticas["avaliacoes"], inicio
+                ),
+                cancelamento=cancelamento
+            )
+            # A primeira geração de cada fase é a última da fase anterior
+            historico_fitness.extend(historico if not historico_fitness else historico[1:])
+            for chave in ("avaliacoes", "reaproveitados_pais"):
+                estatisticas[chave] += self.estatisticas[chave]
+            if fit < best_fit:
+                best_sol, best_fit, best_penalty = sol, fit, penalty
+            pop, fits, penalties = self.populacao_final
+            if self.motivo_parada in ("cancelado", "tempo"):
+                break
+
+        # Melhor fitness até cada geração (o elitismo pode ser 0)
+        historico_fitness = list(itertools.accumulate(historico_fitness, min))
+        if cache is not None:
+            estatisticas["cache_acertos"] = cache.acertos
+            estatisticas["cache_falhas"] = cache.falhas
+        self.estatisticas = estatisticas
+
+        return best_sol, best_fit, historico_fitness, best_penalty
+
+    def _progresso_acumulado(self, ao_progredir, geracoes_anteriores: int, avaliacoes_anteriores: int,
+                             inicio: float):
+        """
+        Adapta ao_progredir para que a geração, as avaliações e o tempo informados por
+        _executar_geracoes em cada fase sejam contados desde o início do replanejamento.
+        """
+        if ao_progredir is None:
+            return None
+
+        def informar(progresso: dict):
+            tempo = time.perf_counter() - inicio
+            avaliacoes = avaliacoes_anteriores + progresso["avaliacoes"]
+            ao_progredir({
+                **progresso,
+                "geracao": geracoes_anteriores + progresso["geracao"],
+                "avaliacoes": avaliacoes,
+                "avaliacoes_por_segundo": avaliacoes / tempo if tempo > 0 else 0.0,
+                "tempo": tempo,
+            })
+
+        return informar
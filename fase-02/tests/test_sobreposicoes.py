@@ -0,0 +1,54 @@
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from alocacao import GeneticAlgorithm  # noqa: E402
+
+
+def pares_sobrepostos_quadratico(intervalos: list) -> list:
+    """
+    Implementação original (comparação de todos os pares), usada como referência.
+    """
+    pares = []
+    intervals_sorted = sorted(intervalos, key=lambda x: x[0])
+    for i1 in range(len(intervals_sorted)):
+        for i2 in range(i1 + 1, len(intervals_sorted)):
+            s1, e1 = intervals_sorted[i1]
+            s2, e2 = intervals_sorted[i2]
+            if (s1 < e2) and (s2 < e1):
+                pares.append(((s1, e1), (s2, e2)))
+    return pares
+
+
+def intervalos_aleatorios(aleatorio: random.Random) -> list:
+    """
+    Intervalos [inicio, fim) em um horizonte curto, para forçar inícios e fins repetidos,
+    além de intervalos vazios (fim == inicio).
+    """
+    horizonte = aleatorio.randint(1, 30)
+    intervalos = []
+    for _ in range(aleatorio.randint(0, 25)):
+        inicio = aleatorio.randint(0, horizonte)
+        intervalos.append((inicio, inicio + aleatorio.choice([0, 0, 1, 2, 3, aleatorio.randint(0, 15)])))
+    return intervalos
+
+
+def test_sobreposicoes_iguais_a_comparacao_de_pares():
+    aleatorio = random.Random(0)
+    for _ in range(3000):
+        intervalos = intervalos_aleatorios(aleatorio)
+        esperado = pares_sobrepostos_quadratico(intervalos)
+
+        assert GeneticAlgorithm.contar_sobreposicoes(intervalos) == len(esperado), intervalos
+        assert GeneticAlgorithm.pares_sobrepostos(intervalos) == esperado, intervalos
+
+
+def test_sobreposicoes_casos_limite():
+    # Intervalos que apenas se tocam não se sobrepõem
+    assert GeneticAlgorithm.contar_sobreposicoes([(0, 2), (2, 4)]) == 0
+    # Intervalo vazio dentro de outro se sobrepõe; no mesmo início, não
+    assert GeneticAlgorithm.contar_sobreposicoes([(0, 4), (2, 2)]) == 1
+    assert GeneticAlgorithm.contar_sobreposicoes([(2, 4), (2, 2)]) == 0
+    assert GeneticAlgorithm.contar_sobreposicoes([]) == 0
@@ -1,8 +1,16 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
+import faiss
+import hashlib
+import json
 import os
+import sqlite3
+import threading
 import time
-from typing import List, Dict, Any, Tuple, Optional
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Tuple, Optional, Iterator
 from langchain.schema import Document
 from langchain_community.vectorstores import FAISS
 from langchain_core.prompts import ChatPromptTemplate
@@ -16,6 +24,305 @@ EMBEDDING_MODEL = "nomic-embed-text"
 VECTOR_STORE_PATH = "fase-03/vector_store"
 DATA_FILE = "fase-03/data/data-1000.csv"
 SIMILARITY_THRESHOLD = 25  # Limiar de similaridade em porcentagem
+INGESTION_CHUNK_SIZE = 10_000  # Linhas do CSV lidas por vez
+EMBEDDING_BATCH_SIZE = 256  # Textos enviados em cada requisição de embeddings
+EMBEDDING_WORKERS = 4  # Requisições simultâneas ao servidor de embeddings
+EMBEDDING_CACHE_PATH = "fase-03/.cache/embeddings.sqlite"
+
+# Tipos de índice de busca: o Flat (exato) é sempre mantido; os aproximados são construídos
+# a partir dele e gravados ao lado, em index.<tipo>.faiss
+INDEX_TYPES = {
+    "flat": "Flat (exato)",
+    "ivf": "IVF",
+    "hnsw": "HNSW",
+    "ivfpq": "IVF-PQ",
+}
+DEFAULT_NPROBE = 16  # Listas do IVF visitadas por consulta
+DEFAULT_EF_SEARCH = 64  # Tamanho da lista de candidatos do HNSW na busca
+HNSW_M = 32  # Vizinhos por nó do grafo HNSW
+PQ_MAX_SUBQUANTIZERS = 64  # Máximo de subquantizadores (bytes por vetor) do PQ
+ANN_TRAINING_SAMPLE = 100_000  # Vetores usados no treino do quantizador
+
+# Leitura dos índices mapeada em memória, por tipo de índice. Os vetores do Flat e do HNSW
+# são mapeados com IO_FLAG_MMAP_IFC (disponível nas versões mais recentes do FAISS; apenas com
+# IO_FLAG_MMAP eles são copiados para a memória); as listas invertidas do IVF, com
+# IO_FLAG_MMAP. As duas flags juntas não abrem índices IVF.
+FAISS_MMAP_FLAGS = {
+    "flat": getattr(faiss, "IO_FLAG_MMAP_IFC", faiss.IO_FLAG_MMAP) | faiss.IO_FLAG_READ_ONLY,
+    "hnsw": getattr(faiss, "IO_FLAG_MMAP_IFC", faiss.IO_FLAG_MMAP) | faiss.IO_FLAG_READ_ONLY,
+    "ivf": faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY,
+    "ivfpq": faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY,
+}
+
+# Cache das consultas repetidas (ver QueryCache): embeddings e respostas
+QUERY_CACHE_SIZE = 1024  # Entradas mantidas em cada nível
+QUERY_CACHE_TTL = 3600  # Validade de cada entrada, em segundos
+
+
+def write_index_atomic(index: faiss.Index, path: str):
+    """Grava o índice em um arquivo temporário e o move para path.
+
+    Processos com a versão anterior mapeada em memória continuam lendo o arquivo antigo;
+    sobrescrevê-lo no lugar invalidaria as páginas mapeadas.
+    """
+    temporary_path = f"{path}.{os.getpid()}.tmp"
+    faiss.write_index(index, temporary_path)
+    os.replace(temporary_path, path)
+
+
+def content_hash(text: str) -> str:
+    """Hash SHA-256 do conteúdo de um documento, usado como ID no índice e no cache."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def normalize_query(query: str) -> str:
+    """Normaliza a consulta para o cache: sem diferença de maiúsculas e espaços extras."""
+    return " ".join(query.casefold().split())
+
+
+class QueryCache:
+    """Cache em memória com expiração (TTL) e descarte da entrada usada há mais tempo (LRU).
+
+    Usado em dois níveis pelo ProductAssistant: embeddings das consultas e respostas do LLM.
+    """
+
+    def __init__(self, max_size: int = QUERY_CACHE_SIZE, ttl: float = QUERY_CACHE_TTL):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.entries: OrderedDict = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Tuple) -> Optional[Any]:
+        """Valor armazenado em key, ou None se ausente ou expirado."""
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None and time.monotonic() - entry[0] < self.ttl:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            if entry is not None:
+                del self.entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, key: Tuple, value: Any):
+        """Armazena value em key, descartando as entradas mais antigas além de max_size."""
+        with self.lock:
+            self.entries[key] = (time.monotonic(), value)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+
+    @property
+    def hit_rate(self) -> float:
+        """Fração das consultas atendidas pelo cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+@st.cache_resource
+def get_query_caches(
+    embedding_model_name: str, vector_store_path: str
+) -> Tuple[QueryCache, QueryCache]:
+    """Caches de embeddings de consultas e de respostas, compartilhados por todas as sessões
+    do processo que usam o mesmo modelo de embedding e a mesma base de vetores."""
+    return QueryCache(), QueryCache()
+
+
+class EmbeddingCache:
+    """Cache em disco (SQLite) de embeddings, indexado pelo modelo e pelo hash do conteúdo.
+
+    Os vetores são gravados como float32, o mesmo formato usado pelo índice FAISS.
+    A conexão deve ser usada na thread que a abriu (use o cache como gerenciador de contexto).
+    """
+
+    def __init__(self, path: str = EMBEDDING_CACHE_PATH):
+        self.path = path
+
+    def __enter__(self) -> "EmbeddingCache":
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self.connection = sqlite3.connect(self.path)
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            "model TEXT NOT NULL, hash TEXT NOT NULL, vector BLOB NOT NULL, "
+            "PRIMARY KEY (model, hash))"
+        )
+        return self
+
+    def __exit__(self, *exc_info):
+        self.connection.commit()
+        self.connection.close()
+
+    def get_many(self, model: str, hashes: List[str]) -> Dict[str, np.ndarray]:
+        """Retorna os embeddings em cache dos hashes informados."""
+        found = {}
+        # Consultas em blocos, abaixo do limite de parâmetros do SQLite
+        for i in range(0, len(hashes), 500):
+            block = hashes[i : i + 500]
+            rows = self.connection.execute(
+                f"SELECT hash, vector FROM embeddings WHERE model = ? "
+                f"AND hash IN ({', '.join('?' * len(block))})",
+                [model, *block],
+            )
+            for hash_, vector in rows:
+                found[hash_] = np.frombuffer(vector, dtype=np.float32)
+        return found
+
+    def put_many(self, model: str, hashes: List[str], embeddings: List[List[float]]):
+        """Grava os embeddings calculados."""
+        self.connection.executemany(
+            "INSERT OR REPLACE INTO embeddings (model, hash, vector) VALUES (?, ?, ?)",
+            (
+                (model, hash_, np.asarray(embedding, dtype=np.float32).tobytes())
+                for hash_, embedding in zip(hashes, embeddings)
+            ),
+        )
+        self.connection.commit()
+
+
+class MmapVectorStore:
+    """Base de vetores em disco, carregada sem desserializar o conteúdo.
+
+    O índice FAISS (index.faiss) é mapeado em memória (ver FAISS_MMAP_FLAGS): a abertura é
+    imediata e processos diferentes compartilham as mesmas páginas. Os documentos ficam em
+    SQLite (documents.sqlite), indexados pela posição do vetor no índice, e apenas os
+    resultados de cada busca são lidos. Nenhum arquivo é carregado com pickle.
+    """
+
+    INDEX_FILE = "index.faiss"
+    DOCSTORE_FILE = "documents.sqlite"
+
+    def __init__(self, path: str, index: Optional[faiss.Index] = None, mmapped: bool = False):
+        self.path = path
+        self.index = index
+        self.mmapped = mmapped
+        os.makedirs(path, exist_ok=True)
+        # A conexão é compartilhada pelas threads do Streamlit, com acesso serializado
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(
+            os.path.join(path, self.DOCSTORE_FILE), check_same_thread=False
+        )
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS documents ("
+            "position INTEGER PRIMARY KEY, id TEXT NOT NULL, hash TEXT NOT NULL, "
+            "page_content TEXT NOT NULL, metadata TEXT NOT NULL)"
+        )
+
+    @classmethod
+    def exists(cls, path: str) -> bool:
+        """Indica se há uma base neste formato gravada em path."""
+        return os.path.exists(os.path.join(path, cls.INDEX_FILE)) and os.path.exists(
+            os.path.join(path, cls.DOCSTORE_FILE)
+        )
+
+    @classmethod
+    def load(cls, path: str) -> "MmapVectorStore":
+        """Abre a base gravada em path, com o índice mapeado em memória."""
+        index = faiss.read_index(
+            os.path.join(path, cls.INDEX_FILE), FAISS_MMAP_FLAGS["flat"]
+        )
+        return cls(path, index, mmapped=True)
+
+    @classmethod
+    def from_langchain(cls, store: FAISS, path: str) -> "MmapVectorStore":
+        """Converte uma base no formato do LangChain (index.faiss + index.pkl)."""
+        converted = cls(path, store.index)
+        with converted.lock:
+            converted.connection.execute("DELETE FROM documents")
+            converted.connection.executemany(
+                "INSERT INTO documents VALUES (?, ?, ?, ?, ?)",
+                (
+                    (
+                        position,
+                        doc_id,
+                        content_hash(doc.page_content),
+                        doc.page_content,
+                        json.dumps(doc.metadata, ensure_ascii=False),
+                    )
+                    for position, doc_id in store.index_to_docstore_id.items()
+                    for doc in [store.docstore.search(doc_id)]
+                ),
+            )
+        converted.save_local()
+        return converted
+
+    def add_embeddings(
+        self,
+        text_embeddings: List[Tuple[str, List[float]]],
+        metadatas: List[Dict[str, Any]],
+        ids: List[str],
+    ):
+        """Adiciona textos com os embeddings já calculados (gravados em save_local)."""
+        texts = [text for text, _ in text_embeddings]
+        vectors = np.asarray([vector for _, vector in text_embeddings], dtype=np.float32)
+        if self.index is None:
+            self.index = faiss.IndexFlatL2(vectors.shape[1])
+        elif self.mmapped:
+            # O índice mapeado é somente leitura: carrega uma cópia completa para alterá-lo
+            self.index = faiss.read_index(os.path.join(self.path, self.INDEX_FILE))
+            self.mmapped = False
+
+        start = self.index.ntotal
+        self.index.add(vectors)
+        with self.lock:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO documents VALUES (?, ?, ?, ?, ?)",
+                (
+                    (
+                        start + i,
+                        doc_id,
+                        content_hash(text),
+                        text,
+                        json.dumps(metadata, ensure_ascii=False),
+                    )
+                    for i, (doc_id, text, metadata) in enumerate(zip(ids, texts, metadatas))
+                ),
+            )
+
+    def save_local(self):
+        """Grava o índice e confirma os documentos adicionados."""
+        write_index_atomic(self.index, os.path.join(self.path, self.INDEX_FILE))
+        with self.lock:
+            self.connection.commit()
+
+    def hashes(self) -> set:
+        """Hashes do conteúdo de todos os documentos."""
+        with self.lock:
+            return {row[0] for row in self.connection.execute("SELECT hash FROM documents")}
+
+    def get_documents(self, positions: List[int]) -> Dict[int, Document]:
+        """Lê os documentos das posições informadas."""
+        with self.lock:
+            rows = self.connection.execute(
+                f"SELECT position, id, page_content, metadata FROM documents "
+                f"WHERE position IN ({', '.join('?' * len(positions))})",
+                positions,
+            ).fetchall()
+        return {
+            position: Document(id=doc_id, page_content=text, metadata=json.loads(metadata))
+            for position, doc_id, text, metadata in rows
+        }
+
+    def similarity_search_with_score_by_vector(
+        self, embedding: List[float], k: int = 4, index: Optional[faiss.Index] = None
+    ) -> List[Tuple[Document, float]]:
+        """Busca os k documentos mais próximos (distância L2), opcionalmente em outro índice
+        com os vetores na mesma ordem (como os índices aproximados)."""
+        index = self.index if index is None else index
+        distances, positions = index.search(np.asarray([embedding], dtype=np.float32), k)
+        hits = [
+            (int(position), float(distance))
+            for position, distance in zip(positions[0], distances[0])
+            if position >= 0
+        ]
+        documents = self.get_documents([position for position, _ in hits])
+        return [
+            (documents[position], distance)
+            for position, distance in hits
+            if position in documents
+        ]
 
 
 class ProductAssistant:
@@ -25,9 +332,20 @@ class ProductAssistant:
         embedding_model_name: str = EMBEDDING_MODEL,
         vector_store_path: str = VECTOR_STORE_PATH,
         temperature: float = 0.5,
+        embedding_cache_path: str = EMBEDDING_CACHE_PATH,
+        query_embedding_cache: Optional[QueryCache] = None,
+        answer_cache: Optional[QueryCache] = None,
     ):
-        """Inicializa o assistente de produtos com os modelos e configurações especificados."""
+        """Inicializa o assistente de produtos com os modelos e configurações especificados.
+
+        Os caches de consultas, se não informados, são exclusivos deste assistente (ver
+        get_query_caches para compartilhá-los entre sessões).
+        """
         self.vector_store_path = vector_store_path
+        self.llm_model = llm_model
+        self.temperature = temperature
+        self.embedding_cache_path = embedding_cache_path
+        self.embedding_model_name = embedding_model_name
         self.embedding_model = OllamaEmbeddings(model=embedding_model_name)
         self.llm = ChatOpenAI(
             temperature=temperature,
@@ -42,6 +360,18 @@ class ProductAssistant:
             self._load_vector_store() if os.path.exists(vector_store_path) else None
         )
 
+        # Índices aproximados já carregados e parâmetros de busca (ver configure_search)
+        self.ann_indexes: Dict[str, faiss.Index] = {}
+        self.index_type = "flat"
+        self.nprobe = DEFAULT_NPROBE
+        self.ef_search = DEFAULT_EF_SEARCH
+
+        # Consultas repetidas: embedding da consulta e resposta gerada para o mesmo contexto
+        self.query_embedding_cache = (
+            query_embedding_cache if query_embedding_cache is not None else QueryCache()
+        )
+        self.answer_cache = answer_cache if answer_cache is not None else QueryCache()
+
         # Template do prompt
         self.system_prompt = """
         You are a chatbot that answers questions about products on a Market Store.
@@ -68,62 +398,378 @@ class ProductAssistant:
             ]
         )
 
-    def _load_vector_store(self) -> Optional[FAISS]:
-        """Carrega a base de vetores existente."""
+    def _load_vector_store(self) -> Optional[MmapVectorStore]:
+        """Carrega a base de vetores existente.
+
+        Bases no formato anterior (index.pkl do LangChain) são convertidas uma única vez.
+        """
         try:
-            return FAISS.load_local(
+            if MmapVectorStore.exists(self.vector_store_path):
+                return MmapVectorStore.load(self.vector_store_path)
+            if not os.path.exists(os.path.join(self.vector_store_path, "index.pkl")):
+                return None
+            st.info("Convertendo a base de vetores para o formato mapeado em memória...")
+            legacy_store = FAISS.load_local(
                 self.vector_store_path,
                 self.embedding_model,
                 allow_dangerous_deserialization=True,
             )
+            MmapVectorStore.from_langchain(legacy_store, self.vector_store_path)
+            return MmapVectorStore.load(self.vector_store_path)
         except Exception as e:
             st.error(f"Erro ao carregar a base de vetores: {e}")
             return None
 
-    def add_documents_to_vector_store(self, file_path: str) -> bool:
-        """Adiciona documentos ao vetor de armazenamento a partir de um arquivo CSV."""
-        try:
-            df = pd.read_csv(file_path)
-            documents = []
+    @staticmethod
+    def _read_document_chunks(
+        file_path: str, chunk_size: int = INGESTION_CHUNK_SIZE
+    ) -> Iterator[Tuple[List[str], List[Dict[str, str]], float]]:
+        """Lê o CSV em blocos, sem carregá-lo inteiro na memória.
 
+        Gera, para cada bloco, os textos dos documentos, os metadados (todos os valores
+        convertidos para string) e a fração do arquivo já lida.
+        """
+        total_bytes = max(os.path.getsize(file_path), 1)
+        with open(file_path, "rb") as f:
+            for df in pd.read_csv(f, chunksize=chunk_size):
+                # map(str) converte valores ausentes em "nan", como no texto formatado linha a linha
+                texts = (
+                    "Title: " + df["title"].map(str) + " | Content: " + df["content"].map(str)
+                ).tolist()
+                metadatas = df.map(str).to_dict(orient="records")
+                yield texts, metadatas, min(f.tell() / total_bytes, 1.0)
+
+    def _add_embeddings(
+        self,
+        texts: List[str],
+        embeddings: List[List[float]],
+        metadatas: List[Dict[str, str]],
+        ids: List[str],
+    ):
+        """Adiciona ao índice um lote de textos com os embeddings já calculados."""
+        if self.vector_store is None:
+            self.vector_store = MmapVectorStore(self.vector_store_path)
+        self.vector_store.add_embeddings(list(zip(texts, embeddings)), metadatas, ids)
+
+    def _indexed_hashes(self) -> set:
+        """Hashes do conteúdo dos documentos já presentes no índice."""
+        if self.vector_store is None:
+            return set()
+        return self.vector_store.hashes()
+
+    def add_documents_to_vector_store(
+        self,
+        file_path: str,
+        chunk_size: int = INGESTION_CHUNK_SIZE,
+        batch_size: int = EMBEDDING_BATCH_SIZE,
+        max_workers: int = EMBEDDING_WORKERS,
+    ) -> bool:
+        """Adiciona documentos ao vetor de armazenamento a partir de um arquivo CSV.
+
+        O arquivo é lido em blocos de chunk_size linhas, e os embeddings são calculados em
+        lotes de batch_size textos, com até max_workers requisições simultâneas ao servidor
+        de embeddings. Cada lote é adicionado ao índice assim que fica pronto (na ordem do
+        arquivo), e o progresso mostra a vazão de documentos indexados por segundo.
+
+        Documentos cujo conteúdo já está no índice (ou repetido no arquivo) são ignorados, e
+        os embeddings já calculados para o mesmo conteúdo e modelo são lidos do cache em
+        disco (EmbeddingCache), sem nova requisição ao servidor.
+        """
+        try:
             # Barra de progresso do Streamlit
             progress_bar = st.progress(0)
             status_text = st.empty()
 
-            total_rows = len(df)
-            for index, row in df.iterrows():
-                text = f"Title: {row['title']} | Content: {row['content']}"
-                # Converte todos os valores para string para evitar problemas com tipos de dados
-                metadata = {col: str(row[col]) for col in df.columns}
-                documents.append(Document(page_content=text, metadata=metadata))
+            start = time.perf_counter()
+            indexed = skipped = cached = 0
+            known_hashes = self._indexed_hashes()
+            pending = deque()
+
+            with EmbeddingCache(self.embedding_cache_path) as cache, ThreadPoolExecutor(
+                max_workers=max_workers
+            ) as executor:
+
+                def add_next_batch():
+                    nonlocal indexed
+                    future, texts, metadatas, hashes, embeddings, fraction = pending.popleft()
+                    if future is not None:
+                        missing = [h for h in hashes if h not in embeddings]
+                        new_embeddings = future.result()
+                        cache.put_many(self.embedding_model_name, missing, new_embeddings)
+                        embeddings.update(zip(missing, new_embeddings))
+                    self._add_embeddings(
+                        texts, [embeddings[h] for h in hashes], metadatas, hashes
+                    )
+                    indexed += len(texts)
 
-                # Atualiza barra de progresso
-                progress = (index + 1) / total_rows
-                progress_bar.progress(progress)
-                status_text.text(f"Processando documento {index + 1}/{total_rows}")
+                    elapsed = time.perf_counter() - start
+                    progress_bar.progress(fraction)
+                    status_text.text(
+                        f"{indexed} documentos indexados "
+                        f"({indexed / elapsed if elapsed > 0 else 0:.0f} documentos/s), "
+                        f"{cached} do cache, {skipped} já existentes"
+                    )
 
+                for texts, metadatas, fraction in self._read_document_chunks(
+                    file_path, chunk_size
+                ):
+                    # Remove documentos já indexados ou repetidos
+                    new_texts, new_metadatas, new_hashes = [], [], []
+                    for text, metadata in zip(texts, metadatas):
+                        hash_ = content_hash(text)
+                        if hash_ in known_hashes:
+                            skipped += 1
+                            continue
+                        known_hashes.add(hash_)
+                        new_texts.append(text)
+                        new_metadatas.append(metadata)
+                        new_hashes.append(hash_)
+
+                    for i in range(0, len(new_texts), batch_size):
+                        batch_texts = new_texts[i : i + batch_size]
+                        batch_hashes = new_hashes[i : i + batch_size]
+                        embeddings = cache.get_many(self.embedding_model_name, batch_hashes)
+                        cached += len(embeddings)
+                        missing_texts = [
+                            text
+                            for text, hash_ in zip(batch_texts, batch_hashes)
+                            if hash_ not in embeddings
+                        ]
+                        future = (
+                            executor.submit(self.embedding_model.embed_documents, missing_texts)
+                            if missing_texts
+                            else None
+                        )
+                        pending.append(
+                            (
+                                future,
+                                batch_texts,
+                                new_metadatas[i : i + batch_size],
+                                batch_hashes,
+                                embeddings,
+                                fraction,
+                            )
+                        )
+                        # Limita os lotes em memória, mantendo o servidor ocupado
+                        while len(pending) > 2 * max_workers:
+                            add_next_batch()
+                while pending:
+                    add_next_batch()
+
+            if self.vector_store is None or self.vector_store.index is None:
+                st.warning(f"Nenhum documento encontrado em {file_path}.")
+                status_text.empty()
+                progress_bar.empty()
+                return False
+
+            if indexed:
+                self.vector_store.save_local()
+            elapsed = time.perf_counter() - start
             status_text.text(
-                f"Criando índice de vetores para {len(documents)} documentos..."
+                f"Base de vetores salva em {self.vector_store_path} "
+                f"({indexed} documentos novos, {skipped} já existentes, em {elapsed:.1f} s)"
             )
+            time.sleep(1)  # Permite que o usuário veja a mensagem
+            status_text.empty()
+            progress_bar.empty()
+            return True
+        except Exception as e:
+            st.error(f"Erro ao adicionar documentos: {e}")
+            return False
+
+    def _ann_index_path(self, index_type: str) -> str:
+        return os.path.join(self.vector_store_path, f"index.{index_type}.faiss")
+
+    @staticmethod
+    def create_ann_index(
+        dimension: int, index_type: str, n_vectors: int, nlist: Optional[int] = None
+    ) -> faiss.Index:
+        """Cria um índice aproximado vazio (distância L2, como o índice Flat).
+
+        Para IVF e IVF-PQ, nlist (quantidade de listas) padrão é 4 * sqrt(n_vectors), limitado
+        para que cada lista tenha ao menos 39 vetores de treino. O PQ usa o maior divisor da
+        dimensão que não ultrapassa PQ_MAX_SUBQUANTIZERS, com 8 bits por subquantizador.
+        """
+        if index_type == "hnsw":
+            return faiss.IndexHNSWFlat(dimension, HNSW_M)
+
+        if nlist is None:
+            nlist = int(4 * np.sqrt(n_vectors))
+        nlist = max(1, min(nlist, n_vectors // 39))
+        quantizer = faiss.IndexFlatL2(dimension)
+        if index_type == "ivf":
+            return faiss.IndexIVFFlat(quantizer, dimension, nlist)
+        if index_type == "ivfpq":
+            m = max(
+                m for m in range(1, min(dimension, PQ_MAX_SUBQUANTIZERS) + 1)
+                if dimension % m == 0
+            )
+            return faiss.IndexIVFPQ(quantizer, dimension, nlist, m, 8)
+        raise ValueError(f"Tipo de índice desconhecido: {index_type}")
+
+    def build_ann_index(
+        self, index_type: str, nlist: Optional[int] = None, batch_size: int = 100_000
+    ) -> bool:
+        """Constrói e grava o índice aproximado a partir dos vetores do índice Flat.
+
+        Os vetores são adicionados na mesma ordem do índice Flat, de modo que o índice
+        aproximado compartilha os documentos (docstore) da base de vetores.
+        """
+        if self.vector_store is None:
+            st.warning(
+                "Base de vetores não encontrada. Por favor, adicione documentos primeiro."
+            )
+            return False
+        try:
+            flat = self.vector_store.index
+            total = flat.ntotal
+            index = self.create_ann_index(flat.d, index_type, total, nlist)
 
-            # Cria ou atualiza o vetor de armazenamento
-            if self.vector_store is None:
-                self.vector_store = FAISS.from_documents(
-                    documents, self.embedding_model
+            progress_bar = st.progress(0)
+            status_text = st.empty()
+            start = time.perf_counter()
+
+            if not index.is_trained:
+                status_text.text("Treinando o quantizador...")
+                rng = np.random.default_rng(0)
+                sample = np.sort(
+                    rng.choice(total, min(total, ANN_TRAINING_SAMPLE), replace=False)
                 )
-            else:
-                self.vector_store.add_documents(documents)
+                index.train(flat.reconstruct_batch(sample))
+
+            for i in range(0, total, batch_size):
+                n = min(batch_size, total - i)
+                index.add(flat.reconstruct_n(i, n))
+                progress_bar.progress((i + n) / total)
+                status_text.text(f"{i + n}/{total} vetores adicionados ao índice")
 
-            self.vector_store.save_local(self.vector_store_path)
-            status_text.text(f"Base de vetores salva em {self.vector_store_path}")
+            write_index_atomic(index, self._ann_index_path(index_type))
+            self.ann_indexes[index_type] = index
+            status_text.text(
+                f"Índice {INDEX_TYPES[index_type]} construído em "
+                f"{time.perf_counter() - start:.1f} s"
+            )
             time.sleep(1)  # Permite que o usuário veja a mensagem
             status_text.empty()
             progress_bar.empty()
             return True
         except Exception as e:
-            st.error(f"Erro ao adicionar documentos: {e}")
+            st.error(f"Erro ao construir o índice: {e}")
             return False
 
+    def _get_ann_index(self, index_type: str) -> Optional[faiss.Index]:
+        """Índice aproximado do tipo informado, lido do disco na primeira vez.
+
+        Retorna None se o índice não foi construído ou se está desatualizado (com uma
+        quantidade de vetores diferente da base, após novos documentos).
+        """
+        if self.vector_store is None:
+            return None
+        index = self.ann_indexes.get(index_type)
+        if index is None and os.path.exists(self._ann_index_path(index_type)):
+            try:
+                index = faiss.read_index(
+                    self._ann_index_path(index_type), FAISS_MMAP_FLAGS[index_type]
+                )
+            except RuntimeError as e:
+                st.error(f"Erro ao carregar o índice {INDEX_TYPES[index_type]}: {e}")
+                return None
+            self.ann_indexes[index_type] = index
+        if index is None or index.ntotal != self.vector_store.index.ntotal:
+            return None
+        return index
+
+    def _apply_search_params(self, index: faiss.Index):
+        """Aplica nprobe (IVF) e efSearch (HNSW) ao índice."""
+        if isinstance(index, faiss.IndexHNSW):
+            index.hnsw.efSearch = self.ef_search
+        else:
+            faiss.extract_index_ivf(index).nprobe = self.nprobe
+
+    def configure_search(
+        self,
+        index_type: str,
+        nprobe: int = DEFAULT_NPROBE,
+        ef_search: int = DEFAULT_EF_SEARCH,
+    ) -> bool:
+        """Define o índice e os parâmetros usados nas buscas.
+
+        Retorna False se o índice aproximado ainda não foi construído (ou está desatualizado);
+        nesse caso, as buscas usam o índice Flat.
+        """
+        self.index_type = index_type
+        self.nprobe = nprobe
+        self.ef_search = ef_search
+        return index_type == "flat" or self._get_ann_index(index_type) is not None
+
+    def _search_index(self) -> faiss.Index:
+        """Índice usado nas buscas: o aproximado selecionado, se construído, ou o Flat."""
+        index = (
+            None if self.index_type == "flat" else self._get_ann_index(self.index_type)
+        )
+        if index is None:
+            return self.vector_store.index
+        self._apply_search_params(index)
+        return index
+
+    def evaluate_recall(
+        self, k: int = 10, n_queries: int = 200
+    ) -> Optional[Dict[str, float]]:
+        """Compara o índice aproximado atual com o Flat (exato).
+
+        As consultas não são vetores da base, o que inflaria o recall: cada um dos n_queries
+        vetores sorteados é deslocado em uma direção aleatória por metade da distância até o
+        seu vizinho mais próximo, e o vetor de origem é retirado dos resultados dos dois
+        índices, como se a consulta fosse feita contra uma cópia da base sem ele. Retorna o
+        recall@k (fração dos k vizinhos exatos encontrados), a latência média por consulta
+        de cada índice (ms) e o tamanho em disco de cada índice (MB).
+        """
+        flat = self.vector_store.index if self.vector_store is not None else None
+        index = (
+            None if self.index_type == "flat" else self._get_ann_index(self.index_type)
+        )
+        if flat is None or index is None or flat.ntotal < 2:
+            return None
+
+        self._apply_search_params(index)
+        rng = np.random.default_rng(0)
+        sample = np.sort(rng.choice(flat.ntotal, min(flat.ntotal, n_queries), replace=False))
+        vectors = flat.reconstruct_batch(sample)
+
+        # Vizinho mais próximo de cada vetor sorteado, fora ele mesmo
+        _, neighbors = flat.search(vectors, 2)
+        nearest = np.where(neighbors[:, 0] == sample, neighbors[:, 1], neighbors[:, 0])
+        distances = np.linalg.norm(flat.reconstruct_batch(nearest) - vectors, axis=1)
+        directions = rng.standard_normal(vectors.shape).astype(np.float32)
+        directions /= np.linalg.norm(directions, axis=1, keepdims=True)
+        queries = vectors + 0.5 * distances[:, None] * directions
+
+        # Busca um vizinho a mais, para descontar o vetor de origem
+        k = min(k, flat.ntotal - 1)
+        results = {}
+        for name, searched in (("flat", flat), ("ann", index)):
+            start = time.perf_counter()
+            _, ids = searched.search(queries, k + 1)
+            results[f"{name}_ms"] = (time.perf_counter() - start) * 1000 / len(queries)
+            results[name] = [
+                row[(row >= 0) & (row != origin)][:k] for row, origin in zip(ids, sample)
+            ]
+
+        hits = sum(
+            len(set(exact) & set(approx))
+            for exact, approx in zip(results["flat"], results["ann"])
+        )
+        return {
+            "recall": hits / (len(queries) * k),
+            "flat_ms": results["flat_ms"],
+            "ann_ms": results["ann_ms"],
+            "flat_mb": os.path.getsize(
+                os.path.join(self.vector_store_path, MmapVectorStore.INDEX_FILE)
+            )
+            / 2**20,
+            "ann_mb": os.path.getsize(self._ann_index_path(self.index_type)) / 2**20,
+        }
+
     def retrieve_relevant_documents(
         self, query: str, k: int = 5
     ) -> List[Tuple[Document, float]]:
@@ -134,9 +780,13 @@ class ProductAssistant:
             )
             return []
 
-        query_embedding = self.embedding_model.embed_query(query)
+        cache_key = (self.embedding_model_name, normalize_query(query))
+        query_embedding = self.query_embedding_cache.get(cache_key)
+        if query_embedding is None:
+            query_embedding = self.embedding_model.embed_query(query)
+            self.query_embedding_cache.put(cache_key, query_embedding)
         return self.vector_store.similarity_search_with_score_by_vector(
-            query_embedding, k=k
+            query_embedding, k=k, index=self._search_index()
         )
 
     def answer_query(
@@ -159,6 +809,7 @@ class ProductAssistant:
             )
 
         docs_content = []
+        docs_ids = []
         docs_info = []
 
         for doc, score in retrieved_docs_and_scores:
@@ -175,10 +826,22 @@ class ProductAssistant:
 
             if similarity > threshold:
                 docs_content.append(doc.page_content)
+                docs_ids.append(doc.id)
 
         if not docs_content:
             return "Não temos informações sobre esse produto.", docs_info
 
+        # Mesma consulta, com o mesmo contexto e o mesmo modelo: reaproveita a resposta
+        cache_key = (
+            normalize_query(user_prompt),
+            tuple(docs_ids),
+            self.llm_model,
+            self.temperature,
+        )
+        cached_response = self.answer_cache.get(cache_key)
+        if cached_response is not None:
+            return cached_response, docs_info
+
         # Prepara o contexto e gera a resposta
         docs_content_str = "\n".join(docs_content)
         chain = self.prompt_template | self.llm | StrOutputParser()
@@ -188,6 +851,7 @@ class ProductAssistant:
                 response = chain.invoke(
                     {"context": docs_content_str, "user_prompt": user_prompt}
                 )
+            self.answer_cache.put(cache_key, response)
             return response, docs_info
         except Exception as e:
             st.error(f"Erro ao gerar resposta: {e}")
@@ -268,14 +932,35 @@ with st.sidebar:
 
     data_file = st.text_input("Arquivo de Dados CSV", value=DATA_FILE)
 
+    embedding_batch_size = st.number_input(
+        "Lote de Embeddings",
+        min_value=1,
+        max_value=4096,
+        value=EMBEDDING_BATCH_SIZE,
+        help="Quantidade de documentos enviados em cada requisição ao servidor de embeddings.",
+    )
+
+    embedding_workers = st.number_input(
+        "Requisições Simultâneas",
+        min_value=1,
+        max_value=32,
+        value=EMBEDDING_WORKERS,
+        help="Quantidade de lotes de embeddings calculados em paralelo.",
+    )
+
     # Botão para inicializar/reinicializar o assistente
     if st.button("Inicializar Assistente"):
         with st.spinner("Inicializando assistente..."):
+            query_embedding_cache, answer_cache = get_query_caches(
+                embedding_model, vector_store_path
+            )
             st.session_state.assistant = ProductAssistant(
                 llm_model=llm_model,
                 embedding_model_name=embedding_model,
                 vector_store_path=vector_store_path,
                 temperature=temperature,
+                query_embedding_cache=query_embedding_cache,
+                answer_cache=answer_cache,
             )
             st.success("Assistente inicializado com sucesso!")
 
@@ -286,7 +971,9 @@ with st.sidebar:
         elif os.path.exists(data_file):
             with st.spinner(f"Processando arquivo {data_file}..."):
                 success = st.session_state.assistant.add_documents_to_vector_store(
-                    data_file
+                    data_file,
+                    batch_size=embedding_batch_size,
+                    max_workers=embedding_workers,
                 )
                 if success:
                     st.success(f"Dados do arquivo {data_file} processados com sucesso!")
@@ -295,6 +982,70 @@ with st.sidebar:
         else:
             st.error(f"Arquivo {data_file} não encontrado!")
 
+    # Índice de busca
+    st.subheader("Índice de Busca")
+
+    index_type = st.selectbox(
+        "Tipo de Índice",
+        list(INDEX_TYPES),
+        format_func=INDEX_TYPES.get,
+        help="Flat faz a busca exata; IVF, HNSW e IVF-PQ são aproximados, mais rápidos "
+        "(e, no caso do IVF-PQ, menores) em bases grandes. Construa o índice após processar os dados.",
+    )
+
+    nprobe = st.slider(
+        "nprobe (IVF)",
+        min_value=1,
+        max_value=256,
+        value=DEFAULT_NPROBE,
+        disabled=index_type not in ("ivf", "ivfpq"),
+        help="Listas visitadas por consulta: valores maiores aumentam o recall e a latência.",
+    )
+
+    ef_search = st.slider(
+        "efSearch (HNSW)",
+        min_value=16,
+        max_value=512,
+        value=DEFAULT_EF_SEARCH,
+        step=16,
+        disabled=index_type != "hnsw",
+        help="Candidatos examinados por consulta: valores maiores aumentam o recall e a latência.",
+    )
+
+    if st.session_state.assistant is not None:
+        index_ready = st.session_state.assistant.configure_search(
+            index_type, nprobe, ef_search
+        )
+
+        if index_type != "flat":
+            if not index_ready:
+                st.info("Índice não construído ou desatualizado; as buscas usam o Flat.")
+
+            if st.button("Construir Índice"):
+                with st.spinner(f"Construindo o índice {INDEX_TYPES[index_type]}..."):
+                    if st.session_state.assistant.build_ann_index(index_type):
+                        st.success("Índice construído com sucesso!")
+
+            if st.button("Avaliar Recall@k", disabled=not index_ready):
+                report = st.session_state.assistant.evaluate_recall(k=top_k)
+                if report is not None:
+                    st.metric(f"Recall@{top_k}", f"{report['recall']:.1%}")
+                    st.metric(
+                        "Latência por consulta",
+                        f"{report['ann_ms']:.2f} ms",
+                        f"{report['ann_ms'] - report['flat_ms']:+.2f} ms vs Flat",
+                        delta_color="inverse",
+                    )
+                    st.metric(
+                        "Tamanho do índice",
+                        f"{report['ann_mb']:.1f} MB",
+                        f"{report['ann_mb'] - report['flat_mb']:+.1f} MB vs Flat",
+                        delta_color="inverse",
+                    )
+
+    # Taxas de acerto do cache, preenchidas após a consulta atual (fim do script)
+    cache_stats = st.empty()
+
     # Botão para limpar o histórico
     if st.button("Limpar Histórico"):
         st.session_state.chat_history = []
@@ -369,3 +1120,19 @@ if user_query:
                         st.json(doc["metadata"])
             else:
                 st.info("Nenhum documento relevante foi encontrado.")
+
+# Taxas de acerto do cache de consultas
+if st.session_state.assistant is not None:
+    with cache_stats.container():
+        st.subheader("Cache de Consultas")
+        st.caption("Compartilhado por todas as sessões com o mesmo modelo e a mesma base.")
+        for label, cache in (
+            ("Embeddings de consultas", st.session_state.assistant.query_embedding_cache),
+            ("Respostas", st.session_state.assistant.answer_cache),
+        ):
+            st.metric(
+                label,
+                f"{cache.hit_rate:.0%}",
+                f"{cache.hits} de {cache.hits + cache.misses} consultas",
+                delta_color="off",
+            )
@@ -0,0 +1,86 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from rag import INDEX_TYPES, MmapVectorStore, ProductAssistant  # noqa: E402
+
+DIMENSION = 16
+N_VECTORS = 3000
+
+
+@pytest.fixture
+def vector_store_path(tmp_path):
+    """Base com vetores aleatórios, gravada no formato do MmapVectorStore."""
+    vectors = np.random.default_rng(0).random((N_VECTORS, DIMENSION), dtype=np.float32)
+    store = MmapVectorStore(str(tmp_path))
+    store.add_embeddings(
+        [(f"doc {i}", vector.tolist()) for i, vector in enumerate(vectors)],
+        [{"i": i} for i in range(N_VECTORS)],
+        [f"id{i}" for i in range(N_VECTORS)],
+    )
+    store.save_local()
+    return str(tmp_path)
+
+
+@pytest.mark.parametrize("index_type", [t for t in INDEX_TYPES if t != "flat"])
+def test_ann_index_reloads_in_fresh_assistant(vector_store_path, index_type):
+    assert ProductAssistant(vector_store_path=vector_store_path).build_ann_index(index_type)
+
+    # Nova sessão: o índice é lido do disco, mapeado em memória
+    assistant = ProductAssistant(vector_store_path=vector_store_path)
+    assert assistant.configure_search(index_type, nprobe=256, ef_search=256)
+    index = assistant._search_index()
+    assert index is not assistant.vector_store.index
+    assert index.ntotal == N_VECTORS
+
+    query = assistant.vector_store.index.reconstruct(0)
+    results = assistant.vector_store.similarity_search_with_score_by_vector(
+        query, k=5, index=index
+    )
+    assert len(results) == 5
+    if index_type != "ivfpq":  # O PQ é aproximado também nas distâncias
+        assert results[0][0].id == "id0"
+
+
+def test_rebuild_keeps_mapped_index_of_other_sessions(vector_store_path):
+    ProductAssistant(vector_store_path=vector_store_path).build_ann_index("hnsw")
+    reader = ProductAssistant(vector_store_path=vector_store_path)
+    assert reader.configure_search("hnsw")
+    query = reader.vector_store.index.reconstruct(0)
+    before = reader.vector_store.similarity_search_with_score_by_vector(
+        query, k=5, index=reader._search_index()
+    )
+
+    # Outra sessão adiciona documentos e reconstrói o índice
+    writer = ProductAssistant(vector_store_path=vector_store_path)
+    vectors = np.random.default_rng(1).random((N_VECTORS, DIMENSION), dtype=np.float32)
+    writer.vector_store.add_embeddings(
+        [(f"novo {i}", vector.tolist()) for i, vector in enumerate(vectors)],
+        [{"i": i} for i in range(N_VECTORS)],
+        [f"novo{i}" for i in range(N_VECTORS)],
+    )
+    writer.vector_store.save_local()
+    assert writer.build_ann_index("hnsw")
+
+    # A sessão anterior continua buscando na versão que tinha mapeado
+    after = reader.vector_store.similarity_search_with_score_by_vector(
+        query, k=5, index=reader._search_index()
+    )
+    assert [doc.id for doc, _ in after] == [doc.id for doc, _ in before]
+
+
+def test_recall_uses_held_out_queries(vector_store_path):
+    assistant = ProductAssistant(vector_store_path=vector_store_path)
+    assert assistant.build_ann_index("ivf")
+    assistant.configure_search("ivf", nprobe=4096)
+
+    # Visitando todas as listas o IVF é exato: o recall só é 1 se o vetor de origem de cada
+    # consulta for descontado igualmente dos dois índices
+    assert assistant.evaluate_recall(k=10)["recall"] == 1.0
+
+    assistant.configure_search("ivf", nprobe=1)
+    assert assistant.evaluate_recall(k=10)["recall"] < 1.0